@@ -0,0 +1,41 @@
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any
+
+import pytest
+
+# number of awaited calls per benchmark round, amortises the event loop overhead
+BATCH = 100
+
+BenchmarkAsync = Callable[[Callable[[], Awaitable[Any]]], None]
+
+
+@pytest.fixture(scope="session")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def benchmark_async(benchmark: Any, loop: asyncio.AbstractEventLoop) -> BenchmarkAsync:
+    """Benchmark an async callable, every round awaits it `BATCH` times."""
+
+    def run(func: Callable[[], Awaitable[Any]]) -> None:
+        async def batch() -> None:
+            for _ in range(BATCH):
+                await func()
+
+        benchmark.extra_info["batch"] = BATCH
+        benchmark(lambda: loop.run_until_complete(batch()))
+
+    return run
+
+
+def env_url(name: str) -> str:
+    """Return the URL of a local backend stand-in, skipping the benchmark if not configured."""
+    url = os.environ.get(name)
+    if not url:
+        pytest.skip(f"{name} is not set")
+    return url
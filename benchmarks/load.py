@@ -0,0 +1,99 @@
+"""End-to-end load scenario: the in-memory example app served by uvicorn, driven by httpx.
+
+Usage:
+    python -m benchmarks.load --requests 5000 --concurrency 50 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from typing import Any
+
+import httpx
+import uvicorn
+
+PATHS = ("/", "/date", "/pydantic_instance", "/cache_response_obj_typed")
+
+
+def start_server(port: int) -> tuple[uvicorn.Server, threading.Thread]:
+    config = uvicorn.Config("examples.in_memory.main:app", port=port, log_level="warning", lifespan="on")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+async def run_load(base_url: str, path: str, requests: int, concurrency: int) -> dict[str, Any]:
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    queue: asyncio.Queue[None] = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(base_url=base_url) as client:
+
+        async def worker() -> None:
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                cache_status = response.headers.get("X-FastAPI-Cache", "NONE")
+                statuses[cache_status] = statuses.get(cache_status, 0) + 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "rps": requests / elapsed,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000,
+            "p50": quantiles[49] * 1000,
+            "p95": quantiles[94] * 1000,
+            "p99": quantiles[98] * 1000,
+            "max": max(latencies) * 1000,
+        },
+        "cache_status": statuses,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per path")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    server, thread = start_server(args.port)
+    try:
+        results = [
+            asyncio.run(run_load(f"http://127.0.0.1:{args.port}", path, args.requests, args.concurrency))
+            for path in PATHS
+        ]
+    finally:
+        server.should_exit = True
+        thread.join()
+
+    report = {"python": sys.version, "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import itertools
+import os
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import BenchmarkAsync, env_url
+from fastapi_cache import Backend
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+VALUE = os.urandom(1024)
+
+
+async def redis_backend() -> AsyncGenerator[Backend, None]:
+    from redis.asyncio import Redis
+
+    from fastapi_cache.backends.redis import RedisBackend
+
+    redis = Redis.from_url(env_url("FASTAPI_CACHE_BENCH_REDIS_URL"))
+    yield RedisBackend(redis)
+    await redis.connection_pool.disconnect()
+
+
+async def memcached_backend() -> AsyncGenerator[Backend, None]:
+    from aiomcache import Client
+
+    from fastapi_cache.backends.memcached import MemcachedBackend
+
+    host, _, port = env_url("FASTAPI_CACHE_BENCH_MEMCACHED").partition(":")
+    client = Client(host, int(port or 11211))
+    yield MemcachedBackend(client)
+    await client.close()
+
+
+async def inmemory_backend() -> AsyncGenerator[Backend, None]:
+    yield InMemoryBackend()
+
+
+BACKENDS: dict[str, Callable[[], AsyncGenerator[Backend, None]]] = {
+    "inmemory": inmemory_backend,
+    "redis": redis_backend,
+    "memcached": memcached_backend,
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest, loop: Any) -> Any:
+    generator = BACKENDS[request.param]()
+    yield loop.run_until_complete(anext(generator))
+    loop.run_until_complete(anext(generator, None))
+
+
+def test_set(benchmark_async: BenchmarkAsync, backend: Backend) -> None:
+    counter = itertools.count()
+    benchmark_async(lambda: backend.set(f"fcache:bench:set:{next(counter)}", VALUE, 60))
+
+
+def test_get_hit(benchmark_async: BenchmarkAsync, backend: Backend, loop: Any) -> None:
+    loop.run_until_complete(backend.set("fcache:bench:get", VALUE, 60))
+    benchmark_async(lambda: backend.get_with_ttl("fcache:bench:get"))
+
+
+def test_get_miss(benchmark_async: BenchmarkAsync, backend: Backend) -> None:
+    benchmark_async(lambda: backend.get_with_ttl("fcache:bench:missing"))
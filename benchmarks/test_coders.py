@@ -0,0 +1,50 @@
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from fastapi_cache.coder import Coder, JsonCoder, PickleCoder
+
+
+class Record(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    score: float
+
+
+PAYLOADS: dict[str, tuple[Any, Any]] = {
+    "scalar": (42, None),
+    "small_dict": ({"hello": "world", "count": 3}, None),
+    "int_list": (list(range(10_000)), list[int]),
+    "records": (
+        [{"id": i, "name": f"name-{i}", "tags": ["a", "b"], "score": i / 3} for i in range(1_000)],
+        None,
+    ),
+    "pydantic_records": (
+        [Record(id=i, name=f"name-{i}", tags=["a", "b"], score=i / 3) for i in range(1_000)],
+        list[Record],
+    ),
+    "large_string": ("x" * 1_000_000, str),
+}
+
+
+@pytest.mark.parametrize("coder", [JsonCoder, PickleCoder])
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_encode(benchmark: Any, coder: type[Coder], payload: str) -> None:
+    value, _ = PAYLOADS[payload]
+    benchmark.group = f"encode:{payload}"
+    benchmark(coder.encode, value)
+
+
+@pytest.mark.parametrize("coder", [JsonCoder, PickleCoder])
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_decode(benchmark: Any, coder: type[Coder], payload: str) -> None:
+    value, type_ = PAYLOADS[payload]
+    if coder is PickleCoder:
+        # pickle restores the original types, conversion only matters for JSON
+        type_ = None
+    encoded = coder.encode(value)
+    benchmark.group = f"decode:{payload}"
+    benchmark.extra_info["size"] = len(encoded)
+    benchmark(coder.decode_as_type, encoded, type_=type_)
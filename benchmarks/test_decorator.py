@@ -0,0 +1,38 @@
+import itertools
+from typing import Any
+
+from benchmarks.conftest import BenchmarkAsync
+from fastapi_cache import default_key_builder
+from fastapi_cache.decorator import cache
+
+
+async def compute(value: int) -> dict[str, int]:
+    return {"value": value}
+
+
+def test_uncached_call(benchmark_async: BenchmarkAsync) -> None:
+    """Baseline: the undecorated function."""
+    benchmark_async(lambda: compute(1))
+
+
+def test_hit(benchmark_async: BenchmarkAsync) -> None:
+    cached = cache(namespace="bench-hit", expire=60)(compute)
+    benchmark_async(lambda: cached(1))
+
+
+def test_miss(benchmark_async: BenchmarkAsync) -> None:
+    cached = cache(namespace="bench-miss", expire=60)(compute)
+    counter = itertools.count()
+    benchmark_async(lambda: cached(next(counter)))
+
+
+def test_miss_with_lock(benchmark_async: BenchmarkAsync) -> None:
+    """Misses taking the lock around the computation, hits don't lock."""
+    cached = cache(namespace="bench-lock", expire=60, with_lock=True)(compute)
+    counter = itertools.count()
+    benchmark_async(lambda: cached(next(counter)))
+
+
+def test_default_key_builder(benchmark: Any) -> None:
+    kwargs = {"user_id": 42, "filters": {"status": "active", "tags": ["a", "b", "c"]}, "page": 3}
+    benchmark(default_key_builder, compute, "fcache:bench", args=(1, "two"), kwargs=kwargs)
@@ -18,7 +18,7 @@ def anyio_backend() -> str:
 
 @pytest.fixture(autouse=True)
 def _init_cache() -> Generator[None, None, None]:  # pyright: ignore[reportUnusedFunction]
-    FastAPICache.init(InMemoryBackend())
+    FastAPICache.init(InMemoryBackend(), stamp_values=True)
     yield
     FastAPICache.reset()
 
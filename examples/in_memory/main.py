@@ -8,11 +8,12 @@ import uvicorn
 from fastapi import FastAPI
 from pydantic import BaseModel
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from fastapi_cache import FastAPICache, get_cache_ctx
 from fastapi_cache.backends.inmemory import InMemoryBackend
 from fastapi_cache.decorator import cache
+from fastapi_cache.middleware import RequestMemoMiddleware
 
 
 @asynccontextmanager
@@ -22,6 +23,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(RequestMemoMiddleware)
 
 ret = 0
 
@@ -86,6 +88,17 @@ async def cache_response_obj_typed() -> JSONResponse:
     return JSONResponse({"a": 1})
 
 
+@app.get("/cache_response_obj_full")
+@cache(namespace="test", expire=5)
+async def cache_response_obj_full() -> Response:
+    return Response(
+        "<item>1</item>",
+        status_code=201,
+        media_type="application/xml",
+        headers={"X-Item-Version": "3"},
+    )
+
+
 class SomeClass:
     def __init__(self, value):
         self.value = value
@@ -173,6 +186,23 @@ async def cached_with_ctx(update_expire: bool = True):
     return {"value": put_ret5}
 
 
+stream_ret = 0
+
+
+@app.get("/stream")
+@cache(namespace="test", expire=5)
+async def stream():
+    global stream_ret
+    stream_ret = stream_ret + 1
+
+    async def rows():
+        yield "id,value\n"
+        for i in range(1000):
+            yield f"{i},{stream_ret}\n"
+
+    return StreamingResponse(rows(), media_type="text/csv", headers={"Content-Disposition": "attachment"})
+
+
 @app.get("/namespaced_injection")
 @cache(namespace="test", expire=5, injected_dependency_namespace="monty_python")  # pyright: ignore[reportArgumentType]
 def namespaced_injection(__fastapi_cache_request: int = 42, __fastapi_cache_response: int = 17) -> dict[str, int]:
@@ -3,41 +3,70 @@ from typing import ClassVar
 
 from fastapi_cache.coder import Coder, JsonCoder
 from fastapi_cache.context import get_cache_ctx
-from fastapi_cache.key_builder import default_key_builder
+from fastapi_cache.executor import CacheExecutor
+from fastapi_cache.hotkeys import HotKeys
+from fastapi_cache.instrumentation import Instrumentation
+from fastapi_cache.key_builder import default_key_builder, request_body_digest
+from fastapi_cache.ttl import TTLPolicy
 from fastapi_cache.types import Backend, KeyBuilder
+from fastapi_cache.warmup import Warmer
 
 __version__ = version("fastapi-cache2-fork")
 __all__ = [
     "Backend",
+    "CacheExecutor",
     "Coder",
     "FastAPICache",
+    "HotKeys",
+    "Instrumentation",
     "JsonCoder",
     "KeyBuilder",
+    "Warmer",
     "default_key_builder",
     "get_cache_ctx",
+    "request_body_digest",
 ]
 
 
 class FastAPICache:
+    """Cache configuration, set with `init`.
+
+    The class itself is the default instance. Additional named instances, each with its own backend
+    and settings, are returned by `instance` and selected with `@cache(cache=name)`.
+    """
+
+    _instances: ClassVar[dict[str, type["FastAPICache"]]] = {}
+    name: ClassVar[str | None] = None
     _backend: ClassVar[Backend | None] = None
     _prefix: ClassVar[str | None] = None
-    _expire: ClassVar[int | None] = None
+    _expire: ClassVar[int | TTLPolicy | None] = None
     _init: ClassVar[bool] = False
     _coder: ClassVar[type[Coder] | None] = None
     _key_builder: ClassVar[KeyBuilder | None] = None
     _cache_status_header: ClassVar[str | None] = None
     _enable: ClassVar[bool] = True
+    _instrumentation: ClassVar[Instrumentation | None] = None
+    _warmer: ClassVar[Warmer | None] = None
+    _hot_keys: ClassVar[HotKeys | None] = None
+    _executor: ClassVar[CacheExecutor | None] = None
+    _stamp_values: ClassVar[bool] = False
+    _generation: ClassVar[int] = 0
 
     @classmethod
     def init(
         cls,
         backend: Backend,
         prefix: str = "fcache",
-        expire: int | None = None,
+        expire: int | TTLPolicy | None = None,
         coder: type[Coder] = JsonCoder,
         key_builder: KeyBuilder = default_key_builder,
         cache_status_header: str = "X-FastAPI-Cache",
         enable: bool = True,
+        instrumentation: Instrumentation | None = None,
+        warmer: Warmer | None = None,
+        hot_keys: HotKeys | None = None,
+        executor: CacheExecutor | None = None,
+        stamp_values: bool = False,
     ) -> None:
         if cls._init:
             return
@@ -49,6 +78,12 @@ class FastAPICache:
         cls._key_builder = key_builder
         cls._cache_status_header = cache_status_header
         cls._enable = enable
+        cls._instrumentation = instrumentation
+        cls._warmer = warmer
+        cls._hot_keys = hot_keys
+        cls._executor = executor
+        cls._stamp_values = stamp_values
+        cls._generation += 1
 
     @classmethod
     def reset(cls) -> None:
@@ -60,6 +95,34 @@ class FastAPICache:
         cls._key_builder = None
         cls._cache_status_header = None
         cls._enable = True
+        cls._instrumentation = None
+        cls._warmer = None
+        cls._hot_keys = None
+        cls._executor = None
+        cls._stamp_values = False
+        cls._generation += 1
+
+    @classmethod
+    def instance(cls, name: str | None = None) -> type["FastAPICache"]:
+        """Get the cache instance called `name`, creating it on first use, `None` is the default instance.
+
+        Usage:
+            >> FastAPICache.instance("reports").init(RedisBackend(redis), prefix="reports")
+            >> @cache(cache="reports")
+        """
+        if name is None:
+            return FastAPICache
+        try:
+            return FastAPICache._instances[name]
+        except KeyError:
+
+            class Instance(FastAPICache):
+                pass
+
+            Instance.__name__ = Instance.__qualname__ = f"FastAPICache[{name}]"
+            Instance.name = name
+            Instance.reset()
+            return FastAPICache._instances.setdefault(name, Instance)
 
     @classmethod
     def get_backend(cls) -> Backend:
@@ -74,7 +137,7 @@ class FastAPICache:
         return cls._prefix
 
     @classmethod
-    def get_expire(cls) -> int | None:
+    def get_expire(cls) -> int | TTLPolicy | None:
         return cls._expire
 
     @classmethod
@@ -99,6 +162,32 @@ class FastAPICache:
     def get_enable(cls) -> bool:
         return cls._enable
 
+    @classmethod
+    def get_instrumentation(cls) -> Instrumentation | None:
+        return cls._instrumentation
+
+    @classmethod
+    def get_warmer(cls) -> Warmer | None:
+        return cls._warmer
+
+    @classmethod
+    def get_hot_keys(cls) -> HotKeys | None:
+        return cls._hot_keys
+
+    @classmethod
+    def get_executor(cls) -> CacheExecutor | None:
+        return cls._executor
+
+    @classmethod
+    def get_stamp_values(cls) -> bool:
+        """Whether values are stored with their write time, which releases before 2.3.0 can't read."""
+        return cls._stamp_values
+
+    @classmethod
+    def get_generation(cls) -> int:
+        """Incremented by `init` and `reset`, cached functions read the settings again when it changes."""
+        return cls._generation
+
     @classmethod
     async def clear(cls, namespace: str | None = None, key: str | None = None) -> int:
         if not cls._backend or cls._prefix is None:
@@ -106,3 +195,17 @@ class FastAPICache:
 
         namespace = cls._prefix + (":" + namespace if namespace else "")
         return await cls._backend.clear(namespace, key)
+
+    @classmethod
+    def get_tag(cls, tag: str) -> str:
+        """Prefix a tag, so that applications sharing a backend don't invalidate each other."""
+        return f"{cls.get_prefix()}:{tag}"
+
+    @classmethod
+    async def invalidate_tags(cls, *tags: str) -> int:
+        """Remove every cached value tagged with any of the given tags.
+
+        Returns:
+            Number of invalidated values, when the backend can tell.
+        """
+        return await cls.get_backend().invalidate_tags([cls.get_tag(tag) for tag in tags])
@@ -1,7 +1,7 @@
-from fastapi_cache.backends import inmemory
+from fastapi_cache.backends import breaker, disk, inmemory
 from fastapi_cache.types import Backend
 
-__all__ = ["Backend", "inmemory"]
+__all__ = ["Backend", "breaker", "disk", "inmemory"]
 
 # import each backend in turn and add to __all__. This syntax
 # is explicitly supported by type checkers, while more dynamic
@@ -20,6 +20,13 @@ except ImportError:
 else:
     __all__ += ["memcached"]
 
+try:
+    from fastapi_cache.backends import shared
+except ImportError:
+    pass
+else:
+    __all__ += ["shared"]
+
 try:
     from fastapi_cache.backends import redis
 except ImportError:
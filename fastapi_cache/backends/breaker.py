@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Awaitable, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, TypeVar
+
+from fastapi_cache.instrumentation import Instrumentation
+from fastapi_cache.types import Backend
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """The wrapped backend is considered unavailable and was not called."""
+
+
+class CircuitBreakerBackend(Backend):
+    """
+    Wraps a backend with a latency budget and a circuit breaker
+
+    Every `get_with_ttl`, `get` and `set` call must complete within `timeout` seconds. After
+    `failure_threshold` consecutive failures or timeouts the circuit opens: the backend reports
+    itself unavailable and the `cache` decorator calls the function directly, without touching the
+    backend. After `recovery_time` seconds the circuit is half open and lets `half_open_calls`
+    probes through, closing again on the first success and reopening on a failure. Calls beyond
+    the probes raise `CircuitOpenError`, which the `cache` decorator treats as a miss without
+    logging it.
+
+    Usage:
+        >> backend = CircuitBreakerBackend(RedisBackend(redis), timeout=0.05, name="redis")
+        >> FastAPICache.init(backend)
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        timeout: float | None = 0.1,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        half_open_calls: int = 1,
+        name: str = "default",
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Args:
+            backend: backend to protect.
+            timeout: latency budget of a single operation in seconds, `None` disables it.
+            failure_threshold: consecutive failures opening the circuit.
+            recovery_time: seconds the circuit stays open before probing the backend again.
+            half_open_calls: concurrent probes allowed while half open.
+            name: name of the breaker in metrics.
+            instrumentation: receives breaker state changes.
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_calls = half_open_calls
+        self.name = name
+        self.instrumentation = instrumentation
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        if self.instrumentation:
+            self.instrumentation.on_breaker_state(self.name, state)
+
+    def _half_open_if_recovered(self) -> None:
+        """Let probes through once the circuit has been open for `recovery_time` seconds."""
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.recovery_time:
+            self._transition(HALF_OPEN)
+
+    @property
+    def available(self) -> bool:
+        """Whether a call would be let through now, the state of the circuit is left as is."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self._opened_at < self.recovery_time:
+            return False
+        return self._probes < self.half_open_calls
+
+    def _success(self) -> None:
+        self.failures = 0
+        self._transition(CLOSED)
+
+    def _failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    async def _call(self, operation: Awaitable[T]) -> T:
+        self._half_open_if_recovered()
+        if not self.available:
+            if asyncio.iscoroutine(operation):
+                operation.close()
+            raise CircuitOpenError(self.name)
+        half_open = self.state == HALF_OPEN
+        if half_open:
+            self._probes += 1
+        try:
+            async with asyncio.timeout(self.timeout):
+                result = await operation
+        except Exception:
+            self._failure()
+            raise
+        else:
+            self._success()
+            return result
+        finally:
+            if half_open:
+                self._probes -= 1
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        return await self._call(self.backend.get_with_ttl(key))
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._call(self.backend.get(key))
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        await self._call(self.backend.set(key, value, expire))
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return await self._call(self.backend.get_many(keys))
+
+    async def set_many(self, items: Mapping[str, bytes], expire: int | None = None) -> None:
+        await self._call(self.backend.set_many(items, expire))
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        await self._call(self.backend.set_with_tags(key, value, tags, expire))
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        return await self.backend.invalidate_tags(tags)
+
+    @asynccontextmanager
+    async def _lock(self, key: str, timeout: int) -> AsyncGenerator[Any, None]:
+        # waiting on the lock may legitimately take long, so only errors count against the breaker
+        lock = self.backend.lock(key, timeout)
+        try:
+            acquired = await lock.__aenter__()
+        except Exception:
+            self._failure()
+            raise
+        try:
+            yield acquired
+        except BaseException as e:
+            if not await lock.__aexit__(type(e), e, e.__traceback__):
+                raise
+        else:
+            await lock.__aexit__(None, None, None)
+
+    def lock(self, key: str, timeout: int) -> AbstractAsyncContextManager[Any]:
+        self._half_open_if_recovered()
+        if not self.available:
+            return super().lock(key, timeout)
+        return self._lock(key, timeout)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        return await self.backend.clear(namespace, key)
@@ -0,0 +1,206 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from fastapi_cache.types import Backend
+
+T = TypeVar("T")
+
+SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL,
+    written REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_written ON cache (written);
+-- total size of the values, kept by triggers so that every process sharing the file sees it
+CREATE TABLE IF NOT EXISTS cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_size (id, size) SELECT 0, coalesce(sum(size), 0) FROM cache;
+CREATE TRIGGER IF NOT EXISTS cache_insert AFTER INSERT ON cache BEGIN
+    UPDATE cache_size SET size = size + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_update AFTER UPDATE OF size ON cache BEGIN
+    UPDATE cache_size SET size = size + new.size - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_delete AFTER DELETE ON cache BEGIN
+    UPDATE cache_size SET size = size - old.size;
+END;
+COMMIT;
+"""
+
+
+def _namespace_range(namespace: str) -> tuple[str, str]:
+    """Bounds of the keys starting with `namespace`, for a range scan of the primary key."""
+    return namespace, namespace[:-1] + chr(ord(namespace[-1]) + 1)
+
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
+    """Run the statements of the block in a write transaction, so that their reads stay accurate."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class DiskBackend(Backend):
+    """
+    Persistent backend storing values in a local SQLite database
+
+    Meant for large, long-lived values that are too big for Redis memory and too expensive to
+    recompute: entries survive restarts, so warm caches persist across deploys. The database is
+    in WAL mode, so several worker processes can share it, and reads are served through SQLite
+    memory mapping (`mmap_size`). All disk I/O runs in a dedicated thread pool of `threads` threads.
+
+    Once the values exceed `max_size` bytes, expired entries and then the oldest ones are removed
+    until the total drops below 90% of it, and the freed pages are returned to the file system. The
+    total is kept in the database by triggers and read in the write transaction, so it accounts for
+    the writes of every process.
+
+    Usage:
+        >> FastAPICache.init(DiskBackend("/var/cache/app/cache.db", max_size=10 * 1024**3))
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 1024**3,
+        mmap_size: int | None = None,
+        threads: int = 4,
+    ) -> None:
+        """
+        Args:
+            path: database file, created if missing.
+            max_size: size in bytes of the stored values above which entries are evicted.
+            mmap_size: bytes of the database file to memory-map for reads, defaults to `max_size`.
+            threads: size of the thread pool running disk I/O.
+        """
+        self.path = str(path)
+        self.max_size = max_size
+        self.mmap_size = max_size if mmap_size is None else mmap_size
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="fastapi-cache-disk")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            # must be set before the first table is created to take effect
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get(self, key: str) -> tuple[int, bytes | None]:
+        row = self._connection().execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return 0, None
+        value, expires = row
+        if expires is None:
+            return -1, value
+        ttl = expires - time.time()
+        return (int(ttl), value) if ttl > 0 else (0, None)
+
+    def _size(self) -> int:
+        """Total size of the stored values."""
+        size: int = self._connection().execute("SELECT size FROM cache_size").fetchone()[0]
+        return size
+
+    def _set(self, key: str, value: bytes, expire: int | None) -> None:
+        now = time.time()
+        with _transaction(self._connection()) as connection:
+            # an upsert fires the update trigger, a replace would delete the row without firing any
+            connection.execute(
+                """
+                INSERT INTO cache (key, value, size, expires, written) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value, size = excluded.size, expires = excluded.expires, written = excluded.written
+                """,
+                (key, value, len(value), now + expire if expire else None, now),
+            )
+            size = connection.execute("SELECT size FROM cache_size").fetchone()[0]
+        if size > self.max_size:
+            self._compact()
+
+    def _compact(self) -> None:
+        target = self.max_size * 0.9
+        with _transaction(self._connection()) as connection:
+            connection.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+            # recount, the total drifts while processes of releases without the triggers share the file
+            size = connection.execute("SELECT total(size) FROM cache").fetchone()[0]
+            connection.execute("UPDATE cache_size SET size = ?", (int(size),))
+            if size > target:
+                # remove the oldest entries until their running total covers the excess
+                connection.execute(
+                    """
+                    DELETE FROM cache WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, size, sum(size) OVER (ORDER BY written ROWS UNBOUNDED PRECEDING) AS running
+                            FROM cache
+                        ) WHERE running - size < ?
+                    )
+                    """,
+                    (size - target,),
+                )
+        self._connection().execute("PRAGMA incremental_vacuum")
+
+    def _clear(self, namespace: str | None, key: str | None) -> int:
+        params: tuple[str, ...]
+        if namespace:
+            params = _namespace_range(namespace)
+            delete = "DELETE FROM cache WHERE key >= ? AND key < ?"
+        elif key:
+            params = (key,)
+            delete = "DELETE FROM cache WHERE key = ?"
+        else:
+            return 0
+        return self._connection().execute(delete, params).rowcount
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        return await self._run(self._get, key)
+
+    async def get(self, key: str) -> bytes | None:
+        return (await self._run(self._get, key))[1]
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        await self._run(self._set, key, value, expire)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        return await self._run(self._clear, namespace, key)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
@@ -1,13 +1,26 @@
+import asyncio
 import datetime
-from typing import TYPE_CHECKING
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
 from aiobotocore.session import AioSession, get_session
 
+from fastapi_cache.helpers import chunking
 from fastapi_cache.types import Backend
 
 if TYPE_CHECKING:
     from types_aiobotocore_dynamodb import DynamoDBClient
 
+# DynamoDB limits for a single BatchGetItem / BatchWriteItem request
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+TAG_SUFFIX = "::tag"
+
+
+def _chunks(items: Sequence[Any], size: int) -> list[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
 
 class DynamoBackend(Backend):
     """
@@ -18,6 +31,22 @@ class DynamoBackend(Backend):
     using the `ttl` key. Dynamo will take care of deleting outdated objects, but this is not
     instant so don't be alarmed when they linger around for a bit.
 
+    Every item also stores the first two `:` segments of its key, the prefix and the namespace of
+    the decorator, in the `namespace` attribute. If the table has a global secondary index with
+    `namespace` as its partition key, pass its name as `namespace_index` and namespace clears will
+    `Query` that index for the keys starting with the namespace, which include nested namespaces
+    and entries derived from the keys (chunks, streamed bodies, request bodies). Clearing a
+    single-segment namespace, e.g. `FastAPICache.clear()` or a table without index, runs a
+    parallel segmented `Scan` instead.
+
+    Values larger than `max_item_size` are split into chunk items that are written before a
+    manifest item stored under the key itself, so readers never see a partially written value.
+    The chunks of the previous value are deleted when it is replaced or deleted.
+
+    Tagging a value writes one item per tag (`<tag>::tag:<key>`), expiring with the value, in the
+    `<tag>::tag` namespace. Invalidating a tag clears that namespace and the values it references,
+    so it `Query`s the namespace index too, or scans the table without one.
+
     As with all AWS clients, credentials will be taken from the environment. Check the AWS SDK
     for more information.
 
@@ -31,10 +60,39 @@ class DynamoBackend(Backend):
     table_name: str
     region: str | None
 
-    def __init__(self, table_name: str, region: str | None = None) -> None:
+    def __init__(
+        self,
+        table_name: str,
+        region: str | None = None,
+        endpoint_url: str | None = None,
+        consistent_read: bool = False,
+        namespace_index: str | None = None,
+        scan_segments: int = 4,
+        max_retries: int = 5,
+        max_item_size: int = 350_000,
+    ) -> None:
+        """Initialize DynamoDB backend.
+
+        Args:
+            table_name: name of the cache table.
+            region: AWS region of the table.
+            endpoint_url: custom endpoint, e.g. DynamoDB Local or a moto server.
+            consistent_read: whether reads should be strongly consistent.
+            namespace_index: name of a global secondary index keyed by `namespace`.
+            scan_segments: number of parallel segments used to scan the table on namespace clear.
+            max_retries: how many times unprocessed batch items are retried.
+            max_item_size: values larger than this are stored as several chunk items, should stay
+                below the 400 KB DynamoDB item size limit.
+        """
         self.session: AioSession = get_session()
         self.table_name = table_name
         self.region = region
+        self.endpoint_url = endpoint_url
+        self.consistent_read = consistent_read
+        self.namespace_index = namespace_index
+        self.scan_segments = scan_segments
+        self.max_retries = max_retries
+        self.max_item_size = max_item_size
         self._client: DynamoDBClient | None = None
 
     @property
@@ -47,50 +105,246 @@ class DynamoBackend(Backend):
         self._client = await self.session.create_client(  # pyright: ignore[reportUnknownMemberType]
             "dynamodb",
             region_name=self.region,
+            endpoint_url=self.endpoint_url,
         ).__aenter__()
 
     async def close(self) -> None:
         await self.client.__aexit__(None, None, None)
         self._client = None
 
-    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
-        response = await self.client.get_item(TableName=self.table_name, Key={"key": {"S": key}})
+    @staticmethod
+    def _namespace(key: str) -> str:
+        """Partition of the key in the namespace index, the prefix and the namespace of the decorator."""
+        return ":".join(key.split(":", 2)[:2])
 
-        if "Item" in response:
-            value = response["Item"].get("value", {}).get("B")
-            ttl = response["Item"].get("ttl", {}).get("N")
+    @staticmethod
+    def _parse_item(item: Mapping[str, Any] | None) -> tuple[int, bytes | None]:
+        if item is None:
+            return 0, None
 
-            if not ttl:
-                return -1, value
+        value = item.get("value", {}).get("B")
+        ttl = item.get("ttl", {}).get("N")
 
-            # It's only eventually consistent so we need to check ourselves
-            expire = int(ttl) - int(datetime.datetime.now().timestamp())
-            if expire > 0:
-                return expire, value
+        if not ttl:
+            return -1, value
 
+        # It's only eventually consistent so we need to check ourselves
+        expire = int(ttl) - int(datetime.datetime.now().timestamp())
+        if expire > 0:
+            return expire, value
         return 0, None
 
-    async def get(self, key: str) -> bytes | None:
-        response = await self.client.get_item(TableName=self.table_name, Key={"key": {"S": key}})
-        if "Item" in response:
-            return response["Item"].get("value", {}).get("B")
-        return None
-
-    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+    def _build_item(self, key: str, value: bytes, expire: int | None) -> dict[str, Any]:
         ttl = (
             {"ttl": {"N": str(int((datetime.datetime.now() + datetime.timedelta(seconds=expire)).timestamp()))}}
             if expire
             else {}
         )
+        return {
+            "key": {"S": key},
+            "value": {"B": value},
+            "namespace": {"S": self._namespace(key)},
+            **ttl,
+        }
+
+    async def _get_item(self, key: str) -> Mapping[str, Any] | None:
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"key": {"S": key}},
+            ConsistentRead=self.consistent_read,
+            ProjectionExpression="#v, #t",
+            ExpressionAttributeNames={"#v": "value", "#t": "ttl"},
+        )
+        return response.get("Item")
+
+    async def _backoff(self, attempt: int) -> None:
+        if attempt >= self.max_retries:
+            raise RuntimeError(f"DynamoDB batch request still has unprocessed items after {attempt} retries")
+        await asyncio.sleep(0.05 * 2**attempt)
+
+    @staticmethod
+    def _chunk_key(key: str, manifest: chunking.Manifest, index: int) -> str:
+        return f"{key}::chunk:{manifest.write_id}:{index}"
+
+    async def _read_chunks(self, key: str, ttl: int, value: bytes | None) -> tuple[int, bytes | None]:
+        if value is None or (manifest := chunking.decode_manifest(value)) is None:
+            return ttl, value
+        chunks = await self.get_many([self._chunk_key(key, manifest, i) for i in range(manifest.chunks)])
+        value = chunking.join(manifest, chunks)
+        return (ttl, value) if value is not None else (0, None)
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        return await self._read_chunks(key, *self._parse_item(await self._get_item(key)))
+
+    async def get(self, key: str) -> bytes | None:
+        return (await self.get_with_ttl(key))[1]
 
-        await self.client.put_item(
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        if len(value) > self.max_item_size:
+            manifest, chunks = chunking.split(value, self.max_item_size)
+            items = [
+                self._build_item(self._chunk_key(key, manifest, i), chunk, expire) for i, chunk in enumerate(chunks)
+            ]
+            await self._batch_write([{"PutRequest": {"Item": item}} for item in items])
+            value = chunking.encode_manifest(manifest)
+        response = await self.client.put_item(
             TableName=self.table_name,
-            Item={
-                "key": {"S": key},
-                "value": {"B": value},
-                **ttl,
-            },
+            Item=self._build_item(key, value, expire),
+            ReturnValues="ALL_OLD",
         )
+        await self._delete_chunks(key, response.get("Attributes"))
+
+    async def _delete_chunks(self, key: str, item: Mapping[str, Any] | None) -> None:
+        """Delete the chunks of a replaced or deleted item if it was a manifest."""
+        value = self._parse_item(item)[1]
+        if value is not None and (manifest := chunking.decode_manifest(value)) is not None:
+            await self._delete_keys([self._chunk_key(key, manifest, i) for i in range(manifest.chunks)])
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        items: dict[str, Mapping[str, Any]] = {}
+        for chunk in _chunks(list(dict.fromkeys(keys)), BATCH_GET_LIMIT):
+            request: dict[str, Any] = {
+                self.table_name: {
+                    "Keys": [{"key": {"S": key}} for key in chunk],
+                    "ConsistentRead": self.consistent_read,
+                    "ProjectionExpression": "#k, #v, #t",
+                    "ExpressionAttributeNames": {"#k": "key", "#v": "value", "#t": "ttl"},
+                },
+            }
+            attempt = 0
+            while request:
+                response = await self.client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    items[item["key"]["S"]] = item
+                request = response.get("UnprocessedKeys") or {}
+                if request:
+                    await self._backoff(attempt)
+                    attempt += 1
+        return [self._parse_item(items.get(key))[1] for key in keys]
+
+    async def _batch_write(self, requests: Sequence[dict[str, Any]]) -> None:
+        for chunk in _chunks(requests, BATCH_WRITE_LIMIT):
+            pending: dict[str, Any] = {self.table_name: list(chunk)}
+            attempt = 0
+            while pending:
+                response = await self.client.batch_write_item(RequestItems=pending)
+                pending = response.get("UnprocessedItems") or {}
+                if pending:
+                    await self._backoff(attempt)
+                    attempt += 1
+
+    async def set_many(self, items: Mapping[str, bytes], expire: int | None = None) -> None:
+        """Set several keys at once, large values are chunked by `set`.
+
+        Batch writes don't return the replaced items, chunks of chunked values overwritten by small
+        ones are only deleted with their own expiration.
+        """
+        large = {key: value for key, value in items.items() if len(value) > self.max_item_size}
+        await asyncio.gather(*(self.set(key, value, expire) for key, value in large.items()))
+        await self._batch_write(
+            [
+                {"PutRequest": {"Item": self._build_item(key, value, expire)}}
+                for key, value in items.items()
+                if key not in large
+            ],
+        )
+
+    async def _delete_keys(self, keys: Sequence[str]) -> int:
+        await self._batch_write([{"DeleteRequest": {"Key": {"key": {"S": key}}}} for key in keys])
+        return len(keys)
+
+    async def _delete_page(self, namespace: str, items: Sequence[Mapping[str, Any]]) -> int:
+        """Delete the items of a query or scan page, and the tagged values if they are tag items."""
+        keys = [item["key"]["S"] for item in items]
+        if namespace.endswith(TAG_SUFFIX):
+            # tag items are keyed `<tag>::tag:<tagged key>`, tagged values may have chunks
+            await asyncio.gather(*(self.clear(key=key[len(namespace) + 1 :]) for key in keys))
+        return await self._delete_keys(keys)
+
+    async def _clear_by_query(self, namespace: str) -> int:
+        count = 0
+        params: dict[str, Any] = {
+            "TableName": self.table_name,
+            "IndexName": self.namespace_index,
+            "KeyConditionExpression": "#ns = :ns",
+            "FilterExpression": "begins_with(#k, :prefix)",
+            "ProjectionExpression": "#k",
+            "ExpressionAttributeNames": {"#ns": "namespace", "#k": "key"},
+            "ExpressionAttributeValues": {":ns": {"S": self._namespace(namespace)}, ":prefix": {"S": f"{namespace}:"}},
+        }
+        while True:
+            response = await self.client.query(**params)
+            count += await self._delete_page(namespace, response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return count
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    async def _clear_segment(self, namespace: str, segment: int) -> int:
+        count = 0
+        params: dict[str, Any] = {
+            "TableName": self.table_name,
+            "Segment": segment,
+            "TotalSegments": self.scan_segments,
+            "FilterExpression": "begins_with(#k, :prefix)",
+            "ProjectionExpression": "#k",
+            "ExpressionAttributeNames": {"#k": "key"},
+            "ExpressionAttributeValues": {":prefix": {"S": f"{namespace}:"}},
+        }
+        while True:
+            response = await self.client.scan(**params)
+            count += await self._delete_page(namespace, response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return count
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    @staticmethod
+    def _tag_namespace(tag: str) -> str:
+        return f"{tag}{TAG_SUFFIX}"
+
+    def _tag_item(self, tag: str, key: str, expire: int | None) -> dict[str, Any]:
+        item = self._build_item(f"{self._tag_namespace(tag)}:{key}", b"", expire)
+        del item["value"]
+        return item
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        await self.set(key, value, expire)
+        await self._batch_write([{"PutRequest": {"Item": self._tag_item(tag, key, expire)}} for tag in tags])
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """Remove the values tagged with any of `tags`.
+
+        Returns:
+            Number of tag items deleted, a value tagged with several of `tags` counts for each.
+        """
+        counts = await asyncio.gather(*(self.clear_namespace(self._tag_namespace(tag)) for tag in tags))
+        return sum(counts)
+
+    async def clear_namespace(self, namespace: str) -> int:
+        """Clear all keys in the given namespace.
+
+        Every key starting with `namespace:` is removed, including nested namespaces. The
+        namespace index is queried unless `namespace` is a single segment.
+
+        Args:
+            namespace: namespace/prefix to clear.
+
+        Returns:
+            Number of keys deleted.
+        """
+        if self.namespace_index and ":" in namespace:
+            return await self._clear_by_query(namespace)
+        counts = await asyncio.gather(*(self._clear_segment(namespace, i) for i in range(self.scan_segments)))
+        return sum(counts)
 
     async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
-        raise NotImplementedError
+        if namespace:
+            return await self.clear_namespace(namespace)
+        elif key:
+            response = await self.client.delete_item(
+                TableName=self.table_name,
+                Key={"key": {"S": key}},
+                ReturnValues="ALL_OLD",
+            )
+            await self._delete_chunks(key, response.get("Attributes"))
+            return int("Attributes" in response)
+        return 0
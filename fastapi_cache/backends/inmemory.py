@@ -1,6 +1,6 @@
 import asyncio
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, ClassVar
@@ -12,11 +12,13 @@ from fastapi_cache.types import Backend
 class Value:
     data: bytes
     ttl_ts: int
+    tags: Sequence[str] = ()
 
 
 class InMemoryBackend(Backend):
     _store: ClassVar[dict[str, Value]] = {}
     _locks: ClassVar[dict[str, asyncio.Lock]] = {}
+    _tags: ClassVar[dict[str, set[str]]] = {}
     _check_lock = asyncio.Lock()
 
     @asynccontextmanager
@@ -46,7 +48,7 @@ class InMemoryBackend(Backend):
         v = self._store.get(key)
         if v:
             if v.ttl_ts < self._now:
-                del self._store[key]
+                self._delete(key)
             else:
                 return v
         return None
@@ -63,8 +65,34 @@ class InMemoryBackend(Backend):
             return v.data
         return None
 
+    def _delete(self, key: str) -> Value | None:
+        """Remove a value and drop its key from the index of its tags."""
+        v = self._store.pop(key, None)
+        if v:
+            for tag in v.tags:
+                keys = self._tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._tags[tag]
+        return v
+
     async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
-        self._store[key] = Value(value, self._now + (expire or 0))
+        await self.set_with_tags(key, value, (), expire)
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        self._delete(key)
+        self._store[key] = Value(value, self._now + (expire or 0), tuple(tags))
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        count = 0
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                if self._delete(key) is not None:
+                    count += 1
+        return count
 
     def lock(self, key: str, timeout: int) -> AbstractAsyncContextManager[Any]:
         lock_key = f"{key}::lock"
@@ -77,9 +105,10 @@ class InMemoryBackend(Backend):
             keys = list(self._store.keys())
             for key in keys:
                 if key.startswith(namespace):
-                    del self._store[key]
+                    self._delete(key)
                     count += 1
         elif key:
-            del self._store[key]
+            if self._delete(key) is None:
+                raise KeyError(key)
             count += 1
         return count
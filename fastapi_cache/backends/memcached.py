@@ -1,5 +1,15 @@
+import asyncio
+import hashlib
+import struct
+import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+import msgspec
+from aiomcache.exceptions import ClientException
+
+from fastapi_cache.helpers import chunking
+from fastapi_cache.helpers.keys import namespace_of
 from fastapi_cache.types import Backend
 
 if TYPE_CHECKING:
@@ -7,17 +17,181 @@ if TYPE_CHECKING:
 
 
 class MemcachedBackend(Backend):
-    def __init__(self, mcache: "Client"):
+    """
+    Memcached backend provider
+
+    Memcached can't enumerate keys, so namespaces are invalidated with generation counters:
+    every namespace a key belongs to (`fcache`, `fcache:test`, ... for `fcache:test:<hash>`) has
+    a counter stored under `<namespace>::gen`, and the counters are folded into the stored key.
+    Entries derived from a key (`<key>::<kind>:...`, chunks, streamed bodies, request bodies) use
+    the counters of the namespace of that key.
+    Clearing a namespace is a single `incr`, entries of the previous generation become
+    unreachable and are evicted by memcached in due time.
+
+    Values are stored with a small header holding the expiry timestamp, so `get_with_ttl`
+    returns the real remaining TTL. Values larger than `max_item_size` are split into chunk
+    entries that are written before a manifest stored under the key itself, so readers never
+    see a partially written value. Deleting a key deletes its chunks, the chunks of an
+    overwritten value are left to memcached eviction like the entries of cleared namespaces.
+
+    Tags use generation counters too: a tagged value stores the generation of each of its tags
+    (`<tag>::tag`) at write time and is treated as missing once any of them was bumped by
+    `invalidate_tags`.
+
+    Usage:
+        >> mcache = aiomcache.Client("localhost", 11211)
+        >> FastAPICache.init(MemcachedBackend(mcache))
+    """
+
+    # expiry timestamp (0 = never) and the size of the encoded tag generations that follow
+    HEADER = struct.Struct(">QI")
+
+    def __init__(self, mcache: "Client", separator: str = ":", max_item_size: int = 1_000_000):
+        """Initialize Memcached backend.
+
+        Args:
+            mcache: memcached client instance.
+            separator: separator between namespace segments of a key.
+            max_item_size: values larger than this are stored as several chunks, should stay below
+                the memcached item size limit (`-I`, 1 MB by default).
+        """
         self.mcache = mcache
+        self.separator = separator
+        self.max_item_size = max_item_size
+
+    @staticmethod
+    def _new_generation() -> bytes:
+        return str(time.time_ns()).encode()
+
+    def _generation_keys(self, key: str) -> list[bytes]:
+        namespace = namespace_of(key, self.separator)
+        segments = namespace.split(self.separator) if namespace else []
+        return [f"{self.separator.join(segments[: i + 1])}::gen".encode() for i in range(len(segments))]
+
+    async def _init_generation(self, gen_key: bytes) -> bytes:
+        generation = self._new_generation()
+        # `add` loses to a concurrent initialisation, in which case the winner is used
+        if not await self.mcache.add(gen_key, generation):
+            generation = await self.mcache.get(gen_key) or generation
+        return generation
+
+    async def _generations(self, gen_keys: list[bytes]) -> list[bytes]:
+        """Fetch the current generations, initialising the missing ones concurrently."""
+        if not gen_keys:
+            return []
+        generations: list[bytes | None] = list(await self.mcache.multi_get(*gen_keys))
+        missing = [i for i, generation in enumerate(generations) if generation is None]
+        initialised = await asyncio.gather(*(self._init_generation(gen_keys[i]) for i in missing))
+        for i, generation in zip(missing, initialised, strict=True):
+            generations[i] = generation
+        return generations  # type: ignore[return-value]
+
+    async def _storage_key(self, key: str) -> bytes:
+        generations = await self._generations(self._generation_keys(key))
+        if not generations:
+            return key.encode()
+        return f"{key}@{hashlib.blake2b(b'.'.join(generations), digest_size=8).hexdigest()}".encode()
+
+    @staticmethod
+    def _tag_key(tag: str) -> bytes:
+        return f"{tag}::tag".encode()
+
+    async def _tags_valid(self, tag_generations: list[tuple[bytes, bytes]]) -> bool:
+        current = await self.mcache.multi_get(*(tag_key for tag_key, _ in tag_generations))
+        return all(generation == stored for (_, stored), generation in zip(tag_generations, current, strict=True))
+
+    def _unpack(self, value: bytes | None) -> tuple[int, bytes | None, list[tuple[bytes, bytes]]]:
+        if value is None or len(value) < self.HEADER.size:
+            return 0, None, []
+        expire_ts, tags_size = self.HEADER.unpack_from(value)
+        ttl = expire_ts - int(time.time()) if expire_ts else -1
+        if expire_ts and ttl <= 0:
+            return 0, None, []
+        offset = self.HEADER.size + tags_size
+        tag_generations = (
+            msgspec.msgpack.decode(value[self.HEADER.size : offset], type=list[tuple[bytes, bytes]])
+            if tags_size
+            else []
+        )
+        return ttl, value[offset:], tag_generations
+
+    @staticmethod
+    def _chunk_key(storage_key: bytes, manifest: chunking.Manifest, index: int) -> bytes:
+        return storage_key + f"#{manifest.write_id}.{index}".encode()
 
     async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
-        return 3600, await self.get(key)
+        storage_key = await self._storage_key(key)
+        ttl, value, tag_generations = self._unpack(await self.mcache.get(storage_key))
+        if tag_generations and not await self._tags_valid(tag_generations):
+            return 0, None
+        if value is None or (manifest := chunking.decode_manifest(value)) is None:
+            return ttl, value
+
+        chunk_keys = [self._chunk_key(storage_key, manifest, i) for i in range(manifest.chunks)]
+        value = chunking.join(manifest, list(await self.mcache.multi_get(*chunk_keys)))
+        return (ttl, value) if value is not None else (0, None)
 
     async def get(self, key: str) -> bytes | None:
-        return await self.mcache.get(key.encode())
+        return (await self.get_with_ttl(key))[1]
 
     async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
-        await self.mcache.set(key.encode(), value, exptime=expire or 0)
+        await self._set(key, value, expire, b"")
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        generations = await self._generations(tag_keys)
+        await self._set(key, value, expire, msgspec.msgpack.encode(list(zip(tag_keys, generations, strict=True))))
+
+    async def _set(self, key: str, value: bytes, expire: int | None, tags: bytes) -> None:
+        expire_ts = int(time.time()) + expire if expire else 0
+        header = self.HEADER.pack(expire_ts, len(tags)) + tags
+        storage_key = await self._storage_key(key)
+        if len(value) > self.max_item_size:
+            manifest, chunks = chunking.split(value, self.max_item_size)
+            await asyncio.gather(
+                *(
+                    self.mcache.set(self._chunk_key(storage_key, manifest, i), chunk, exptime=expire or 0)
+                    for i, chunk in enumerate(chunks)
+                ),
+            )
+            value = chunking.encode_manifest(manifest)
+        await self.mcache.set(storage_key, header + value, exptime=expire or 0)
+
+    async def _incr(self, key: bytes) -> bool:
+        """Bump a generation counter, returns `False` if it isn't stored."""
+        try:
+            await self.mcache.incr(key)
+        except ClientException:
+            # aiomcache raises on NOT_FOUND
+            return False
+        return True
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """Invalidate tagged values by bumping the tag generations.
+
+        Returns:
+            Number of tags whose generation was bumped.
+        """
+        # values read a missing tag generation as a mismatch already, there is nothing to bump
+        return sum(await asyncio.gather(*(self._incr(self._tag_key(tag)) for tag in tags)))
 
     async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
-        raise NotImplementedError
+        """Invalidate a namespace by bumping its generation, or delete a single key.
+
+        Returns:
+            1 if the namespace generation was bumped or the key was deleted, 0 otherwise.
+        """
+        if namespace:
+            gen_key = f"{namespace}::gen".encode()
+            if not await self._incr(gen_key):
+                await self.mcache.set(gen_key, self._new_generation())
+            return 1
+        elif key:
+            storage_key = await self._storage_key(key)
+            _, value, _ = self._unpack(await self.mcache.get(storage_key))
+            if value is not None and (manifest := chunking.decode_manifest(value)) is not None:
+                await asyncio.gather(
+                    *(self.mcache.delete(self._chunk_key(storage_key, manifest, i)) for i in range(manifest.chunks)),
+                )
+            return int(await self.mcache.delete(storage_key))
+        return 0
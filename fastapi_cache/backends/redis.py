@@ -1,10 +1,15 @@
+import asyncio
+import secrets
 import textwrap
+from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Union
 
 from msgspec import UNSET, UnsetType
 from redis.asyncio import Redis, RedisCluster
 from redis.asyncio.lock import Lock
+from redis.crc import key_slot
 
 from fastapi_cache.helpers.invariant import invariant
 from fastapi_cache.types import Backend
@@ -12,6 +17,8 @@ from fastapi_cache.types import Backend
 if TYPE_CHECKING:
     from contextlib import AbstractAsyncContextManager
 
+    from redis.commands.core import AsyncScript
+
 
 class RedisBackend(Backend):
     DELETE_BY_KEYS_SCRIPT = textwrap.dedent("""
@@ -32,6 +39,14 @@ class RedisBackend(Backend):
     until cursor == 0
     return count
     """).strip()
+    RELEASE_LEASE_SCRIPT = textwrap.dedent("""
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+        return 0
+    end
+    redis.call('DEL', KEYS[1])
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+    redis.call('PEXPIRE', KEYS[2], ARGV[2])
+    return 1""").strip()
 
     def __init__(
         self,
@@ -40,6 +55,9 @@ class RedisBackend(Backend):
         redis_read: Union["Redis[bytes]", None] = None,
         use_scan: bool | UnsetType = UNSET,
         use_python_impl: bool | UnsetType = UNSET,
+        use_leases: bool = False,
+        cluster_scan_count: int = 1000,
+        cluster_concurrency: int = 8,
     ):
         """Initialize Redis backend.
 
@@ -50,6 +68,11 @@ class RedisBackend(Backend):
             use_scan: whether to enforce `scan` when deleting keys by `namespace`.
             use_python_impl: whether to use Python implementation instead of LUA scripts
                 for key deletion (useful for environments where LUA eval is restricted).
+            use_leases: whether to use lease tokens instead of `redis.asyncio.lock.Lock` when
+                `with_lock` is enabled. Only the lease holder recomputes a missing value, other
+                callers block on a notification list instead of polling the lock.
+            cluster_scan_count: `COUNT` hint used when scanning cluster nodes on namespace clear.
+            cluster_concurrency: maximum number of cluster primaries scanned concurrently.
         """
 
         if not (redis_write and redis_read) and not redis:
@@ -62,6 +85,11 @@ class RedisBackend(Backend):
         self.use_scan = invariant(use_scan, self.is_cluster)
         # `scan` has non-deterministic output, so it's not supported in a cluster
         self.use_python_impl = invariant(use_python_impl, self.is_cluster)
+        self.use_leases = use_leases
+        self.cluster_scan_count = cluster_scan_count
+        self.cluster_concurrency = cluster_concurrency
+        # releases awaited by this process, one `BLPOP` per lease however many callers wait for it
+        self._lease_waits: dict[str, asyncio.Task[None]] = {}
 
     @cached_property
     def redis_write(self) -> "Redis[bytes]":
@@ -75,6 +103,14 @@ class RedisBackend(Backend):
             return self._redis_read
         return self.redis  # type: ignore[return-value]
 
+    @cached_property
+    def _release_lease_script(self) -> "AsyncScript":
+        return self.redis_write.register_script(self.RELEASE_LEASE_SCRIPT)
+
+    @cached_property
+    def cluster(self) -> "RedisCluster[bytes]":
+        return self.redis  # type: ignore[return-value]
+
     async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
         async with self.redis_read.pipeline(transaction=not self.is_cluster) as pipe:
             return await pipe.ttl(key).get(key).execute()  # type: ignore[no-any-return]
@@ -85,11 +121,148 @@ class RedisBackend(Backend):
     async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
         await self.redis_write.set(key, value, ex=expire)
 
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        if self.is_cluster:
+            return await self.redis_read.mget_nonatomic(keys)  # type: ignore[attr-defined,no-any-return]
+        values: list[Any] = await self.redis_read.mget(keys)
+        return values
+
+    async def set_many(self, items: Mapping[str, bytes], expire: int | None = None) -> None:
+        if not items:
+            return
+        # a cluster pipeline routes every command to the node owning its slot
+        async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{tag}::tagged"
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        """Set a value and add its key to a set per tag.
+
+        Tag sets live at least as long as their longest-living member: `EXPIRE GT` only ever
+        extends the TTL of a set, a set holding a non-expiring key is persisted, and newly created
+        sets get their TTL in a second round-trip.
+        """
+        async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+            pipe.set(key, value, ex=expire)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.exists(tag_key)
+                pipe.sadd(tag_key, key)
+                if expire:
+                    pipe.expire(tag_key, expire, gt=True)
+                else:
+                    pipe.persist(tag_key)
+            results = await pipe.execute()
+
+        created = [self._tag_key(tag) for tag, existed in zip(tags, results[1::3], strict=True) if not existed]
+        if expire and created:
+            async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+                for tag_key in created:
+                    pipe.expire(tag_key, expire)
+                await pipe.execute()
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        async with self.redis_write.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members: list[set[bytes]] = await pipe.execute()
+        count = await self._unlink(list(set().union(*members)))
+        await self._unlink([tag_key.encode() for tag_key in tag_keys])
+        return count
+
+    async def _unlink(self, keys: list[bytes]) -> int:
+        if not keys:
+            return 0
+        if self.is_cluster:
+            return await self._unlink_by_slot(keys)
+        return await self.redis_write.unlink(*keys)
+
     def lock(self, key: str, timeout: int) -> "AbstractAsyncContextManager[Any]":
+        if self.use_leases:
+            return self.lease(key, timeout)
+
         lock_key = f"{key}::lock"
 
         return Lock(self.redis_write, lock_key, timeout=timeout, raise_on_release_error=False)  # type: ignore[call-arg]
 
+    @asynccontextmanager
+    async def lease(self, key: str, timeout: int) -> AsyncGenerator[bool, None]:
+        """Lease-based alternative to a lock, in the style of memcache leases.
+
+        A caller that misses tries to take the lease with `SET NX` and reads the current holder
+        token in the same round-trip. The holder recomputes the value and, on exit, pushes its token
+        to a per-lease notification list. Everyone else waits for that list, so nobody polls: the
+        callers of a process share a single `BLPOP`, which passes the notification on to the next
+        process, and a single connection.
+
+        Args:
+            key: cache key the lease is taken for.
+            timeout: lease expiry and the maximum time to wait for the holder, in seconds.
+
+        Yields:
+            `True` if this caller holds the lease, `False` if it waited for another holder.
+        """
+        lease_key = f"{key}::lease"
+        token = secrets.token_hex(8)
+        timeout_ms = timeout * 1000
+
+        async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+            pipe.set(lease_key, token, nx=True, px=timeout_ms)
+            pipe.get(lease_key)
+            acquired, holder = await pipe.execute()
+
+        if not acquired:
+            if holder is not None:
+                await self._wait_for_release(f"{lease_key}:{holder.decode()}", timeout)
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            await self._release_lease(lease_key, token, timeout_ms)
+
+    async def _wait_for_release(self, notify_key: str, timeout: int) -> None:
+        """Wait for the notification of a lease release, along with the other callers of this process."""
+        wait = self._lease_waits.get(notify_key)
+        if wait is None:
+            wait = self._lease_waits[notify_key] = asyncio.create_task(self._blpop_release(notify_key, timeout))
+            wait.add_done_callback(lambda _: self._lease_waits.pop(notify_key, None))
+        # shielded, a caller cancelled while waiting doesn't cancel the wait of the others
+        await asyncio.shield(wait)
+
+    async def _blpop_release(self, notify_key: str, timeout: int) -> None:
+        notification = await self.redis_write.blpop([notify_key], timeout=timeout)
+        if notification:
+            # pass the notification on to the waiters of the next process
+            async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+                pipe.rpush(notify_key, notification[1])
+                pipe.pexpire(notify_key, timeout * 1000)
+                await pipe.execute()
+
+    async def _release_lease(self, lease_key: str, token: str, timeout_ms: int) -> None:
+        """Drop the lease if it is still held by `token` and notify waiters."""
+        notify_key = f"{lease_key}:{token}"
+        if not self.use_python_impl:
+            await self._release_lease_script(keys=[lease_key, notify_key], args=[token, timeout_ms])
+            return
+
+        if await self.redis_write.get(lease_key) != token.encode():
+            return
+        async with self.redis_write.pipeline(transaction=not self.is_cluster) as pipe:
+            pipe.delete(lease_key)
+            pipe.rpush(notify_key, token)
+            pipe.pexpire(notify_key, timeout_ms)
+            await pipe.execute()
+
     async def _clear_by_keys_python(self, match: str) -> int:
         """Python implementation of DELETE_BY_KEYS_SCRIPT.
 
@@ -123,16 +296,75 @@ class RedisBackend(Backend):
                 break
         return count
 
-    async def clear_namespace(self, namespace: str) -> int:
+    async def _clear_by_scan_cluster(self, match: str, progress: Callable[[int], Any] | None = None) -> int:
+        """Cluster implementation of DELETE_BY_SCAN_SCRIPT.
+
+        Every primary is scanned concurrently (bounded by `cluster_concurrency`), matched keys are
+        grouped by hash slot and unlinked through a cluster pipeline, which sends one batch per node.
+
+        Args:
+            match: The match pattern to match keys against.
+            progress: optional callback receiving the running number of deleted keys.
+
+        Returns:
+            Number of keys deleted.
+        """
+        semaphore = asyncio.Semaphore(self.cluster_concurrency)
+        count = 0
+
+        async def clear_node(node: Any) -> None:
+            nonlocal count
+            async with semaphore:
+                cursor = 0
+                while True:
+                    # `RedisCluster.scan` isn't typed, the response is parsed the same way
+                    cursors, keys = await self.cluster.execute_command(
+                        "SCAN",
+                        cursor,
+                        "MATCH",
+                        match,
+                        "COUNT",
+                        self.cluster_scan_count,
+                        target_nodes=node,
+                    )
+                    cursor = cursors[node.name]
+                    if keys:
+                        # awaited first, `count +=` would read `count` before other nodes update it
+                        unlinked = await self._unlink_by_slot(keys)
+                        count += unlinked
+                        if progress:
+                            progress(count)
+                    if cursor == 0:
+                        break
+
+        await asyncio.gather(*(clear_node(node) for node in self.cluster.get_primaries()))
+        return count
+
+    async def _unlink_by_slot(self, keys: list[bytes]) -> int:
+        """Unlink keys of a cluster, one `UNLINK` per hash slot sent in a single pipeline."""
+        slots: dict[int, list[bytes]] = {}
+        for key in keys:
+            slots.setdefault(key_slot(key), []).append(key)
+        async with self.cluster.pipeline() as pipe:
+            for slot_keys in slots.values():
+                pipe.execute_command("UNLINK", *slot_keys)
+            counts: list[int] = await pipe.execute()
+        return sum(counts)
+
+    async def clear_namespace(self, namespace: str, progress: Callable[[int], Any] | None = None) -> int:
         """Clear all keys in the given namespace.
         Args:
             namespace: namespace/prefix to clear.
+            progress: optional callback receiving the running number of deleted keys,
+                only called when clearing a cluster.
 
         Returns:
             Number of keys deleted.
         """
 
         namespace = f"{namespace}:*"
+        if self.is_cluster:
+            return await self._clear_by_scan_cluster(namespace, progress)
         if self.use_python_impl:
             if self.use_scan:
                 return await self._clear_by_scan_python(namespace)
@@ -0,0 +1,189 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from fastapi_cache.types import Backend
+
+MAGIC = b"fcshm001"
+# magic, number of slots, slot size
+HEADER = struct.Struct("<8sII")
+DATA_OFFSET = 64
+# sequence number, key hash, expiry timestamp (0 never expires), key length, value length
+SLOT_HEADER = struct.Struct("<IQdHI")
+SEQ = struct.Struct("<I")
+# the slot header without its sequence number, written separately
+SLOT_FIELDS = struct.Struct("<QdHI")
+SEQ_MASK = 0xFFFFFFFF
+SLOT_HEADER_SIZE = 32
+# a reader racing with writers gives up and reports a miss after this many attempts
+READ_ATTEMPTS = 16
+
+
+class SharedMemoryBackend(Backend):
+    """
+    Host-local backend shared by all worker processes through a memory-mapped file
+
+    The file holds a fixed-size hash table of `slots` slots of `slot_size` bytes, so memory use is
+    bounded and every worker on the host reads the same copy. A key may live in any of `probes`
+    consecutive slots; when they are all taken, the entry expiring first is evicted. Values larger
+    than a slot (minus its key and a 32 bytes header) are not cached.
+
+    Writers serialize per slot with `fcntl` byte-range locks. Readers take no lock: every slot has
+    a sequence number that writers make odd while writing, readers copy the slot out of the mapping
+    and retry if the sequence number changed meanwhile.
+
+    Point every worker to the same file, preferably on a tmpfs such as `/dev/shm`. All of them must
+    use the same `slots` and `slot_size`. Only available on POSIX systems.
+
+    Usage:
+        >> FastAPICache.init(SharedMemoryBackend("/dev/shm/fastapi-cache", slots=65536))
+    """
+
+    def __init__(self, path: str | Path, slots: int = 16384, slot_size: int = 4096, probes: int = 8) -> None:
+        if slot_size <= SLOT_HEADER_SIZE:
+            raise ValueError(f"slot_size must be larger than {SLOT_HEADER_SIZE}")
+        self.slots = slots
+        self.slot_size = slot_size
+        self.probes = min(probes, slots)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = DATA_OFFSET + slots * slot_size
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, DATA_OFFSET, 0)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, HEADER.pack(MAGIC, slots, slot_size), 0)
+            elif HEADER.unpack(os.pread(self._fd, HEADER.size, 0)) != (MAGIC, slots, slot_size):
+                raise ValueError(f"{path} was created with different slots or slot_size")
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, DATA_OFFSET, 0)
+        self._mmap = mmap.mmap(self._fd, size)
+        self._view = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+        os.close(self._fd)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        # 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+    def _offsets(self, key_hash: int) -> Generator[int, None, None]:
+        start = key_hash % self.slots
+        for probe in range(self.probes):
+            yield DATA_OFFSET + (start + probe) % self.slots * self.slot_size
+
+    @contextmanager
+    def _slot_lock(self, offset: int) -> Generator[None, None, None]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_size, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)
+
+    def _read(self, offset: int, key_hash: int, key: bytes) -> tuple[float, bytes] | None:
+        """Consistent copy of the value stored for `key` in a slot, `None` if it holds another key."""
+        for _ in range(READ_ATTEMPTS):
+            seq, slot_hash, expires, key_len, value_len = SLOT_HEADER.unpack_from(self._mmap, offset)
+            if seq & 1:
+                continue
+            if slot_hash != key_hash:
+                return None
+            start = offset + SLOT_HEADER_SIZE
+            data = bytes(self._view[start : start + min(key_len + value_len, self.slot_size - SLOT_HEADER_SIZE)])
+            if SEQ.unpack_from(self._mmap, offset)[0] != seq:
+                continue
+            if data[:key_len] != key:
+                return None
+            return expires, data[key_len:]
+        return None
+
+    def _write(self, offset: int, key_hash: int, expires: float, key: bytes, value: bytes) -> None:
+        with self._slot_lock(offset):
+            # readers retry while the sequence number is odd, it turns even again only once the
+            # header and the payload are complete
+            seq = SEQ.unpack_from(self._mmap, offset)[0]
+            SEQ.pack_into(self._mmap, offset, (seq + 1) & SEQ_MASK)
+            SLOT_FIELDS.pack_into(self._mmap, offset + SEQ.size, key_hash, expires, len(key), len(value))
+            start = offset + SLOT_HEADER_SIZE
+            self._view[start : start + len(key)] = key
+            self._view[start + len(key) : start + len(key) + len(value)] = value
+            SEQ.pack_into(self._mmap, offset, (seq + 2) & SEQ_MASK)
+
+    def _get(self, key: str) -> tuple[float, bytes] | None:
+        encoded = key.encode()
+        key_hash = self._hash(encoded)
+        for offset in self._offsets(key_hash):
+            entry = self._read(offset, key_hash, encoded)
+            if entry is not None:
+                expires = entry[0]
+                if expires and expires < time.time():
+                    return None
+                return entry
+        return None
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        entry = self._get(key)
+        if entry is None:
+            return 0, None
+        expires, value = entry
+        return (int(expires - time.time()) if expires else -1), value
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._get(key)
+        return entry[1] if entry else None
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        encoded = key.encode()
+        if len(encoded) + len(value) > self.slot_size - SLOT_HEADER_SIZE:
+            # not cached, but the previous value must not be served anymore
+            await self.clear(key=key)
+            return
+        key_hash = self._hash(encoded)
+        now = time.time()
+        victim, victim_expires = 0, float("inf")
+        for offset in self._offsets(key_hash):
+            _, slot_hash, expires, key_len, _ = SLOT_HEADER.unpack_from(self._mmap, offset)
+            start = offset + SLOT_HEADER_SIZE
+            if slot_hash == key_hash and self._view[start : start + key_len] == encoded:
+                victim = offset
+                break
+            # free and expired slots come first, then the one expiring first, never expiring ones last
+            rank = -1.0 if slot_hash == 0 or (expires and expires < now) else (expires or float("inf"))
+            if not victim or rank < victim_expires:
+                victim, victim_expires = offset, rank
+        self._write(victim, key_hash, now + expire if expire else 0.0, encoded, value)
+
+    def _invalidate(self, offset: int) -> None:
+        with self._slot_lock(offset):
+            seq = SEQ.unpack_from(self._mmap, offset)[0]
+            SEQ.pack_into(self._mmap, offset, (seq + 1) & SEQ_MASK)
+            SLOT_FIELDS.pack_into(self._mmap, offset + SEQ.size, 0, 0.0, 0, 0)
+            SEQ.pack_into(self._mmap, offset, (seq + 2) & SEQ_MASK)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        count = 0
+        if namespace:
+            prefix = namespace.encode()
+            for slot in range(self.slots):
+                offset = DATA_OFFSET + slot * self.slot_size
+                _, slot_hash, _, key_len, _ = SLOT_HEADER.unpack_from(self._mmap, offset)
+                start = offset + SLOT_HEADER_SIZE
+                if slot_hash and self._view[start : start + min(key_len, len(prefix))] == prefix:
+                    self._invalidate(offset)
+                    count += 1
+        elif key:
+            encoded = key.encode()
+            key_hash = self._hash(encoded)
+            for offset in self._offsets(key_hash):
+                if self._read(offset, key_hash, encoded) is not None:
+                    self._invalidate(offset)
+                    count += 1
+        return count
@@ -0,0 +1,64 @@
+from functools import lru_cache
+
+from msgspec import Struct
+
+# `max-stale` without a value accepts stale values of any age
+MAX_STALE_ANY = 2**31
+
+
+def _seconds(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+class RequestCacheControl(Struct, frozen=True):
+    """Cache-Control directives of a request, see RFC 9111 section 5.2.1."""
+
+    no_store: bool = False
+    no_cache: bool = False
+    max_age: int | None = None
+    max_stale: int | None = None
+    min_fresh: int | None = None
+    only_if_cached: bool = False
+
+    def accepts(self, age: float | None, fresh_for: int | None) -> bool:
+        """Whether a cached value satisfies the directives.
+
+        Args:
+            age: seconds since the value was written, `None` if unknown.
+            fresh_for: seconds the value stays fresh, negative once stale, `None` if it never expires.
+        """
+        if fresh_for is not None:
+            if fresh_for < 0 and (self.max_stale is None or -fresh_for > self.max_stale):
+                return False
+            if self.min_fresh is not None and fresh_for < self.min_fresh:
+                return False
+        return self.max_age is None or age is None or age <= self.max_age
+
+
+NO_DIRECTIVES = RequestCacheControl()
+
+
+@lru_cache(maxsize=1024)
+def parse_cache_control(header: str) -> RequestCacheControl:
+    """Parse a request Cache-Control header, results are cached per header value."""
+    if not header:
+        return NO_DIRECTIVES
+    directives: dict[str, str | None] = {}
+    for directive in header.split(","):
+        name, sep, value = directive.partition("=")
+        directives[name.strip().lower()] = value.strip().strip('"') if sep else None
+
+    max_stale = _seconds(directives.get("max-stale"))
+    return RequestCacheControl(
+        no_store="no-store" in directives,
+        no_cache="no-cache" in directives,
+        max_age=_seconds(directives.get("max-age")),
+        max_stale=MAX_STALE_ANY if max_stale is None and "max-stale" in directives else max_stale,
+        min_fresh=_seconds(directives.get("min-fresh")),
+        only_if_cached="only-if-cached" in directives,
+    )
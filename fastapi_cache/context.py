@@ -1,10 +1,18 @@
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
 from contextvars import ContextVar
 from inspect import Parameter
+from typing import Any
 
 from msgspec import UNSET, Struct, UnsetType
 
 from fastapi_cache.coder import Coder
-from fastapi_cache.types import KeyBuilder
+from fastapi_cache.executor import CacheExecutor
+from fastapi_cache.hotkeys import HotKeys
+from fastapi_cache.instrumentation import Instrumentation
+from fastapi_cache.ttl import TTLPolicy
+from fastapi_cache.types import Backend, KeyBuilder, TagsBuilder
+from fastapi_cache.warmup import Warmer
 
 
 class CacheCtxCommon(Struct):
@@ -14,25 +22,50 @@ class CacheCtxCommon(Struct):
     bypass_cache_control: bool
     injected_request: Parameter
     injected_response: Parameter
+    tags: TagsBuilder | None
+    stale_ttl: int
+    methods: frozenset[str]
+    negative_expire: int | None
+    negative_exceptions: Callable[[Exception], bool] | None
+    cpu_bound: bool
+    versioned: bool
+    version: str | None
 
 
 class CacheCtxWithOptional(CacheCtxCommon):
     expire: int | None | UnsetType = UNSET
     coder: type[Coder] | UnsetType = UNSET
     key_builder: KeyBuilder | UnsetType = UNSET
+    ttl_policy: TTLPolicy | UnsetType | None = UNSET
 
 
 class CacheCtx(CacheCtxCommon):
     expire: int | None
     coder: type[Coder]
     key_builder: KeyBuilder
+    ttl_policy: TTLPolicy | None
 
 
 class CacheCtxFrozen(CacheCtx, frozen=True):  # type: ignore[misc]
     pass
 
 
+class CacheConfig(Struct, frozen=True):
+    """Settings of a cache instance, read by cached functions on every call."""
+
+    generation: int
+    backend: Backend
+    prefix: str
+    cache_status_header: str
+    instrumentation: Instrumentation | None
+    executor: CacheExecutor | None
+    hot_keys: HotKeys | None
+    warmer: Warmer | None
+    stamp_values: bool
+
+
 cache_ctx_var: ContextVar[CacheCtx] = ContextVar("cache_ctx")
+request_memo_var: ContextVar[dict[str, Any] | None] = ContextVar("request_memo", default=None)
 
 
 def get_cache_ctx() -> CacheCtx:
@@ -40,3 +73,14 @@ def get_cache_ctx() -> CacheCtx:
         return cache_ctx_var.get()
     except LookupError as e:
         raise RuntimeError("Cache ctx it not set!") from e
+
+
+@contextmanager
+def request_memo() -> Generator[dict[str, Any], None, None]:
+    """Memoize cached function calls made within the block by cache key, see `RequestMemoMiddleware`."""
+    memo: dict[str, Any] = {}
+    token = request_memo_var.set(memo)
+    try:
+        yield memo
+    finally:
+        request_memo_var.reset(token)
@@ -1,7 +1,9 @@
 import inspect
 import logging
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+import time
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Generator, Iterable, Sequence
 from contextlib import AsyncExitStack, contextmanager
+from email.utils import formatdate, parsedate_to_datetime
 from functools import cached_property, partial, update_wrapper
 from inspect import Parameter, Signature, isawaitable, iscoroutinefunction
 from typing import (
@@ -18,19 +20,37 @@ from typing import (
 import msgspec
 from fastapi.concurrency import run_in_threadpool
 from fastapi.dependencies.utils import (
+    get_dependant,
     get_typed_return_annotation,
     get_typed_signature,
 )
+from fastapi.exceptions import FastAPIError
 from msgspec import UNSET, UnsetType
 from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.status import HTTP_304_NOT_MODIFIED
+from starlette.responses import Response, StreamingResponse
+from starlette.status import HTTP_304_NOT_MODIFIED, HTTP_504_GATEWAY_TIMEOUT
 
-from fastapi_cache import Backend, FastAPICache
+from fastapi_cache import Backend, FastAPICache, envelope, negative, streaming
+from fastapi_cache.backends.breaker import CircuitOpenError
+from fastapi_cache.cache_control import NO_DIRECTIVES, RequestCacheControl, parse_cache_control
 from fastapi_cache.coder import Coder
-from fastapi_cache.context import CacheCtx, CacheCtxFrozen, CacheCtxWithOptional, cache_ctx_var
-from fastapi_cache.types import KeyBuilder
+from fastapi_cache.context import (
+    CacheConfig,
+    CacheCtx,
+    CacheCtxFrozen,
+    CacheCtxWithOptional,
+    cache_ctx_var,
+    request_memo_var,
+)
+from fastapi_cache.helpers.fingerprint import schema_fingerprint
+from fastapi_cache.helpers.names import qualified_name
+from fastapi_cache.helpers.stamp import stamp, unstamp
+from fastapi_cache.helpers.typing import is_subclass_safe
+from fastapi_cache.instrumentation import Instrumentation
+from fastapi_cache.key_builder import request_body_digest
+from fastapi_cache.ttl import TTLPolicy
+from fastapi_cache.types import KeyBuilder, TagsBuilder
 
 logger: logging.Logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -83,36 +103,181 @@ def _locate_param(sig: Signature, dep: Parameter, to_inject: list[Parameter]) ->
     return param
 
 
-def _uncacheable(request: Request | None, bypass_cache_control: bool) -> bool:
+def _uncacheable(
+    request: Request | None,
+    bypass_cache_control: bool,
+    backend: Backend,
+    methods: Collection[str] = ("GET",),
+    enable: bool = True,
+) -> bool:
     """Determine if this request should not be cached
 
     Returns true if:
     - Caching has been disabled globally
-    - This is not a GET request
-    - The request has a Cache-Control header with a value of "no-store"
+    - The backend is unavailable, e.g. its circuit breaker is open
+    - The request method is not one of `methods`
+    - The request has a Cache-Control header with a "no-store" directive
 
     """
-    if not FastAPICache.get_enable():
+    if not enable or not backend.available:
         return True
     if request is None or bypass_cache_control:
         return False
-    if request.method != "GET":
+    if request.method not in methods:
         return True
-    return request.headers.get("Cache-Control") == "no-store"
+    return parse_cache_control(request.headers.get("Cache-Control", "")).no_store
 
 
-async def _get_cached(backend: Backend, cache_key: str) -> tuple[int, Any]:
+async def _get_cached(
+    backend: Backend,
+    cache_key: str,
+    namespace: str = "",
+    instrumentation: Instrumentation | None = None,
+) -> tuple[int, Any]:
     """Get the cached value for a given cache key from the backend.."""
+    start = time.perf_counter() if instrumentation else 0.0
     try:
         ttl, cached = await backend.get_with_ttl(cache_key)
+    except CircuitOpenError:
+        # the breaker admitted the call but another one is probing the backend
+        ttl, cached = 0, None
     except Exception:
         logger.warning(
             "Error retrieving cache key '%s' from backend:",
             cache_key,
             exc_info=True,
         )
+        if instrumentation:
+            instrumentation.on_error(namespace, "get")
         ttl, cached = 0, None
-    return ttl, cached
+    else:
+        if instrumentation:
+            instrumentation.observe_backend(namespace, "get", time.perf_counter() - start)
+    return ttl, None if cached is None else unstamp(cached)
+
+
+def _encode(
+    ctx: CacheCtx,
+    result: Any,
+    instrumentation: Instrumentation | None = None,
+    as_envelope: bool = False,
+) -> bytes:
+    """Encode a computed value with the context coder, or a complete response in an envelope."""
+    encode = envelope.encode if as_envelope else ctx.coder.encode
+    if not instrumentation:
+        return encode(result)
+    start = time.perf_counter()
+    to_cache = encode(result)
+    instrumentation.observe_coder(ctx.namespace, "encode", time.perf_counter() - start)
+    instrumentation.observe_size(ctx.namespace, "set", len(to_cache))
+    return to_cache
+
+
+async def _set_cached(
+    backend: Backend,
+    cache_key: str,
+    to_cache: bytes,
+    ttl: int | None,
+    namespace: str = "",
+    instrumentation: Instrumentation | None = None,
+    tags: Sequence[str] = (),
+    written_at: float | None = None,
+) -> None:
+    """Set the encoded value for a given cache key in the backend, stamped with `written_at` if given."""
+    start = time.perf_counter() if instrumentation else 0.0
+    if written_at is not None:
+        to_cache = stamp(to_cache, written_at)
+    try:
+        if tags:
+            await backend.set_with_tags(cache_key, to_cache, tags, ttl)
+        else:
+            await backend.set(cache_key, to_cache, ttl)
+    except CircuitOpenError:
+        pass
+    except Exception as e:
+        logger.warning(
+            "Error setting cache key '%s' in backend: '%s",
+            cache_key,
+            e,
+            exc_info=True,
+        )
+        if instrumentation:
+            instrumentation.on_error(namespace, "set")
+    else:
+        if instrumentation:
+            instrumentation.observe_backend(namespace, "set", time.perf_counter() - start)
+
+
+def _last_modified(written_at: float) -> str:
+    return formatdate(written_at, usegmt=True)
+
+
+def _age(written_at: float) -> str:
+    return str(max(0, int(time.time() - written_at)))
+
+
+def _not_modified(headers: Headers | dict[str, str], etag: str, written_at: float | None) -> bool:
+    """Whether the conditional request headers match the cached value.
+
+    `If-Modified-Since` is only considered without `If-None-Match`, as per RFC 9110.
+    """
+    if if_none_match := headers.get("if-none-match"):
+        return if_none_match == etag
+    if written_at is None or not (if_modified_since := headers.get("if-modified-since")):
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(written_at) <= since.timestamp()
+
+
+def _static_tags(tags: Iterable[str]) -> TagsBuilder:
+    """Tags builder always returning the same tags."""
+    tags = tuple(tags)
+
+    def builder(__result: Any, *, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Iterable[str]:
+        return tags
+
+    return builder
+
+
+def _exception_filter(
+    exceptions: Iterable[type[Exception]] | Callable[[Exception], bool],
+) -> Callable[[Exception], bool] | None:
+    """Negative caching filter, matching instances of the given exception types unless it is a filter already."""
+    if callable(exceptions) and not isinstance(exceptions, type):
+        return exceptions
+    types = (exceptions,) if isinstance(exceptions, type) else tuple(exceptions)
+    if not types:
+        return None
+
+    def matches(exc: Exception) -> bool:
+        return isinstance(exc, types)
+
+    return matches
+
+
+def _fresh_for(ttl: int | None, stale_ttl: int) -> int | None:
+    """Seconds a cached value stays fresh, negative once stale, `None` if it never expires."""
+    if ttl is None or ttl < 0:
+        return None
+    return ttl - stale_ttl
+
+
+def _acceptable(cached: Any, ttl: int | None, ctx: CacheCtx, cache_control: RequestCacheControl) -> bool:
+    # negative entries not selected by this decorator count as misses, backends aren't trusted
+    entry = negative.decode(cached) if isinstance(cached, bytes) else None
+    if entry is not None and not entry.replayable(ctx.negative_exceptions):
+        return False
+    written_at: float | None = getattr(cached, "written_at", None)
+    age = None if written_at is None else time.time() - written_at
+    return cache_control.accepts(age, _fresh_for(ttl, ctx.stale_ttl))
+
+
+def _stored_ttl(ttl: int | None, stale_ttl: int) -> int | None:
+    # stale values are kept past their expiration for clients accepting them
+    return ttl + stale_ttl if ttl and stale_ttl else ttl
 
 
 def _get_max_age(ttl: int | None) -> int:
@@ -130,6 +295,7 @@ class Cached(Generic[P, R]):
         self,
         ctx: CacheCtxWithOptional,
         func: Callable[P, Awaitable[R]],
+        cache_name: str | None = None,
     ) -> None:
         wrapped_signature = get_typed_signature(func)
 
@@ -137,9 +303,19 @@ class Cached(Generic[P, R]):
         self.request_param = _locate_param(wrapped_signature, ctx.injected_request, to_inject)
         self.response_param = _locate_param(wrapped_signature, ctx.injected_response, to_inject)
         self.return_type = get_typed_return_annotation(func)
+        # endpoints declared to return a response are replayed as the exact same response
+        self.returns_response = is_subclass_safe(self.return_type, Response)
+        # part of the keys, entries encoded for another shape of the result are never read
+        versioned = ctx.versioned or ctx.version is not None
+        self.fingerprint = schema_fingerprint(self.return_type, ctx.version) if versioned else None
 
         self._initial_ctx = ctx
         self.func = func
+        self.cache = FastAPICache.instance(cache_name)
+        self._config: CacheConfig | None = None
+        # size of the last value encoded, a hint deciding where the next one is encoded: concurrent
+        # calls overwrite it, which at worst moves one encoding to or from the event loop
+        self.encoded_size = 0
 
         update_wrapper(self, func)
         markcoroutinefunction(self)
@@ -154,8 +330,33 @@ class Cached(Generic[P, R]):
         """Context manager to set/reset the cache context."""
         ctx = self.get_local_ctx()
         token = cache_ctx_var.set(ctx)
-        yield
-        cache_ctx_var.reset(token)
+        try:
+            yield
+        finally:
+            cache_ctx_var.reset(token)
+
+    @cached_property
+    def body_params(self) -> frozenset[str]:
+        """Names of the parameters FastAPI fills from the request body."""
+        return frozenset(param.name for param in get_dependant(path="", call=self.func).body_params)
+
+    @cached_property
+    def replayable(self) -> bool:
+        """Whether calls can be made again outside of a request, FastAPI injects nothing but request data."""
+        try:
+            dependant = get_dependant(path="", call=self.func)
+        except FastAPIError:
+            # not a function FastAPI could call, it is only ever called directly
+            return True
+        return not (
+            dependant.dependencies
+            or dependant.request_param_name
+            or dependant.websocket_param_name
+            or dependant.http_connection_param_name
+            or dependant.response_param_name
+            or dependant.background_tasks_param_name
+            or dependant.security_scopes_param_name
+        )
 
     @cached_property
     def global_ctx(self) -> CacheCtxFrozen:
@@ -164,13 +365,40 @@ class Cached(Generic[P, R]):
         Useful when the decorator is executed before Cache is instantiated."""
         ctx = self._initial_ctx
         if isinstance(ctx.coder, UnsetType):
-            ctx.coder = FastAPICache.get_coder()
+            ctx.coder = self.cache.get_coder()
         if isinstance(ctx.expire, UnsetType):
-            ctx.expire = FastAPICache.get_expire()
+            expire = self.cache.get_expire()
+            if isinstance(expire, TTLPolicy):
+                if isinstance(ctx.ttl_policy, UnsetType):
+                    ctx.ttl_policy = expire
+                expire = None
+            ctx.expire = expire
+        if isinstance(ctx.ttl_policy, UnsetType):
+            ctx.ttl_policy = None
         if isinstance(ctx.key_builder, UnsetType):
-            ctx.key_builder = FastAPICache.get_key_builder()
+            ctx.key_builder = self.cache.get_key_builder()
         return msgspec.convert(ctx, type=CacheCtxFrozen, from_attributes=True)
 
+    @property
+    def config(self) -> CacheConfig:
+        """Settings of the cache instance, resolved on the first call after every `FastAPICache.init`."""
+        generation = self.cache.get_generation()
+        config = self._config
+        if config is None or config.generation != generation:
+            cache = self.cache
+            config = self._config = CacheConfig(
+                generation=generation,
+                backend=cache.get_backend(),
+                prefix=cache.get_prefix(),
+                cache_status_header=cache.get_cache_status_header(),
+                instrumentation=cache.get_instrumentation(),
+                executor=cache.get_executor(),
+                hot_keys=cache.get_hot_keys(),
+                warmer=cache.get_warmer(),
+                stamp_values=cache.get_stamp_values(),
+            )
+        return config
+
     def get_local_ctx(self) -> CacheCtx:
         """Fetch mutable context to be used locally."""
         return msgspec.convert(self.global_ctx, type=CacheCtx, from_attributes=True)
@@ -184,7 +412,7 @@ class Cached(Generic[P, R]):
             return self.global_ctx
 
     async def ensure_async_func(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        """Run cached sync functions in a thread pool just like FastAPI."""
+        """Run cached sync functions in a thread pool just like FastAPI, or in the `CacheExecutor` if set."""
         ctx = self.get_ctx()
 
         # if the wrapped function does NOT have a request or response in
@@ -201,7 +429,32 @@ class Cached(Generic[P, R]):
             return await self.func(*args, **kwargs)
         # sync, wrap in thread and return async
         # see above why we have to await even although caller also awaits.
-        return await run_in_threadpool(self.func, *args, **kwargs)  # type: ignore[arg-type]
+        executor = self.config.executor
+        if executor is None:
+            return await run_in_threadpool(self.func, *args, **kwargs)  # type: ignore[arg-type]
+        if ctx.cpu_bound and executor.processes:
+            return await executor.run_process(qualified_name(self.func), *args, **kwargs)  # type: ignore[no-any-return]
+        return await executor.run_sync(self.func, *args, **kwargs)  # type: ignore[arg-type]
+
+    async def lookup(
+        self,
+        backend: Backend,
+        cache_key: str,
+        namespace: str,
+        instrumentation: Instrumentation | None,
+    ) -> tuple[int, Any]:
+        """Get the cached value, cached streams are returned as a `StreamingResponse` replaying them."""
+        ttl, cached = await _get_cached(backend, cache_key, namespace, instrumentation)
+        if cached is None or (manifest := streaming.decode_manifest(cached)) is None:
+            return ttl, cached
+        try:
+            replayed = await streaming.replay(backend, cache_key, manifest)
+        except Exception:
+            logger.warning("Error replaying cached stream '%s':", cache_key, exc_info=True)
+            return 0, None
+        if replayed is not None and (written_at := getattr(cached, "written_at", None)) is not None:
+            replayed.headers.update({"Last-Modified": _last_modified(written_at), "Age": _age(written_at)})
+        return ttl, replayed
 
     async def get_cached_or_call(
         self,
@@ -214,28 +467,93 @@ class Cached(Generic[P, R]):
 
         ctx = self.get_ctx()
 
-        backend = FastAPICache.get_backend()
+        config = self.config
+        backend = config.backend
+        instrumentation = config.instrumentation
 
-        ttl, cached = (None, None) if no_cache else await _get_cached(backend, cache_key)
+        ttl, cached = (
+            (None, None) if no_cache else await self.lookup(backend, cache_key, ctx.namespace, instrumentation)
+        )
         if cached is not None:
             return cached, ttl, True
 
         lock = backend.lock(cache_key, ctx.lock_timeout) if ctx.with_lock else AsyncExitStack()
 
+        start = time.perf_counter() if instrumentation else 0.0
         async with lock:
+            if instrumentation and ctx.with_lock:
+                instrumentation.observe_lock_wait(ctx.namespace, time.perf_counter() - start)
             if not no_cache and ctx.with_lock:
                 # fetch cached one more time with lock, could be that the value have been cached already
-                ttl, cached = await _get_cached(backend, cache_key)
+                ttl, cached = await self.lookup(backend, cache_key, ctx.namespace, instrumentation)
                 if cached is not None:
+                    if instrumentation:
+                        instrumentation.on_coalesced(ctx.namespace)
                     return cached, ttl, True
 
-            result = await self.ensure_async_func(*args, **kwargs)
+            try:
+                result = await self.ensure_async_func(*args, **kwargs)
+            except Exception as e:
+                await self.cache_exception(cache_key, e)
+                raise
             ctx = self.get_ctx()
 
             return result, ctx.expire, False
 
+    async def cache_exception(self, cache_key: str, exc: Exception) -> None:
+        """Store an exception selected for negative caching, so that hits raise it again."""
+        ctx = self.get_ctx()
+        if ctx.negative_expire is None or ctx.negative_exceptions is None or not ctx.negative_exceptions(exc):
+            return
+        to_cache = negative.encode_exception(exc)
+        if to_cache is not None:
+            config = self.config
+            backend = config.backend
+            instrumentation = config.instrumentation
+            ttl = _stored_ttl(ctx.negative_expire, ctx.stale_ttl)
+            written_at = time.time() if config.stamp_values else None
+            await _set_cached(backend, cache_key, to_cache, ttl, ctx.namespace, instrumentation, written_at=written_at)
+
+    async def get_acceptable_or_call(
+        self,
+        cache_key: str,
+        cache_control: RequestCacheControl,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> tuple[R, int | None, Literal[False]] | tuple[Any, int | None, Literal[True]] | None:
+        """Like `get_cached_or_call`, but cached values refused by the request directives count as misses.
+
+        Stale values are only served to requests allowing them with `max-stale`, the expiration
+        returned for cached values is the time they stay fresh.
+
+        Returns:
+            `None` if the request is `only-if-cached` and no acceptable value is cached.
+        """
+        ctx = self.get_ctx()
+        config = self.config
+        instrumentation = config.instrumentation
+        ttl: int | None
+        if cache_control.only_if_cached:
+            if cache_control.no_cache:
+                return None
+            backend = config.backend
+            ttl, cached = await self.lookup(backend, cache_key, ctx.namespace, instrumentation)
+            if cached is None or not _acceptable(cached, ttl, ctx, cache_control):
+                return None
+            result, from_cache = cached, True
+        else:
+            result, ttl, from_cache = await self.get_cached_or_call(cache_key, cache_control.no_cache, *args, **kwargs)
+            if from_cache and not _acceptable(result, ttl, ctx, cache_control):
+                return await self.get_cached_or_call(cache_key, True, *args, **kwargs)
+
+        if from_cache and (fresh_for := _fresh_for(ttl, ctx.stale_ttl)) is not None and ctx.stale_ttl:
+            if fresh_for < 0 and instrumentation:
+                instrumentation.on_stale(ctx.namespace)
+            ttl = max(0, fresh_for)
+        return result, ttl, from_cache  # type: ignore[return-value]
+
     @overload
-    def build_cached_result(
+    async def build_cached_result(
         self,
         cached: Any,
         ttl: int | None,
@@ -244,7 +562,7 @@ class Cached(Generic[P, R]):
     ) -> R: ...
 
     @overload
-    def build_cached_result(
+    async def build_cached_result(
         self,
         cached: Any,
         ttl: int | None,
@@ -252,7 +570,7 @@ class Cached(Generic[P, R]):
         response: Response,
     ) -> Response: ...
 
-    def build_cached_result(
+    async def build_cached_result(
         self,
         cached: Any,
         ttl: int | None,
@@ -271,22 +589,54 @@ class Cached(Generic[P, R]):
         Returns:
             `Response` in case a response instance was passed, otherwise decoded value.
         """
-        cache_status_header = FastAPICache.get_cache_status_header()
+        config = self.config
+        cache_status_header = config.cache_status_header
+
+        if isinstance(cached, StreamingResponse):
+            cached.headers.update({"Cache-Control": f"max-age={_get_max_age(ttl)}", cache_status_header: "HIT"})
+            last_modified = cached.headers.get("Last-Modified")
+            modified_at = parsedate_to_datetime(last_modified).timestamp() if last_modified else None
+            if not _not_modified(headers, cached.headers["ETag"], modified_at):
+                return cached
+            # the replayed stream is dropped, its remaining chunks are never fetched
+            names = ("Cache-Control", "ETag", "Last-Modified", "Age", cache_status_header)
+            return Response(
+                status_code=HTTP_304_NOT_MODIFIED,
+                headers={name: value for name in names if (value := cached.headers.get(name)) is not None},
+            )
+
+        if (entry := negative.decode(cached)) is not None:
+            # raises a cached exception, a cached `None` is returned as is
+            entry.replay(self.get_ctx().negative_exceptions)
 
         etag = f"W/{hash(cached)}"
-        if response and (if_none_match := headers.get("if-none-match")) and (if_none_match == etag):
+        written_at: float | None = getattr(cached, "written_at", None)
+        date_headers = (
+            {"Last-Modified": _last_modified(written_at), "Age": _age(written_at)} if written_at is not None else {}
+        )
+        if response and _not_modified(headers, etag, written_at):
+            # answered from the stamp and the raw value, without decoding it
             response.headers.update(
                 {
                     "Cache-Control": f"max-age={ttl}",
                     "ETag": etag,
                     cache_status_header: "HIT",
+                    **date_headers,
                 },
             )
 
             response.status_code = HTTP_304_NOT_MODIFIED
             return response
 
-        cached_decoded = cast("R", self.global_ctx.coder.decode_as_type(cached, type_=self.return_type))
+        instrumentation = config.instrumentation
+        start = time.perf_counter() if instrumentation else 0.0
+        cached_decoded: Any = envelope.decode(cached) if self.returns_response else None
+        if entry is None and cached_decoded is None:
+            cached_decoded = await self.decode(cached)
+        if instrumentation:
+            namespace = self.global_ctx.namespace
+            instrumentation.observe_coder(namespace, "decode", time.perf_counter() - start)
+            instrumentation.observe_size(namespace, "get", len(cached))
         if isinstance(cached_decoded, Response):
             response = cached_decoded
 
@@ -296,55 +646,170 @@ class Cached(Generic[P, R]):
                     "Cache-Control": f"max-age={_get_max_age(ttl)}",
                     "ETag": etag,
                     cache_status_header: "HIT",
+                    **date_headers,
                 },
             )
-        return cached_decoded
-
-    async def inner(self, *args: P.args, **kwargs: P.kwargs) -> R | Response:
-        """Actual cached function wrapper."""
-        ctx = self.get_ctx()
-
-        copy_kwargs = kwargs.copy()
-        request: Request | None = copy_kwargs.pop(self.request_param.name, None)  # type: ignore[assignment]
-        response: Response | None = copy_kwargs.pop(self.response_param.name, None)  # type: ignore[assignment]
-
-        if _uncacheable(request, ctx.bypass_cache_control):
-            return await self.ensure_async_func(*args, **kwargs)
-
-        headers: Headers | dict[str, str] = request.headers if request else {}
-        no_cache = not ctx.bypass_cache_control and headers.get("Cache-Control") == "no-cache"
-        prefix = FastAPICache.get_prefix()
-        backend = FastAPICache.get_backend()
-        cache_status_header = FastAPICache.get_cache_status_header()
+        # a cached `None` result of a negative entry is returned as is
+        return cast("R | Response", cached_decoded)
+
+    async def decode(self, cached: bytes) -> Any:
+        """Decode a cached value with the coder, in the `CacheExecutor` if it is large."""
+        coder = self.global_ctx.coder
+        executor = self.config.executor
+        if executor is not None and executor.offloads("decode", len(cached)):
+            return await executor.run_coder(coder.decode_as_type, cached, type_=self.return_type)
+        return coder.decode_as_type(cached, type_=self.return_type)
+
+    async def encode(self, ctx: CacheCtx, result: Any, instrumentation: Instrumentation | None) -> bytes:
+        """Encode a computed value, in the `CacheExecutor` threads if the last value encoded was large.
+
+        Values are never encoded in its processes, pickling them to a worker would cost about as much
+        as encoding them.
+        """
+        as_envelope = self.returns_response and isinstance(result, Response)
+        executor = self.config.executor
+        if as_envelope or executor is None or not executor.offloads("encode", self.encoded_size):
+            to_cache = _encode(ctx, result, instrumentation, as_envelope)
+        else:
+            start = time.perf_counter() if instrumentation else 0.0
+            to_cache = await executor.run_sync(ctx.coder.encode, result)
+            if instrumentation:
+                instrumentation.observe_coder(ctx.namespace, "encode", time.perf_counter() - start)
+                instrumentation.observe_size(ctx.namespace, "set", len(to_cache))
+        self.encoded_size = len(to_cache)
+        return to_cache
+
+    async def build_key(
+        self,
+        ctx: CacheCtx,
+        request: Request | None,
+        response: Response | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Build the cache key of a call, `kwargs` must not contain the injected dependencies.
 
+        Requests other than GET and HEAD are keyed on a digest of their body instead of the body
+        parameters, so that equivalent JSON bodies share an entry.
+        """
+        keyed_on_body = request is not None and request.method not in ("GET", "HEAD")
+        if keyed_on_body:
+            kwargs = {name: value for name, value in kwargs.items() if name not in self.body_params}
+        namespace = f"{self.config.prefix}:{ctx.namespace}"
         cache_key = ctx.key_builder(
             self.func,
-            f"{prefix}:{ctx.namespace}",
+            namespace,
             request=request,
             response=response,
             args=args,
-            kwargs=copy_kwargs,
+            kwargs=kwargs,
         )
         if isawaitable(cache_key):
             cache_key = await cache_key
+        if self.fingerprint:
+            # in the last segment, the namespace of the key stays the one cleared by `FastAPICache.clear`
+            cache_key = f"{cache_key}~{self.fingerprint}"
+        if keyed_on_body and request is not None:
+            # an entry derived from the key, in the namespace of the key
+            cache_key = f"{cache_key}::{request.method}:{await request_body_digest(request)}"
+        return cache_key
+
+    async def cache_result(
+        self,
+        cache_key: str,
+        result: Any,
+        ttl: int | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        written_at: float | None = None,
+    ) -> tuple[str, int | None]:
+        """Encode a freshly computed result and store it in the backend.
 
-        result, ttl, from_cache = await self.get_cached_or_call(cache_key, no_cache, *args, **kwargs)
-
-        if from_cache:
-            return self.build_cached_result(result, ttl, headers, response)
+        The body of a `StreamingResponse` is stored while it is sent instead, the TTL policy doesn't
+        apply to it.
 
+        Returns:
+            Entity tag of the stored value and the expiration it was stored with.
+        """
         ctx = self.get_ctx()
-        to_cache = ctx.coder.encode(result)
+        config = self.config
+        instrumentation = config.instrumentation
+        backend = config.backend
+        tags = [f"{config.prefix}:{tag}" for tag in ctx.tags(result, args=args, kwargs=kwargs)] if ctx.tags else []
+        if isinstance(result, StreamingResponse):
+
+            async def store_manifest(manifest: bytes, manifest_ttl: int | None) -> None:
+                await _set_cached(
+                    backend,
+                    cache_key,
+                    manifest,
+                    manifest_ttl,
+                    ctx.namespace,
+                    instrumentation,
+                    tags,
+                    written_at,
+                )
+
+            write_id = streaming.capture(result, backend, cache_key, _stored_ttl(ttl, ctx.stale_ttl), store_manifest)
+            return f"W/{write_id}", ttl
+
+        if result is None and ctx.negative_expire is not None:
+            to_cache, ttl = negative.NONE, ctx.negative_expire
+        else:
+            to_cache = await self.encode(ctx, result, instrumentation)
+        if ctx.ttl_policy is not None and ttl is None:
+            # the policy applies unless the function set its own expiration through the cache context
+            ttl, reason = ctx.ttl_policy.next_ttl(cache_key, to_cache)
+            if instrumentation:
+                instrumentation.observe_ttl(ctx.namespace, reason, ttl)
+        stored_ttl = _stored_ttl(ttl, ctx.stale_ttl)
+        await _set_cached(backend, cache_key, to_cache, stored_ttl, ctx.namespace, instrumentation, tags, written_at)
+        return f"W/{hash(to_cache)}", ttl
+
+    async def warm(self, args: tuple[Any, ...], kwargs: dict[str, Any], refresh_ahead: int = 0) -> bool:
+        """Populate the cache for a call made outside of a request.
 
-        try:
-            await backend.set(cache_key, to_cache, ttl)
-        except Exception as e:
-            logger.warning(
-                "Error setting cache key '%s' in backend: '%s",
-                cache_key,
-                e,
-                exc_info=True,
-            )
+        Args:
+            args: positional arguments of the call.
+            kwargs: keyword arguments of the call, as FastAPI would pass them to the endpoint.
+            refresh_ahead: recompute values expiring within this many seconds, 0 keeps any cached value.
+
+        Returns:
+            Whether a value was computed and stored.
+        """
+        with self.cache_ctx_cycle():
+            ctx = self.get_ctx()
+            cache_key = await self.build_key(ctx, None, None, args, kwargs)
+            result, ttl, from_cache = await self.get_cached_or_call(cache_key, False, *args, **kwargs)
+            if from_cache:
+                fresh_for = _fresh_for(ttl, ctx.stale_ttl)
+                if fresh_for is None or (fresh_for >= 0 and (not refresh_ahead or fresh_for > refresh_ahead)):
+                    return False
+                result, ttl, _ = await self.get_cached_or_call(cache_key, True, *args, **kwargs)
+            await self.cache_result(cache_key, result, ttl, args, kwargs)
+            if isinstance(result, StreamingResponse):
+                # nobody reads the body of a warmed stream, drain it so that it gets stored
+                async for _ in result.body_iterator:
+                    pass
+            return True
+
+    async def build_uncached_result(
+        self,
+        cache_key: str,
+        result: Any,
+        ttl: int | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        response: Response | None,
+    ) -> None:
+        """Cache a freshly computed result and set the response cache headers."""
+        config = self.config
+        if instrumentation := config.instrumentation:
+            instrumentation.on_miss(self.get_ctx().namespace)
+        if warmer := config.warmer:
+            warmer.record(cache_key, self, args, kwargs)
+        written_at = time.time() if config.stamp_values else None
+        etag, ttl = await self.cache_result(cache_key, result, ttl, args, kwargs, written_at)
 
         if isinstance(result, Response):
             response = result
@@ -352,11 +817,59 @@ class Cached(Generic[P, R]):
             response.headers.update(
                 {
                     "Cache-Control": f"max-age={_get_max_age(ttl)}",
-                    "ETag": f"W/{hash(to_cache)}",
-                    cache_status_header: "MISS",
+                    "ETag": etag,
+                    config.cache_status_header: "MISS",
                 },
             )
+            if written_at is not None:
+                response.headers["Last-Modified"] = _last_modified(written_at)
 
+    async def inner(self, *args: P.args, **kwargs: P.kwargs) -> R | Response:
+        """Actual cached function wrapper."""
+        ctx = self.get_ctx()
+        config = self.config
+
+        copy_kwargs = kwargs.copy()
+        request: Request | None = copy_kwargs.pop(self.request_param.name, None)  # type: ignore[assignment]
+        response: Response | None = copy_kwargs.pop(self.response_param.name, None)  # type: ignore[assignment]
+
+        if _uncacheable(request, ctx.bypass_cache_control, config.backend, ctx.methods, self.cache.get_enable()):
+            return await self.ensure_async_func(*args, **kwargs)
+
+        headers: Headers | dict[str, str] = request.headers if request else {}
+        cache_control = (
+            NO_DIRECTIVES if ctx.bypass_cache_control else parse_cache_control(headers.get("Cache-Control", ""))
+        )
+
+        cache_key = await self.build_key(ctx, request, response, args, copy_kwargs)
+        if hot_keys := config.hot_keys:
+            hot_keys.add(cache_key, ctx.namespace)
+
+        # only calls made outside of the endpoint dispatch are memoized, endpoints run once per request
+        memo = request_memo_var.get() if request is None else None
+        if memo is not None and cache_key in memo:
+            return memo[cache_key]  # type: ignore[no-any-return]
+
+        resolved = await self.get_acceptable_or_call(cache_key, cache_control, *args, **kwargs)
+        if resolved is None:
+            return Response(status_code=HTTP_504_GATEWAY_TIMEOUT)
+        result, ttl, from_cache = resolved
+
+        instrumentation = config.instrumentation
+        if from_cache:
+            if instrumentation:
+                instrumentation.on_hit(ctx.namespace)
+            if request is not None and request.method == "HEAD" and isinstance(result, StreamingResponse):
+                # the body of a HEAD response is dropped, don't fetch the chunks
+                result.body_iterator = streaming.empty()
+            decoded = await self.build_cached_result(result, ttl, headers, response)
+            if memo is not None:
+                memo[cache_key] = decoded
+            return decoded
+
+        await self.build_uncached_result(cache_key, result, ttl, args, copy_kwargs, response)
+        if memo is not None:
+            memo[cache_key] = result
         return result
 
 
@@ -374,7 +887,7 @@ class CacheDecorator(Protocol):
 
 
 def cache(
-    expire: int | None | UnsetType = UNSET,
+    expire: int | TTLPolicy | None | UnsetType = UNSET,
     coder: type[Coder] | UnsetType = UNSET,
     key_builder: KeyBuilder | UnsetType = UNSET,
     namespace: str = "",
@@ -382,18 +895,43 @@ def cache(
     lock_timeout: int = 60,
     bypass_cache_control: bool = False,
     injected_dependency_namespace: str = "__fastapi_cache",
+    tags: Iterable[str] | TagsBuilder | None = None,
+    cache: str | None = None,
+    stale_ttl: int = 0,
+    methods: Iterable[str] = ("GET",),
+    negative_expire: int | None = None,
+    negative_exceptions: Iterable[type[Exception]] | Callable[[Exception], bool] = (),
+    cpu_bound: bool = False,
+    versioned: bool = False,
+    version: str | None = None,
 ) -> CacheDecorator:
     """Cache-all function.
 
     Args:
         injected_dependency_namespace: namespace to use for injecting the request and response dependencies.
         namespace: cache namespace to use when building cache keys.
-        expire: time to live for the cached value, defaults to the global expiry.
+        expire: time to live for the cached value or a `TTLPolicy` computing it, defaults to the global expiry.
         coder: coder to use to encode/decode the cached value, defaults to the global coder.
         key_builder: function to build the cache key, defaults to the global key builder.
         with_lock: whether to use a lock when fetching/setting the cache value.
         lock_timeout: timeout for the lock, defaults to 60 seconds.
         bypass_cache_control: whether to bypass the cache control headers.
+        tags: tags to attach to the cached value, or a function computing them from the result and the
+            call arguments. Tagged values are removed by `FastAPICache.invalidate_tags`.
+        cache: name of the cache instance to use, see `FastAPICache.instance`, defaults to the default instance.
+        stale_ttl: seconds expired values are kept, they are only served to requests sending a
+            `Cache-Control: max-stale` directive.
+        methods: request methods served from the cache. HEAD requests share the entries of GET ones,
+            other methods are keyed on a digest of the request body as well.
+        negative_expire: enables negative caching, `None` results and the `negative_exceptions` raised
+            are cached for this many seconds.
+        negative_exceptions: exception types to cache, or a function selecting the exceptions to cache.
+        cpu_bound: run the function in the worker processes of the `CacheExecutor`, if it has any.
+            Only applies to sync functions defined at module level.
+        versioned: end the keys with a fingerprint of the return type schema and `version`, so that
+            entries encoded for another shape of the result are never read.
+        version: version of the cached values, changing it stops reading the entries of other versions.
+            Implies `versioned`.
 
     Returns:
         Wrapped function
@@ -417,13 +955,24 @@ def cache(
         bypass_cache_control=bypass_cache_control,
         injected_request=injected_request,
         injected_response=injected_response,
+        tags=tags if tags is None or callable(tags) else _static_tags(tags),
+        stale_ttl=stale_ttl,
+        methods=frozenset(method.upper() for method in methods),
+        negative_expire=negative_expire,
+        negative_exceptions=_exception_filter(negative_exceptions),
+        cpu_bound=cpu_bound,
+        versioned=versioned,
+        version=version,
     )
 
     if not isinstance(key_builder, UnsetType):
         ctx.key_builder = key_builder
-    if not isinstance(expire, UnsetType):
+    if isinstance(expire, TTLPolicy):
+        ctx.ttl_policy = expire
+        ctx.expire = None
+    elif not isinstance(expire, UnsetType):
         ctx.expire = expire
     if not isinstance(coder, UnsetType):
         ctx.coder = coder
 
-    return partial(Cached, ctx)
+    return partial(Cached, ctx, cache_name=cache)
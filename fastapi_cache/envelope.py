@@ -0,0 +1,31 @@
+import msgspec
+from starlette.responses import Response
+
+ENVELOPE_MAGIC = b"\x00fce1"
+# never replayed to other clients
+EXCLUDED_HEADERS = frozenset({b"set-cookie"})
+
+
+class ResponseEnvelope(msgspec.Struct, array_like=True):
+    """A complete response: status code, raw ASGI headers and body."""
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+def encode(response: Response) -> bytes:
+    """Encode a response, its headers are stored as raw ASGI header pairs."""
+    headers = [(name, value) for name, value in response.raw_headers if name not in EXCLUDED_HEADERS]
+    body = response.body if isinstance(response.body, bytes) else bytes(response.body)
+    return ENVELOPE_MAGIC + msgspec.msgpack.encode(ResponseEnvelope(response.status_code, headers, body))
+
+
+def decode(value: bytes) -> Response | None:
+    """Rebuild the encoded response, returns `None` if the value is not an envelope."""
+    if not value.startswith(ENVELOPE_MAGIC):
+        return None
+    envelope = msgspec.msgpack.decode(value[len(ENVELOPE_MAGIC) :], type=ResponseEnvelope)
+    response = Response(envelope.body, status_code=envelope.status_code)
+    response.raw_headers = envelope.headers
+    return response
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from fastapi_cache.helpers.names import resolve_name
+from fastapi_cache.instrumentation import Instrumentation
+
+T = TypeVar("T")
+
+THREAD = "thread"
+PROCESS = "process"
+
+
+def _call_wrapped(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Call the function wrapped by the `cache` decorator found at `name`, in a worker process.
+
+    Decorated functions can't be pickled, the module attribute is the decorator, so the worker
+    imports it and calls the function it wraps.
+    """
+    obj = resolve_name(name, import_module=True)
+    if obj is None:
+        raise ValueError(f"No cached function found at {name!r}")
+    return getattr(obj, "__wrapped__", obj)(*args, **kwargs)
+
+
+class CacheExecutor:
+    """
+    Dedicated pools running cached sync functions
+
+    FastAPI runs sync functions in AnyIO's default thread pool, shared by every sync route of the
+    app. A burst of misses of a slow cached function would take all its threads. With an executor,
+    cached sync functions run in `threads` threads of their own, and functions decorated with
+    `cache(cpu_bound=True)` in a pool of `processes` worker processes, away from the GIL.
+
+    Functions offloaded to processes must be defined at module level, their arguments and results
+    must be picklable.
+
+    Encoding and decoding large values would block the event loop, values larger than
+    `encode_threshold` and `decode_threshold` bytes are coded in the executor threads instead, large
+    values are decoded in its processes with `coder_pool="process"`. Values are always encoded in
+    threads, pickling them to a worker process would cost about as much as encoding them. The size of
+    a value to encode isn't known beforehand, the size of the last value encoded for the same
+    function is used.
+
+    Usage:
+        >> FastAPICache.init(backend, executor=CacheExecutor(threads=16, processes=4))
+    """
+
+    def __init__(
+        self,
+        threads: int = 16,
+        processes: int = 0,
+        instrumentation: Instrumentation | None = None,
+        encode_threshold: int | None = 1024**2,
+        decode_threshold: int | None = 1024**2,
+        coder_pool: str = THREAD,
+    ) -> None:
+        """
+        Args:
+            threads: threads running cached sync functions.
+            processes: worker processes running CPU-bound functions, 0 runs them in threads too.
+            instrumentation: receives the queue depth of the pools.
+            encode_threshold: size in bytes from which values are encoded in the executor, `None` never.
+            decode_threshold: size in bytes from which values are decoded in the executor, `None` never.
+            coder_pool: pool decoding large values, `thread` or `process`.
+        """
+        if coder_pool not in (THREAD, PROCESS):
+            raise ValueError(f"coder_pool must be {THREAD!r} or {PROCESS!r}")
+        self.limiter = CapacityLimiter(threads)
+        self.threads = threads
+        self.processes = processes
+        self.instrumentation = instrumentation
+        self.encode_threshold = encode_threshold
+        self.decode_threshold = decode_threshold
+        self.coder_pool = coder_pool
+        self._process_pool = ProcessPoolExecutor(processes) if processes else None
+        self._tasks = {THREAD: 0, PROCESS: 0}
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a thread or a worker process."""
+        return max(0, self._tasks[THREAD] - self.threads) + max(0, self._tasks[PROCESS] - self.processes)
+
+    @contextmanager
+    def _submit(self, pool: str, size: int) -> Generator[None, None, None]:
+        self._tasks[pool] += 1
+        if self.instrumentation:
+            self.instrumentation.observe_queue_depth(pool, max(0, self._tasks[pool] - size))
+        try:
+            yield
+        finally:
+            self._tasks[pool] -= 1
+
+    async def run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `func` in one of the executor threads."""
+        with self._submit(THREAD, self.threads):
+            return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=self.limiter)
+
+    async def run_process(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run the cached function found at `name` (`module:qualname`) in a worker process."""
+        if self._process_pool is None:
+            return await self.run_sync(_call_wrapped, name, args, kwargs)
+        with self._submit(PROCESS, self.processes):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._process_pool, _call_wrapped, name, args, kwargs)
+
+    def offloads(self, operation: str, size: int) -> bool:
+        """Whether a coder `operation` (`encode`, `decode`) of `size` bytes runs in the executor."""
+        threshold = self.encode_threshold if operation == "encode" else self.decode_threshold
+        return threshold is not None and size >= threshold
+
+    async def run_coder(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a coder decoding method in the coder pool."""
+        if self.coder_pool == THREAD or self._process_pool is None:
+            return await self.run_sync(func, *args, **kwargs)
+        with self._submit(PROCESS, self.processes):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._process_pool, partial(func, *args, **kwargs))
+
+    def close(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
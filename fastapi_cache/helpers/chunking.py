@@ -0,0 +1,38 @@
+import secrets
+
+import msgspec
+
+MANIFEST_MAGIC = b"\x00fcm1"
+
+
+class Manifest(msgspec.Struct, array_like=True):
+    """Describes a value stored as several numbered chunk entries."""
+
+    write_id: str
+    chunks: int
+    size: int
+
+
+def split(value: bytes, chunk_size: int) -> tuple[Manifest, list[bytes]]:
+    """Split a value into chunks and describe them with a new manifest."""
+    chunks = [value[i : i + chunk_size] for i in range(0, len(value), chunk_size)]
+    return Manifest(write_id=secrets.token_hex(8), chunks=len(chunks), size=len(value)), chunks
+
+
+def join(manifest: Manifest, chunks: list[bytes | None]) -> bytes | None:
+    """Reassemble chunks, returns `None` if any chunk is missing."""
+    if len(chunks) != manifest.chunks or any(chunk is None for chunk in chunks):
+        return None
+    value = b"".join(chunks)  # type: ignore[arg-type]
+    return value if len(value) == manifest.size else None
+
+
+def encode_manifest(manifest: Manifest) -> bytes:
+    return MANIFEST_MAGIC + msgspec.msgpack.encode(manifest)
+
+
+def decode_manifest(value: bytes) -> Manifest | None:
+    """Decode a manifest, returns `None` if the value is a regular one."""
+    if not value.startswith(MANIFEST_MAGIC):
+        return None
+    return msgspec.msgpack.decode(value[len(MANIFEST_MAGIC) :], type=Manifest)
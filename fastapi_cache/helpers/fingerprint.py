@@ -0,0 +1,36 @@
+import hashlib
+from contextlib import suppress
+from typing import Any
+
+import msgspec
+from pydantic import TypeAdapter
+
+
+def _without_descriptions(schema: Any) -> Any:
+    # descriptions come from docstrings, editing them doesn't change the encoded values
+    if isinstance(schema, dict):
+        return {
+            key: _without_descriptions(value)
+            for key, value in schema.items()
+            if not (key == "description" and isinstance(value, str))
+        }
+    if isinstance(schema, list):
+        return [_without_descriptions(value) for value in schema]
+    return schema
+
+
+def _schema(type_: Any) -> Any:
+    """JSON schema of a type, from pydantic or msgspec, its representation for other types."""
+    with suppress(Exception):
+        return _without_descriptions(TypeAdapter(type_).json_schema())
+    with suppress(Exception):
+        return _without_descriptions(msgspec.json.schema(type_))
+    return repr(type_)
+
+
+def schema_fingerprint(type_: Any, version: str | None = None) -> str | None:
+    """Short digest of the schema of `type_` and `version`, `None` if there is neither."""
+    if type_ is None and version is None:
+        return None
+    schema = msgspec.json.encode([_schema(type_) if type_ is not None else None, version], order="sorted")
+    return hashlib.blake2b(schema, digest_size=4).hexdigest()
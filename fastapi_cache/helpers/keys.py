@@ -0,0 +1,11 @@
+def namespace_of(key: str, separator: str = ":") -> str:
+    """Namespace of a cache key, the key without its last segment.
+
+    Entries derived from a key (chunks, streamed bodies, request bodies) append `::<kind>:<id>` to
+    it and belong to the namespace of that key.
+    """
+    base, derived, suffix = key.rpartition("::")
+    while derived and separator in suffix:
+        key = base
+        base, derived, suffix = key.rpartition("::")
+    return key.rpartition(separator)[0].rstrip(separator)
@@ -0,0 +1,28 @@
+import importlib
+import sys
+from typing import Any
+
+
+def qualified_name(obj: Any) -> str:
+    """Name of a class or function in the `module:qualname` form read by `resolve_name`."""
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def resolve_name(name: str, import_module: bool = False) -> Any:
+    """Object found at a `module:qualname` name, `None` if there is none.
+
+    Only modules already imported are looked up, names read from a backend can't make the process
+    import anything. Callers resolving names of their own set `import_module`.
+    """
+    module_name, _, qualname = name.partition(":")
+    obj: Any
+    if import_module:
+        try:
+            obj = importlib.import_module(module_name)
+        except ImportError:
+            return None
+    else:
+        obj = sys.modules.get(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    return obj
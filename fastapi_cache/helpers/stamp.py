@@ -0,0 +1,27 @@
+import struct
+import time
+
+STAMP_MAGIC = b"\x00fct1"
+# write timestamp
+HEADER = struct.Struct(">d")
+
+
+class Stamped(bytes):
+    """A cached value together with the time it was written at."""
+
+    written_at: float
+
+
+def stamp(value: bytes, written_at: float | None = None) -> bytes:
+    """Prefix a value with its write timestamp, defaults to now."""
+    return STAMP_MAGIC + HEADER.pack(time.time() if written_at is None else written_at) + value
+
+
+def unstamp(value: bytes) -> bytes:
+    """Strip the write timestamp of a value, returns values written without one unchanged."""
+    if not value.startswith(STAMP_MAGIC):
+        return value
+    offset = len(STAMP_MAGIC) + HEADER.size
+    stamped = Stamped(value[offset:])
+    (stamped.written_at,) = HEADER.unpack_from(value, len(STAMP_MAGIC))
+    return stamped
@@ -0,0 +1,189 @@
+import asyncio
+import contextlib
+import hashlib
+import heapq
+import logging
+import time
+from collections.abc import Callable
+
+from msgspec import Struct
+
+logger: logging.Logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class CountMinSketch:
+    """Approximate counts of a stream in `width * depth` counters.
+
+    Estimates never undercount; with probability `1 - 0.5 ** depth` they overcount by at most
+    `2 / width` of the total count.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4) -> None:
+        if not 0 < depth <= 8:
+            raise ValueError("Expected 0 < depth <= 8")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=8 * self.depth).digest()
+        return [int.from_bytes(digest[i * 8 : i * 8 + 8], "little") % self.width for i in range(self.depth)]
+
+    def add(self, item: str, count: int = 1) -> int:
+        """Count `item` and return its new estimate."""
+        self.total += count
+        estimate = None
+        for row, index in zip(self._rows, self._indexes(item), strict=True):
+            row[index] += count
+            estimate = row[index] if estimate is None else min(estimate, row[index])
+        return estimate or 0
+
+    def estimate(self, item: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(item), strict=True))
+
+    def clear(self) -> None:
+        self.total = 0
+        self._rows = [[0] * self.width for _ in range(self.depth)]
+
+
+class TopK:
+    """Space-Saving top-k over the estimates of a `CountMinSketch`.
+
+    Keeps at most `k` items: an item that isn't tracked replaces the tracked item with the lowest
+    estimate once its own estimate exceeds it.
+    """
+
+    def __init__(self, k: int = 100, width: int = 2048, depth: int = 4) -> None:
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self._top: dict[str, int] = {}
+        # (estimate, item) of the tracked items, estimates only grow so an update pushes a new entry
+        # and the outdated ones are dropped when they reach the top of the heap
+        self._heap: list[tuple[int, str]] = []
+
+    def _push(self, item: str, estimate: int) -> None:
+        self._top[item] = estimate
+        if len(self._heap) >= 2 * self.k:
+            self._heap = [(count, key) for key, count in self._top.items()]
+            heapq.heapify(self._heap)
+        else:
+            heapq.heappush(self._heap, (estimate, item))
+
+    def _min(self) -> tuple[int, str]:
+        while self._top.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def add(self, item: str) -> None:
+        estimate = self.sketch.add(item)
+        if item in self._top or len(self._top) < self.k:
+            self._push(item, estimate)
+        elif self._top:
+            min_estimate, min_item = self._min()
+            if estimate > min_estimate:
+                heapq.heappop(self._heap)
+                del self._top[min_item]
+                self._push(item, estimate)
+
+    def items(self) -> list[tuple[str, int]]:
+        """Tracked items with their estimated counts, most frequent first."""
+        return sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+
+    def clear(self) -> None:
+        self.sketch.clear()
+        self._top.clear()
+        self._heap.clear()
+
+
+class HotKeysSnapshot(Struct):
+    started_at: float
+    taken_at: float
+    total: int
+    keys: list[tuple[str, int]]
+    namespaces: list[tuple[str, int]]
+
+
+class HotKeys:
+    """In-process heavy hitters over the cache keys and namespaces looked up by the decorator.
+
+    Memory is fixed by `k`, `width` and `depth`, and every lookup costs one hash and a few counter
+    updates. Counts are estimates: they may be overcounted by collisions but never undercounted.
+
+    Usage:
+        >> hot_keys = HotKeys(k=50)
+        >> FastAPICache.init(backend, hot_keys=hot_keys)
+        >> hot_keys.start(interval=60)  # log the top keys every minute
+        >> hot_keys.snapshot().keys
+    """
+
+    def __init__(self, k: int = 100, width: int = 2048, depth: int = 4, namespaces: int = 20) -> None:
+        """
+        Args:
+            k: number of hot keys to track.
+            width: counters per row of the sketches.
+            depth: rows of the sketches, each one hashed independently.
+            namespaces: number of hot namespaces to track.
+        """
+        self._keys = TopK(k, width, depth)
+        self._namespaces = TopK(namespaces, width, depth)
+        self._started_at = time.time()
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, key: str, namespace: str) -> None:
+        """Count a lookup of `key` in `namespace`."""
+        self._keys.add(key)
+        self._namespaces.add(namespace)
+
+    def snapshot(self) -> HotKeysSnapshot:
+        return HotKeysSnapshot(
+            started_at=self._started_at,
+            taken_at=time.time(),
+            total=self._keys.sketch.total,
+            keys=self._keys.items(),
+            namespaces=self._namespaces.items(),
+        )
+
+    def reset(self) -> None:
+        self._keys.clear()
+        self._namespaces.clear()
+        self._started_at = time.time()
+
+    @staticmethod
+    def _log(snapshot: HotKeysSnapshot) -> None:
+        logger.info("Hot cache keys over %d lookups: %s", snapshot.total, snapshot.keys)
+
+    async def _run(self, interval: float, sink: Callable[[HotKeysSnapshot], None], reset: bool) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                sink(self.snapshot())
+            except Exception:
+                logger.warning("Error dumping hot keys:", exc_info=True)
+            if reset:
+                self.reset()
+
+    def start(
+        self,
+        interval: float,
+        sink: Callable[[HotKeysSnapshot], None] | None = None,
+        reset: bool = True,
+    ) -> None:
+        """Periodically pass a snapshot to `sink`, logging it by default.
+
+        Args:
+            interval: seconds between snapshots.
+            sink: receives every snapshot.
+            reset: start counting from zero after every snapshot, so each one covers a single interval.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval, sink or self._log, reset))
+
+    async def stop(self) -> None:
+        """Stop the periodic dump started by `start`."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
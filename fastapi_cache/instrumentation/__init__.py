@@ -0,0 +1,18 @@
+from fastapi_cache.instrumentation.base import Instrumentation
+
+__all__ = ["Instrumentation"]
+
+# import each adapter in turn and add to __all__, adapters depend on optional packages.
+try:
+    from fastapi_cache.instrumentation import prometheus
+except ImportError:
+    pass
+else:
+    __all__ += ["prometheus"]
+
+try:
+    from fastapi_cache.instrumentation import opentelemetry
+except ImportError:
+    pass
+else:
+    __all__ += ["opentelemetry"]
@@ -0,0 +1,44 @@
+class Instrumentation:
+    """Receives cache events from the `cache` decorator.
+
+    Every hook is a no-op, subclasses override the ones they are interested in. Hooks are called
+    inline on the request path, so they should only update in-memory metrics.
+
+    When no instrumentation is configured the decorator doesn't call any hooks nor measure time.
+    """
+
+    def on_hit(self, namespace: str) -> None:
+        """A value was served from the cache."""
+
+    def on_miss(self, namespace: str) -> None:
+        """A value was not cached (or the cache was bypassed) and had to be computed."""
+
+    def on_stale(self, namespace: str) -> None:
+        """An expired value was served from the cache."""
+
+    def on_error(self, namespace: str, operation: str) -> None:
+        """A backend `operation` (`get`, `set`) failed."""
+
+    def on_coalesced(self, namespace: str) -> None:
+        """A caller waited on the lock and got the value computed by another caller."""
+
+    def observe_backend(self, namespace: str, operation: str, seconds: float) -> None:
+        """Latency of a backend `operation` (`get`, `set`)."""
+
+    def observe_coder(self, namespace: str, operation: str, seconds: float) -> None:
+        """Latency of a coder `operation` (`encode`, `decode`)."""
+
+    def observe_size(self, namespace: str, operation: str, size: int) -> None:
+        """Size in bytes of an encoded payload read (`get`) or written (`set`)."""
+
+    def observe_lock_wait(self, namespace: str, seconds: float) -> None:
+        """Time spent waiting to acquire the lock."""
+
+    def observe_ttl(self, namespace: str, reason: str, ttl: int | None) -> None:
+        """TTL chosen by a `TTLPolicy` for a freshly computed value and the reason for it."""
+
+    def on_breaker_state(self, name: str, state: str) -> None:
+        """A `CircuitBreakerBackend` changed state (`closed`, `open`, `half_open`)."""
+
+    def observe_queue_depth(self, pool: str, depth: int) -> None:
+        """Calls waiting in a `CacheExecutor` `pool` (`thread`, `process`) when a call is submitted, itself included."""
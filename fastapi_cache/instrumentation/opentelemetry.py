@@ -0,0 +1,126 @@
+import time
+from collections.abc import Iterable
+
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from fastapi_cache.instrumentation.base import Instrumentation
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    OpenTelemetry instrumentation
+
+    Records cache metrics with the global (or given) meter provider. With `trace_backend=True`
+    every backend operation is also recorded as a span of the current trace.
+
+    Usage:
+        >> FastAPICache.init(backend, instrumentation=OpenTelemetryInstrumentation())
+    """
+
+    def __init__(
+        self,
+        meter_provider: metrics.MeterProvider | None = None,
+        tracer_provider: trace.TracerProvider | None = None,
+        trace_backend: bool = False,
+    ) -> None:
+        """Create cache instruments.
+
+        Args:
+            meter_provider: meter provider, defaults to the global one.
+            tracer_provider: tracer provider, defaults to the global one.
+            trace_backend: whether to record backend operations as spans.
+        """
+        meter = metrics.get_meter("fastapi_cache", meter_provider=meter_provider)
+        self.tracer = trace.get_tracer("fastapi_cache", tracer_provider=tracer_provider) if trace_backend else None
+        self.requests = meter.create_counter("fastapi_cache.requests", description="Cache lookups by result.")
+        self.errors = meter.create_counter("fastapi_cache.errors", description="Failed backend operations.")
+        self.coalesced = meter.create_counter(
+            "fastapi_cache.coalesced",
+            description="Callers served by a value computed while they waited on the lock.",
+        )
+        self.backend_duration = meter.create_histogram(
+            "fastapi_cache.backend.duration",
+            unit="s",
+            description="Backend operation latency.",
+        )
+        self.coder_duration = meter.create_histogram(
+            "fastapi_cache.coder.duration",
+            unit="s",
+            description="Coder encode/decode latency.",
+        )
+        self.payload_size = meter.create_histogram(
+            "fastapi_cache.payload.size",
+            unit="By",
+            description="Encoded payload size.",
+        )
+        self.lock_wait = meter.create_histogram(
+            "fastapi_cache.lock.wait",
+            unit="s",
+            description="Time spent waiting for the lock.",
+        )
+        self.ttl = meter.create_histogram(
+            "fastapi_cache.ttl",
+            unit="s",
+            description="TTL chosen by a TTL policy, by reason.",
+        )
+        self.queue_depth = meter.create_histogram(
+            "fastapi_cache.executor.queue_depth",
+            description="Calls queued in the executor pool when a call was submitted.",
+        )
+        self.breaker_states: dict[str, str] = {}
+        meter.create_observable_gauge(
+            "fastapi_cache.breaker.open",
+            callbacks=[self._observe_breakers],
+            description="Circuit breaker state: 0 closed, 0.5 half open, 1 open.",
+        )
+
+    def _observe_breakers(self, _: CallbackOptions) -> Iterable[Observation]:
+        values = {"closed": 0.0, "half_open": 0.5, "open": 1.0}
+        return [Observation(values[state], {"name": name}) for name, state in self.breaker_states.items()]
+
+    def on_hit(self, namespace: str) -> None:
+        self.requests.add(1, {"namespace": namespace, "result": "hit"})
+
+    def on_miss(self, namespace: str) -> None:
+        self.requests.add(1, {"namespace": namespace, "result": "miss"})
+
+    def on_stale(self, namespace: str) -> None:
+        self.requests.add(1, {"namespace": namespace, "result": "stale"})
+
+    def on_error(self, namespace: str, operation: str) -> None:
+        self.errors.add(1, {"namespace": namespace, "operation": operation})
+
+    def on_coalesced(self, namespace: str) -> None:
+        self.coalesced.add(1, {"namespace": namespace})
+
+    def observe_backend(self, namespace: str, operation: str, seconds: float) -> None:
+        attributes = {"namespace": namespace, "operation": operation}
+        self.backend_duration.record(seconds, attributes)
+        if self.tracer:
+            end = time.time_ns()
+            span = self.tracer.start_span(
+                f"fastapi_cache.{operation}",
+                start_time=end - int(seconds * 1e9),
+                attributes=attributes,
+            )
+            span.end(end_time=end)
+
+    def observe_coder(self, namespace: str, operation: str, seconds: float) -> None:
+        self.coder_duration.record(seconds, {"namespace": namespace, "operation": operation})
+
+    def observe_size(self, namespace: str, operation: str, size: int) -> None:
+        self.payload_size.record(size, {"namespace": namespace, "operation": operation})
+
+    def observe_lock_wait(self, namespace: str, seconds: float) -> None:
+        self.lock_wait.record(seconds, {"namespace": namespace})
+
+    def observe_ttl(self, namespace: str, reason: str, ttl: int | None) -> None:
+        if ttl is not None:
+            self.ttl.record(ttl, {"namespace": namespace, "reason": reason})
+
+    def on_breaker_state(self, name: str, state: str) -> None:
+        self.breaker_states[name] = state
+
+    def observe_queue_depth(self, pool: str, depth: int) -> None:
+        self.queue_depth.record(depth, {"pool": pool})
@@ -0,0 +1,125 @@
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Enum, Histogram
+
+from fastapi_cache.instrumentation.base import Instrumentation
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+TTL_BUCKETS = (1, 5, 15, 30, 60, 300, 900, 1800, 3600, 21600, 86400)
+QUEUE_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Prometheus instrumentation
+
+    Usage:
+        >> FastAPICache.init(backend, instrumentation=PrometheusInstrumentation())
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY, prefix: str = "fastapi_cache") -> None:
+        """Create and register cache metrics.
+
+        Args:
+            registry: registry to register the metrics in.
+            prefix: prefix of metric names.
+        """
+        self.requests = Counter(
+            f"{prefix}_requests",
+            "Cache lookups by result.",
+            ["namespace", "result"],
+            registry=registry,
+        )
+        self.errors = Counter(
+            f"{prefix}_errors",
+            "Failed backend operations.",
+            ["namespace", "operation"],
+            registry=registry,
+        )
+        self.coalesced = Counter(
+            f"{prefix}_coalesced",
+            "Callers served by a value computed while they waited on the lock.",
+            ["namespace"],
+            registry=registry,
+        )
+        self.backend_duration = Histogram(
+            f"{prefix}_backend_duration_seconds",
+            "Backend operation latency.",
+            ["namespace", "operation"],
+            registry=registry,
+        )
+        self.coder_duration = Histogram(
+            f"{prefix}_coder_duration_seconds",
+            "Coder encode/decode latency.",
+            ["namespace", "operation"],
+            registry=registry,
+        )
+        self.payload_size = Histogram(
+            f"{prefix}_payload_size_bytes",
+            "Encoded payload size.",
+            ["namespace", "operation"],
+            buckets=SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.lock_wait = Histogram(
+            f"{prefix}_lock_wait_seconds",
+            "Time spent waiting for the lock.",
+            ["namespace"],
+            registry=registry,
+        )
+        self.ttl = Histogram(
+            f"{prefix}_ttl_seconds",
+            "TTL chosen by a TTL policy, by reason.",
+            ["namespace", "reason"],
+            buckets=TTL_BUCKETS,
+            registry=registry,
+        )
+        self.breaker_state = Enum(
+            f"{prefix}_breaker_state",
+            "Circuit breaker state.",
+            ["name"],
+            states=["closed", "open", "half_open"],
+            registry=registry,
+        )
+        self.queue_depth = Histogram(
+            f"{prefix}_executor_queue_depth",
+            "Calls queued in the executor pool when a call was submitted.",
+            ["pool"],
+            buckets=QUEUE_BUCKETS,
+            registry=registry,
+        )
+
+    def on_hit(self, namespace: str) -> None:
+        self.requests.labels(namespace, "hit").inc()
+
+    def on_miss(self, namespace: str) -> None:
+        self.requests.labels(namespace, "miss").inc()
+
+    def on_stale(self, namespace: str) -> None:
+        self.requests.labels(namespace, "stale").inc()
+
+    def on_error(self, namespace: str, operation: str) -> None:
+        self.errors.labels(namespace, operation).inc()
+
+    def on_coalesced(self, namespace: str) -> None:
+        self.coalesced.labels(namespace).inc()
+
+    def observe_backend(self, namespace: str, operation: str, seconds: float) -> None:
+        self.backend_duration.labels(namespace, operation).observe(seconds)
+
+    def observe_coder(self, namespace: str, operation: str, seconds: float) -> None:
+        self.coder_duration.labels(namespace, operation).observe(seconds)
+
+    def observe_size(self, namespace: str, operation: str, size: int) -> None:
+        self.payload_size.labels(namespace, operation).observe(size)
+
+    def observe_lock_wait(self, namespace: str, seconds: float) -> None:
+        self.lock_wait.labels(namespace).observe(seconds)
+
+    def observe_ttl(self, namespace: str, reason: str, ttl: int | None) -> None:
+        if ttl is not None:
+            self.ttl.labels(namespace, reason).observe(ttl)
+
+    def on_breaker_state(self, name: str, state: str) -> None:
+        self.breaker_state.labels(name).state(state)
+
+    def observe_queue_depth(self, pool: str, depth: int) -> None:
+        self.queue_depth.labels(pool).observe(depth)
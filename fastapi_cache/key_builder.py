@@ -1,7 +1,9 @@
 import hashlib
 from collections.abc import Callable
+from contextlib import suppress
 from typing import Any
 
+import msgspec
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -19,3 +21,15 @@ def default_key_builder(
         f"{func.__module__}:{func.__name__}:{args}:{kwargs}".encode(),
     ).hexdigest()
     return f"{namespace}:{cache_key}"
+
+
+async def request_body_digest(request: Request) -> str:
+    """Digest of the request body, JSON bodies are canonicalized first so that key order and whitespace don't matter.
+
+    Starlette keeps the body on the request once read, so FastAPI still parses it for the endpoint.
+    """
+    body = await request.body()
+    if body and "json" in request.headers.get("content-type", ""):
+        with suppress(msgspec.DecodeError):
+            body = msgspec.json.encode(msgspec.json.decode(body), order="sorted")
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
@@ -0,0 +1,27 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fastapi_cache.context import request_memo
+
+
+class RequestMemoMiddleware:
+    """
+    Request-scoped memoization of cached functions
+
+    Within a request, repeated calls to a function decorated with `cache` that isn't the endpoint
+    itself return the object decoded (or computed) by the first call, without a backend round trip.
+    The memo is dropped when the request ends. Memoized objects are shared between the calls, so
+    they should not be mutated.
+
+    Usage:
+        >> app.add_middleware(RequestMemoMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_memo():
+            await self.app(scope, receive, send)
@@ -0,0 +1,84 @@
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import msgspec
+from starlette.exceptions import HTTPException
+
+from fastapi_cache.helpers.names import qualified_name, resolve_name
+
+logger: logging.Logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+NEGATIVE_MAGIC = b"\x00fcn1"
+
+
+class NegativeEntry(msgspec.Struct, array_like=True, omit_defaults=True):
+    """A cached `None` result or a raised exception, `exc_type` is `None` for the former."""
+
+    exc_type: str | None = None
+    args: list[Any] = []
+    status_code: int = 0
+    detail: Any = None
+    headers: dict[str, str] | None = None
+
+    def rebuild(self) -> Exception | None:
+        """The cached exception, `None` if its type isn't an exception class of an imported module.
+
+        Values read from the backend aren't trusted, modules are never imported and only exception
+        classes are called, anything else found at `exc_type` is refused.
+        """
+        if self.exc_type is None:
+            return None
+        cls = resolve_name(self.exc_type)
+        if not (isinstance(cls, type) and issubclass(cls, Exception)):
+            return None
+        if issubclass(cls, HTTPException):
+            return cls(status_code=self.status_code, detail=self.detail, headers=self.headers)
+        return cls(*self.args)
+
+    def replayable(self, accepts: Callable[[Exception], bool] | None) -> bool:
+        """Whether the entry is a cached `None` or an exception selected by the negative caching filter."""
+        if self.exc_type is None:
+            return True
+        exc = self.rebuild()
+        return exc is not None and accepts is not None and accepts(exc)
+
+    def replay(self, accepts: Callable[[Exception], bool] | None) -> None:
+        """Raise the cached exception again, returns for a cached `None`.
+
+        Raises:
+            ValueError: the exception isn't selected by the negative caching filter `accepts`.
+        """
+        if self.exc_type is None:
+            return
+        exc = self.rebuild()
+        if exc is None or accepts is None or not accepts(exc):
+            raise ValueError(f"Refusing to replay {self.exc_type!r}, it isn't selected for negative caching")
+        raise exc
+
+
+NONE = NEGATIVE_MAGIC + msgspec.msgpack.encode(NegativeEntry())
+
+
+def encode_exception(exc: Exception) -> bytes | None:
+    """Encode an exception to replay it, `None` if its arguments can't be encoded."""
+    cls = type(exc)
+    entry = NegativeEntry(qualified_name(cls))
+    if isinstance(exc, HTTPException):
+        entry.status_code, entry.detail = exc.status_code, exc.detail
+        entry.headers = dict(exc.headers) if exc.headers is not None else None
+    else:
+        entry.args = list(exc.args)
+    try:
+        return NEGATIVE_MAGIC + msgspec.msgpack.encode(entry)
+    except TypeError:
+        logger.warning("Can't cache exception %r, its arguments can't be encoded", exc)
+        return None
+
+
+def decode(value: bytes) -> NegativeEntry | None:
+    """Decode a negative entry, returns `None` if the value is a regular one."""
+    if not value.startswith(NEGATIVE_MAGIC):
+        return None
+    return msgspec.msgpack.decode(value[len(NEGATIVE_MAGIC) :], type=NegativeEntry)
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import secrets
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import msgspec
+from starlette.responses import StreamingResponse
+
+from fastapi_cache.types import Backend
+
+logger: logging.Logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+STREAM_MAGIC = b"\x00fcs1"
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+class StreamManifest(msgspec.Struct, array_like=True):
+    """Describes a streamed response stored as numbered chunk entries."""
+
+    write_id: str
+    chunks: int
+    size: int
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+
+
+def chunk_key(cache_key: str, write_id: str, index: int) -> str:
+    return f"{cache_key}::stream:{write_id}:{index}"
+
+
+def encode_manifest(manifest: StreamManifest) -> bytes:
+    return STREAM_MAGIC + msgspec.msgpack.encode(manifest)
+
+
+def decode_manifest(value: bytes) -> StreamManifest | None:
+    """Decode a stream manifest, returns `None` if the value is a regular one."""
+    if not value.startswith(STREAM_MAGIC):
+        return None
+    return msgspec.msgpack.decode(value[len(STREAM_MAGIC) :], type=StreamManifest)
+
+
+def capture(
+    response: StreamingResponse,
+    backend: Backend,
+    cache_key: str,
+    ttl: int | None,
+    store_manifest: Callable[[bytes, int | None], Awaitable[None]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    """Tee the body of a streaming response to the backend while it is sent.
+
+    Every part of the body is passed on to the client before it is buffered, and buffered parts
+    are written as chunk entries of about `chunk_size` bytes. The manifest is handed to
+    `store_manifest` once the body is complete, so an interrupted stream is never served.
+
+    Returns:
+        Identifier of this write, usable as an entity tag.
+    """
+    write_id = secrets.token_hex(8)
+    body = response.body_iterator
+    headers = [(name, value) for name, value in response.raw_headers if name != b"content-length"]
+
+    async def tee() -> AsyncGenerator[str | bytes | memoryview, None]:
+        started = time.monotonic()
+        buffer = bytearray()
+        chunks = size = 0
+        capturing = True
+
+        async def flush() -> None:
+            nonlocal chunks, capturing
+            try:
+                await backend.set(chunk_key(cache_key, write_id, chunks), bytes(buffer), ttl)
+            except Exception:
+                logger.warning("Error caching stream chunk of '%s':", cache_key, exc_info=True)
+                capturing = False
+            chunks += 1
+            buffer.clear()
+
+        async for part in body:
+            yield part
+            if not capturing:
+                continue
+            data = part.encode(response.charset) if isinstance(part, str) else part
+            buffer += data
+            size += len(data)
+            if len(buffer) >= chunk_size:
+                await flush()
+        if capturing and buffer:
+            await flush()
+        if capturing:
+            manifest = StreamManifest(write_id, chunks, size, response.status_code, headers)
+            # chunks were written over the duration of the stream, the manifest must not outlive the first one
+            remaining = None if not ttl else max(1, ttl - int(time.monotonic() - started))
+            await store_manifest(encode_manifest(manifest), remaining)
+
+    response.body_iterator = tee()
+    return write_id
+
+
+async def _replay(
+    backend: Backend,
+    cache_key: str,
+    manifest: StreamManifest,
+    first: bytes,
+) -> AsyncGenerator[bytes, None]:
+    chunk: bytes | None = first
+    for index in range(1, manifest.chunks + 1):
+        # fetch the next chunk while the current one is sent
+        next_chunk = (
+            asyncio.ensure_future(backend.get(chunk_key(cache_key, manifest.write_id, index)))
+            if index < manifest.chunks
+            else None
+        )
+        try:
+            yield chunk  # type: ignore[misc]
+        except BaseException:
+            if next_chunk:
+                next_chunk.cancel()
+            raise
+        if next_chunk:
+            chunk = await next_chunk
+            if chunk is None:
+                raise RuntimeError(f"Chunk {index} of cached stream '{cache_key}' is missing")
+
+
+async def empty() -> AsyncGenerator[bytes, None]:
+    """Body of a replayed stream answering a HEAD request."""
+    yield b""
+
+
+async def replay(backend: Backend, cache_key: str, manifest: StreamManifest) -> StreamingResponse | None:
+    """Stream a cached response from its chunk entries, `None` if it has been evicted."""
+    if not manifest.chunks:
+        first = b""
+    else:
+        first_chunk = await backend.get(chunk_key(cache_key, manifest.write_id, 0))
+        if first_chunk is None:
+            return None
+        first = first_chunk
+    response = StreamingResponse(_replay(backend, cache_key, manifest, first), status_code=manifest.status_code)
+    response.raw_headers = [*manifest.headers, (b"etag", f"W/{manifest.write_id}".encode())]
+    return response
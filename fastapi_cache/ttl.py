@@ -0,0 +1,59 @@
+import abc
+import hashlib
+from collections import OrderedDict
+
+
+class TTLPolicy(abc.ABC):
+    """Computes the expiration of a freshly computed value, can be passed as `expire`."""
+
+    @abc.abstractmethod
+    def next_ttl(self, key: str, value: bytes) -> tuple[int | None, str]:
+        """Return the expiration for `value` cached under `key` and a short reason for it."""
+
+
+class AdaptiveTTL(TTLPolicy):
+    """Adapt the TTL of every key to how often its content changes.
+
+    On every recompute the new payload hash is compared with the previous one for the same key:
+    unchanged content multiplies the TTL by `grow`, changed content multiplies it by `shrink`,
+    always staying within `[min_ttl, max_ttl]`. State is kept in process for the `max_keys`
+    most recently computed keys.
+
+    Usage:
+        >> @cache(expire=AdaptiveTTL(initial=60, min_ttl=10, max_ttl=3600))
+        >> async def report(): ...
+    """
+
+    def __init__(
+        self,
+        initial: int = 60,
+        min_ttl: int = 1,
+        max_ttl: int = 3600,
+        grow: float = 2.0,
+        shrink: float = 0.5,
+        max_keys: int = 10_000,
+    ) -> None:
+        if not 0 < min_ttl <= initial <= max_ttl:
+            raise ValueError("Expected 0 < min_ttl <= initial <= max_ttl")
+        self.initial = initial
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.grow = grow
+        self.shrink = shrink
+        self.max_keys = max_keys
+        self._state: OrderedDict[str, tuple[bytes, int]] = OrderedDict()
+
+    def next_ttl(self, key: str, value: bytes) -> tuple[int | None, str]:
+        digest = hashlib.blake2b(value, digest_size=16).digest()
+        previous = self._state.pop(key, None)
+        if previous is None:
+            ttl, reason = self.initial, "initial"
+        elif previous[0] == digest:
+            ttl, reason = min(self.max_ttl, round(previous[1] * self.grow)), "unchanged"
+        else:
+            ttl, reason = max(self.min_ttl, round(previous[1] * self.shrink)), "changed"
+
+        self._state[key] = (digest, ttl)
+        if len(self._state) > self.max_keys:
+            self._state.popitem(last=False)
+        return ttl, reason
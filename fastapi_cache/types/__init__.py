@@ -1,4 +1,4 @@
 from .backend import Backend
-from .protocols import KeyBuilder
+from .protocols import KeyBuilder, TagsBuilder
 
-__all__ = ["Backend", "KeyBuilder"]
+__all__ = ["Backend", "KeyBuilder", "TagsBuilder"]
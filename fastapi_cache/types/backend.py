@@ -1,9 +1,21 @@
 import abc
+import asyncio
+import time
+import weakref
+from collections.abc import Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from functools import cached_property
 from typing import Any
 
+import msgspec
+
 
 class Backend(abc.ABC):
+    @property
+    def available(self) -> bool:
+        """Whether the backend should be used, the `cache` decorator bypasses unavailable backends."""
+        return True
+
     @abc.abstractmethod
     async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]: ...
 
@@ -13,6 +25,73 @@ class Backend(abc.ABC):
     @abc.abstractmethod
     async def set(self, key: str, value: bytes, expire: int | None = None) -> None: ...
 
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get several keys at once, values are returned in the order of `keys`."""
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def set_many(self, items: Mapping[str, bytes], expire: int | None = None) -> None:
+        """Set several keys at once with the same expiration."""
+        await asyncio.gather(*(self.set(key, value, expire) for key, value in items.items()))
+
+    @cached_property
+    def _tag_locks(self) -> "weakref.WeakValueDictionary[str, asyncio.Lock]":
+        return weakref.WeakValueDictionary()
+
+    def _tag_lock(self, tag: str) -> asyncio.Lock:
+        """Lock serialising the updates of the index of `tag`, alive while it is in use."""
+        lock = self._tag_locks.get(tag)
+        if lock is None:
+            lock = self._tag_locks[tag] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _tag_index_key(tag: str) -> str:
+        return f"{tag}::tags"
+
+    async def _tag_index(self, tag: str) -> dict[str, int]:
+        """Keys attached to `tag` with their expiry timestamp (0 = never), expired ones left out."""
+        stored = await self.get(self._tag_index_key(tag))
+        index = msgspec.msgpack.decode(stored, type=dict[str, int]) if stored else {}
+        now = int(time.time())
+        return {key: expire_ts for key, expire_ts in index.items() if not expire_ts or expire_ts > now}
+
+    async def _add_to_tag_index(self, tag: str, key: str, expire: int | None) -> None:
+        async with self._tag_lock(tag):
+            index = await self._tag_index(tag)
+            now = int(time.time())
+            index[key] = now + expire if expire else 0
+            # the index lives as long as the last of its keys
+            index_expire = None if 0 in index.values() else max(index.values()) - now
+            await self.set(self._tag_index_key(tag), msgspec.msgpack.encode(index), index_expire)
+
+    async def _pop_tag_index(self, tag: str) -> dict[str, int]:
+        async with self._tag_lock(tag):
+            index = await self._tag_index(tag)
+            await self.clear(key=self._tag_index_key(tag))
+        return index
+
+    async def set_with_tags(self, key: str, value: bytes, tags: Sequence[str], expire: int | None = None) -> None:
+        """Set a value and attach tags to it, so that `invalidate_tags` removes it.
+
+        By default every tag has an index of its keys stored under `<tag>::tags` with `get` and
+        `set`. Each write decodes and rewrites the whole index of its tags, so its cost grows with
+        the number of keys sharing a tag, and updates of an index are serialised within the process
+        only. Backends with native sets or per-item indexes, or shared by several processes, should
+        attach tags atomically instead.
+        """
+        await self.set(key, value, expire)
+        await asyncio.gather(*(self._add_to_tag_index(tag, key, expire) for tag in tags))
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """Remove every value attached to any of the given tags.
+
+        Returns:
+            Number of invalidated values, when the backend can tell.
+        """
+        indexes = await asyncio.gather(*(self._pop_tag_index(tag) for tag in tags))
+        keys = {key for index in indexes for key in index}
+        return sum(await asyncio.gather(*(self.clear(key=key) for key in keys)))
+
     def lock(self, key: str, timeout: int) -> AbstractAsyncContextManager[Any]:
         return AsyncExitStack()  # pyright: ignore [reportUnknownVariableType]
 
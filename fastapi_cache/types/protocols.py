@@ -1,4 +1,4 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -20,3 +20,14 @@ class KeyBuilder(Protocol):
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Awaitable[str] | str: ...
+
+
+@runtime_checkable
+class TagsBuilder(Protocol):
+    def __call__(
+        self,
+        __result: Any,
+        *,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Iterable[str]: ...
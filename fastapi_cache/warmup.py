@@ -0,0 +1,185 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fastapi_cache.helpers.names import qualified_name, resolve_name
+
+if TYPE_CHECKING:
+    from fastapi_cache.decorator import Cached
+
+logger: logging.Logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+Arguments = tuple[tuple[Any, ...], dict[str, Any]]
+
+
+def _function_name(func: "Cached[..., Any]") -> str:
+    return qualified_name(func.func)
+
+
+def _resolve_function(name: str) -> "Cached[..., Any] | None":
+    from fastapi_cache.decorator import Cached
+
+    obj = resolve_name(name, import_module=True)
+    return obj if isinstance(obj, Cached) else None
+
+
+class Warmer:
+    """Repopulates the cache ahead of traffic.
+
+    Warms registered cached functions with their argument sets, plus the most recently computed
+    calls when `record` is set. Recorded calls can be dumped to a JSON file on shutdown and loaded
+    back at startup, so a restarted process warms the keys that were hot before. Calls go through
+    the regular decorator path, so locking, coding, TTL policies and tags behave as for requests.
+
+    With `interval`, `start` keeps warming in the background, recomputing values that expire
+    within `refresh_ahead` seconds.
+
+    Usage:
+        >> warmer = Warmer(concurrency=4, record=1000)
+        >> warmer.add(get_item, [((), {"item_id": i}) for i in range(100)])
+        >> FastAPICache.init(backend, warmer=warmer)
+        >> await warmer.warm()
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        record: int = 0,
+        interval: float | None = None,
+        refresh_ahead: int = 0,
+    ) -> None:
+        """
+        Args:
+            concurrency: maximum number of calls warmed at once.
+            record: number of most recently computed calls to remember, 0 disables recording.
+            interval: seconds between background warmups started by `start`, `None` warms once.
+            refresh_ahead: recompute cached values expiring within this many seconds.
+        """
+        self.concurrency = concurrency
+        self.record_limit = record
+        self.interval = interval
+        self.refresh_ahead = refresh_ahead
+        self._targets: list[tuple[Cached[..., Any], Iterable[Arguments] | Callable[[], Iterable[Arguments]]]] = []
+        self._recorded: OrderedDict[str, tuple[Cached[..., Any], tuple[Any, ...], dict[str, Any]]] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+
+    def add(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        arguments: Iterable[Arguments] | Callable[[], Iterable[Arguments]] = (((), {}),),
+    ) -> None:
+        """Register a cached function to warm.
+
+        Args:
+            func: function decorated with `cache`.
+            arguments: `(args, kwargs)` pairs to warm, or a function returning them on every warmup.
+                Keyword arguments must be passed the way FastAPI passes them to the endpoint, so that
+                the cache keys match the ones built for requests.
+
+        Raises:
+            TypeError: `func` isn't decorated with `cache`.
+        """
+        from fastapi_cache.decorator import Cached
+
+        if not isinstance(func, Cached):
+            raise TypeError(f"{func!r} isn't decorated with `cache`, it can't be warmed")
+        self._targets.append((func, arguments))
+
+    def record(self, cache_key: str, func: "Cached[..., Any]", args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Remember a computed call, called by the decorator on every miss.
+
+        Calls of functions FastAPI injects dependencies, the request or the response into are
+        skipped: they can't be replayed outside of a request, and would keep these values alive.
+        """
+        if not self.record_limit or not func.replayable:
+            return
+        self._recorded[cache_key] = (func, args, kwargs)
+        self._recorded.move_to_end(cache_key)
+        if len(self._recorded) > self.record_limit:
+            self._recorded.popitem(last=False)
+
+    def dump(self, path: str | Path) -> int:
+        """Write the recorded calls to a JSON file, skipping calls with non JSON arguments.
+
+        Returns:
+            Number of written calls.
+        """
+        entries = []
+        for func, args, kwargs in self._recorded.values():
+            entry = {"function": _function_name(func), "args": list(args), "kwargs": kwargs}
+            try:
+                entries.append(json.dumps(entry))
+            except (TypeError, ValueError):
+                continue
+        Path(path).write_text("[" + ",".join(entries) + "]")
+        return len(entries)
+
+    def load(self, path: str | Path) -> int:
+        """Read recorded calls from a JSON file written by `dump`, skipping unknown functions.
+
+        Returns:
+            Number of loaded calls.
+        """
+        count = 0
+        for entry in json.loads(Path(path).read_text()):
+            func = _resolve_function(entry["function"])
+            if func is None:
+                logger.warning("Skipping warmup of unknown cached function '%s'", entry["function"])
+                continue
+            self._recorded[f"{entry['function']}:{count}"] = (func, tuple(entry["args"]), entry["kwargs"])
+            count += 1
+        return count
+
+    def _calls(self) -> list[tuple["Cached[..., Any]", tuple[Any, ...], dict[str, Any]]]:
+        calls = [
+            (func, args, kwargs)
+            for func, arguments in self._targets
+            for args, kwargs in (arguments() if callable(arguments) else arguments)
+        ]
+        calls.extend(self._recorded.values())
+        return calls
+
+    async def warm(self) -> int:
+        """Warm all registered and recorded calls.
+
+        Returns:
+            Number of values computed and stored.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def warm_call(func: "Cached[..., Any]", args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    return await func.warm(args, kwargs, self.refresh_ahead)
+                except Exception:
+                    logger.warning("Error warming '%s':", _function_name(func), exc_info=True)
+                    return False
+
+        results = await asyncio.gather(*(warm_call(*call) for call in self._calls()))
+        return sum(results)
+
+    async def _run(self) -> None:
+        while True:
+            await self.warm()
+            if self.interval is None:
+                return
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Warm in a background task, repeatedly when an `interval` is set."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task started by `start`."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.breaker import CircuitBreakerBackend, CircuitOpenError
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+from fastapi_cache.instrumentation import Instrumentation
+
+
+class FlakyBackend(InMemoryBackend):
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.calls = 0
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return await super().get_with_ttl(key)
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.states: list[str] = []
+        self.errors: list[str] = []
+
+    def on_error(self, namespace: str, operation: str) -> None:
+        self.errors.append(operation)
+
+    def on_breaker_state(self, name: str, state: str) -> None:
+        self.states.append(state)
+
+
+async def test_circuit_breaker() -> None:
+    backend = FlakyBackend()
+    instrumentation = RecordingInstrumentation()
+    breaker = CircuitBreakerBackend(
+        backend,
+        timeout=0.01,
+        failure_threshold=2,
+        recovery_time=0.05,
+        instrumentation=instrumentation,
+    )
+
+    backend.delay = 0.1
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            await breaker.get_with_ttl("breaker")
+    assert not breaker.available
+    with pytest.raises(CircuitOpenError):
+        await breaker.get_with_ttl("breaker")
+    assert backend.calls == 2
+
+    await asyncio.sleep(0.05)
+    assert breaker.available
+    with pytest.raises(TimeoutError):
+        await breaker.get_with_ttl("breaker")
+    assert not breaker.available
+
+    await asyncio.sleep(0.05)
+    backend.delay = 0
+    assert await breaker.get_with_ttl("breaker") == (0, None)
+    assert breaker.available
+    assert instrumentation.states == ["open", "half_open", "open", "half_open", "closed"]
+
+
+async def test_half_open_probe(caplog: pytest.LogCaptureFixture) -> None:
+    backend = FlakyBackend()
+    instrumentation = RecordingInstrumentation()
+    breaker = CircuitBreakerBackend(backend, timeout=None, failure_threshold=1, recovery_time=0)
+    FastAPICache.reset()
+    FastAPICache.init(breaker, instrumentation=instrumentation)
+    breaker.state = "open"
+
+    async def key_builder(*_: Any, args: tuple[Any, ...], **__: Any) -> str:
+        # every call is admitted before the first one reaches the backend
+        await asyncio.sleep(0)
+        return f"fcache:breaker:{args[0]}"
+
+    @cache(key_builder=key_builder)
+    async def value(i: int) -> int:
+        return i
+
+    # checking availability doesn't move the circuit to half open, the first call does
+    assert breaker.available
+    assert breaker.state == "open"
+
+    backend.delay = 0.01
+    with caplog.at_level(logging.WARNING):
+        results: list[Any] = await asyncio.gather(*(value(i) for i in range(5)))
+    assert results == list(range(5))
+    # a single probe reached the backend, the other calls bypassed it silently
+    assert backend.calls == 1
+    assert instrumentation.errors == []
+    assert not caplog.records
+    assert breaker.state == "closed"
@@ -0,0 +1,87 @@
+import time
+from collections.abc import AsyncGenerator
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.cache_control import MAX_STALE_ANY, RequestCacheControl, parse_cache_control
+from fastapi_cache.decorator import cache
+
+app = FastAPI()
+calls = 0
+
+
+@app.get("/stale")
+@cache(namespace="cache_control", expire=10, stale_ttl=60)
+async def stale() -> dict[str, int]:
+    global calls
+    calls += 1
+    return {"calls": calls}
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    global calls
+    calls = 0
+    await FastAPICache.clear(namespace="cache_control")
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://localhost") as client:
+        yield client
+
+
+def test_parse_cache_control() -> None:
+    assert parse_cache_control('No-Cache, max-age=5, min-fresh="3", max-stale, only-if-cached') == RequestCacheControl(
+        no_cache=True,
+        max_age=5,
+        max_stale=MAX_STALE_ANY,
+        min_fresh=3,
+        only_if_cached=True,
+    )
+    assert parse_cache_control("max-stale=20, max-age=soon") == RequestCacheControl(max_stale=20)
+    assert parse_cache_control("no-store") is parse_cache_control("no-store")
+
+
+async def test_only_if_cached(client: AsyncClient) -> None:
+    response = await client.get("/stale", headers={"Cache-Control": "only-if-cached"})
+    assert response.status_code == 504
+    assert calls == 0
+
+    await client.get("/stale")
+    response = await client.get("/stale", headers={"Cache-Control": "only-if-cached"})
+    assert response.status_code == 200
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    assert response.headers["Cache-Control"] == "max-age=10"
+
+
+async def test_freshness_directives(client: AsyncClient) -> None:
+    await client.get("/stale")
+
+    response = await client.get("/stale", headers={"Cache-Control": "min-fresh=5"})
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    response = await client.get("/stale", headers={"Cache-Control": "min-fresh=20"})
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    response = await client.get("/stale", headers={"Cache-Control": "max-age=0"})
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert calls == 3
+
+
+async def test_max_stale(client: AsyncClient) -> None:
+    await client.get("/stale")
+
+    with mock.patch("time.time", return_value=time.time() + 30):
+        response = await client.get("/stale", headers={"Cache-Control": "max-stale=10"})
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert response.json() == {"calls": 2}
+
+    with mock.patch("time.time", return_value=time.time() + 60):
+        response = await client.get("/stale", headers={"Cache-Control": "max-stale"})
+        assert response.headers["X-FastAPI-Cache"] == "HIT"
+        assert response.headers["Cache-Control"] == "max-age=0"
+        assert response.json() == {"calls": 2}
+
+        # stale values are never served without max-stale
+        response = await client.get("/stale")
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert response.json() == {"calls": 3}
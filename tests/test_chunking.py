@@ -0,0 +1,26 @@
+from fastapi_cache.helpers import chunking
+
+
+def test_split_join() -> None:
+    value = bytes(range(256)) * 10
+    manifest, chunks = chunking.split(value, 1000)
+    assert manifest.chunks == 3
+    assert manifest.size == len(value)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+    assert chunking.join(manifest, list(chunks)) == value
+
+    # every write gets a new id, chunks of different writes never mix
+    assert chunking.split(value, 1000)[0].write_id != manifest.write_id
+
+
+def test_join_incomplete() -> None:
+    manifest, chunks = chunking.split(b"x" * 2500, 1000)
+    assert chunking.join(manifest, [chunks[0], None, chunks[2]]) is None
+    assert chunking.join(manifest, list(chunks[:2])) is None
+    assert chunking.join(manifest, [chunks[0], chunks[1], chunks[2][:-1]]) is None
+
+
+def test_manifest_encoding() -> None:
+    manifest, _ = chunking.split(b"x" * 2500, 1000)
+    assert chunking.decode_manifest(chunking.encode_manifest(manifest)) == manifest
+    assert chunking.decode_manifest(b"a regular value") is None
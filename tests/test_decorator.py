@@ -82,6 +82,39 @@ async def test_cache_response_obj_typed(client: AsyncClient) -> None:
         assert m.call_count == 0
 
 
+async def test_cache_response_obj_full(client: AsyncClient) -> None:
+    cache_response = await client.get("cache_response_obj_full")
+    assert cache_response.headers.get("X-FastAPI-Cache") == "MISS"
+    get_cache_response = await client.get("cache_response_obj_full")
+    assert get_cache_response.headers.get("X-FastAPI-Cache") == "HIT"
+    assert get_cache_response.status_code == 201
+    assert get_cache_response.text == "<item>1</item>"
+    assert get_cache_response.headers.get("content-type") == "application/xml"
+    assert get_cache_response.headers.get("x-item-version") == "3"
+
+
+async def test_if_modified_since(client: AsyncClient) -> None:
+    response = await client.get("/cache_response_obj_full")
+    last_modified = response.headers.get("last-modified")
+    assert last_modified
+
+    response = await client.get("/cache_response_obj_full")
+    assert response.headers.get("X-FastAPI-Cache") == "HIT"
+    assert response.headers.get("last-modified") == last_modified
+    assert int(response.headers.get("age")) >= 0
+
+    response = await client.get("/cache_response_obj_full", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+    assert response.headers.get("last-modified") == last_modified
+
+    response = await client.get(
+        "/cache_response_obj_full",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+    assert response.status_code == 201
+    assert response.text == "<item>1</item>"
+
+
 async def test_kwargs(client: AsyncClient) -> None:
     name = "Jon"
     response = await client.get("/kwargs", params={"name": name})
@@ -204,3 +237,24 @@ async def test_coroutine_marker_when_using_inspect(client: AsyncClient) -> None:
 
     assert inspect.iscoroutinefunction(call_async)
     assert inspect.iscoroutinefunction(call_sync)
+
+
+async def test_streaming_response(client: AsyncClient) -> None:
+    response = await client.get("/stream")
+    assert response.headers.get("X-FastAPI-Cache") == "MISS"
+    body = response.text
+    assert body.startswith("id,value\n0,1\n")
+
+    response = await client.get("/stream")
+    assert response.headers.get("X-FastAPI-Cache") == "HIT"
+    assert response.headers.get("content-type") == "text/csv; charset=utf-8"
+    assert response.headers.get("content-disposition") == "attachment"
+    assert response.text == body
+
+    response = await client.get("/stream", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+    assert response.headers.get("X-FastAPI-Cache") == "HIT"
+    assert response.content == b""
+
+    response = await client.get("/stream", headers={"If-Modified-Since": response.headers["Last-Modified"]})
+    assert response.status_code == 304
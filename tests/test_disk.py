@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from fastapi_cache.backends.disk import DiskBackend
+
+
+async def test_disk_backend(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    backend = DiskBackend(path)
+
+    await backend.set("fcache:ns:a", b"a", 60)
+    await backend.set("fcache:ns:b", b"b")
+    await backend.set("fcache:other:c", b"c", 60)
+
+    ttl, value = await backend.get_with_ttl("fcache:ns:a")
+    assert value == b"a"
+    assert 59 <= ttl <= 60
+    assert await backend.get_with_ttl("fcache:ns:b") == (-1, b"b")
+    assert await backend.clear(namespace="fcache:ns") == 2
+    assert await backend.get("fcache:ns:a") is None
+    backend.close()
+
+    # entries survive a restart
+    backend = DiskBackend(path)
+    assert await backend.get("fcache:other:c") == b"c"
+    assert await backend.clear(key="fcache:other:c") == 1
+    backend.close()
+
+
+async def test_disk_backend_eviction(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path / "cache.db", max_size=1000)
+    for i in range(5):
+        await backend.set(f"key:{i}", bytes(300))
+
+    assert [await backend.get(f"key:{i}") is not None for i in range(5)] == [False, False, True, True, True]
+    backend.close()
+
+
+async def test_disk_backend_size(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path / "cache.db", max_size=1000)
+    for _ in range(5):
+        await backend.set("key", bytes(300))
+    await backend.set("fcache:ns:a", bytes(100))
+    await backend.set("fcache:ns:b", bytes(100))
+    assert backend._size() == 500  # pyright: ignore[reportPrivateUsage]
+
+    # replaced and cleared entries don't count, nothing is evicted
+    await backend.clear(namespace="fcache:ns")
+    await backend.clear(key="missing")
+    assert backend._size() == 300  # pyright: ignore[reportPrivateUsage]
+    await backend.set("other", bytes(600))
+    assert await backend.get("key") == bytes(300)
+    backend.close()
+
+
+async def test_disk_backend_shared(tmp_path: Path) -> None:
+    # two backends on one file account for each other's writes, like worker processes do
+    first = DiskBackend(tmp_path / "cache.db", max_size=1000)
+    second = DiskBackend(tmp_path / "cache.db", max_size=1000)
+    await first.set("key:0", bytes(300))
+    await second.set("key:1", bytes(300))
+    await first.set("key:2", bytes(300))
+    assert second._size() == 900  # pyright: ignore[reportPrivateUsage]
+
+    await second.set("key:3", bytes(300))
+    assert [await first.get(f"key:{i}") is not None for i in range(4)] == [False, True, True, True]
+    assert first._size() == 900  # pyright: ignore[reportPrivateUsage]
+    first.close()
+    second.close()
@@ -0,0 +1,164 @@
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+
+import pytest
+
+pytest.importorskip("aiobotocore")
+pytest.importorskip("moto.server")
+
+from moto.server import ThreadedMotoServer
+
+from fastapi_cache.backends.dynamodb import DynamoBackend
+
+TABLE = "fastapi-cache"
+INDEX = "namespace-index"
+
+
+@pytest.fixture(scope="module")
+def endpoint_url() -> Generator[str, None, None]:
+    server = ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest.fixture(params=[None, INDEX], ids=["scan", "index"])
+async def backend(
+    request: pytest.FixtureRequest,
+    endpoint_url: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[DynamoBackend, None]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    backend = DynamoBackend(
+        TABLE,
+        region="us-east-1",
+        endpoint_url=endpoint_url,
+        namespace_index=request.param,
+        max_item_size=1000,
+    )
+    await backend.init()
+    await backend.client.create_table(
+        TableName=TABLE,
+        AttributeDefinitions=[
+            {"AttributeName": "key", "AttributeType": "S"},
+            {"AttributeName": "namespace", "AttributeType": "S"},
+        ],
+        KeySchema=[{"AttributeName": "key", "KeyType": "HASH"}],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": INDEX,
+                "KeySchema": [{"AttributeName": "namespace", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "KEYS_ONLY"},
+            },
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    yield backend
+    await backend.client.delete_table(TableName=TABLE)
+    await backend.close()
+
+
+async def test_get_set_many(backend: DynamoBackend) -> None:
+    # more keys than a single batch request accepts
+    items = {f"fcache:ns:{i}": str(i).encode() for i in range(120)}
+    await backend.set_many(items, 60)
+    keys = [*items, "fcache:ns:missing"]
+    assert await backend.get_many(keys) == [*items.values(), None]
+    ttl, value = await backend.get_with_ttl("fcache:ns:0")
+    assert value == b"0"
+    assert 59 <= ttl <= 60
+
+
+async def test_unprocessed_items_retried(backend: DynamoBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    batch_write_item = backend.client.batch_write_item
+    calls: list[int] = []
+
+    async def throttled(RequestItems: dict[str, Any]) -> Any:  # noqa: N803
+        # the first attempt leaves the last item unprocessed
+        calls.append(len(RequestItems[TABLE]))
+        if len(calls) == 1:
+            *processed, unprocessed = RequestItems[TABLE]
+            await batch_write_item(RequestItems={TABLE: processed})
+            return {"UnprocessedItems": {TABLE: [unprocessed]}}
+        return await batch_write_item(RequestItems=RequestItems)
+
+    monkeypatch.setattr(backend.client, "batch_write_item", throttled)
+    await backend.set_many({"fcache:ns:a": b"a", "fcache:ns:b": b"b"})
+    assert calls == [2, 1]
+    assert await backend.get_many(["fcache:ns:a", "fcache:ns:b"]) == [b"a", b"b"]
+
+    backend.max_retries = 0
+    calls.clear()
+    with pytest.raises(RuntimeError, match="unprocessed items"):
+        await backend.set_many({"fcache:ns:c": b"c", "fcache:ns:d": b"d"})
+
+
+async def test_clear_namespace(backend: DynamoBackend) -> None:
+    await backend.set_many({"fcache:ns:a": b"a", "fcache:ns:b": b"b", "fcache:other:c": b"c"})
+    assert await backend.clear(namespace="fcache:ns") == 2
+    assert await backend.get_many(["fcache:ns:a", "fcache:ns:b", "fcache:other:c"]) == [None, None, b"c"]
+    assert await backend.clear(key="fcache:other:c") == 1
+    assert await backend.clear(key="fcache:other:c") == 0
+
+
+async def test_clear_nested_namespace(backend: DynamoBackend) -> None:
+    nested = ["fcache:ns:a", "fcache:ns:nested:b", "fcache:ns:h::POST:digest", "fcache:ns:h::stream:id:0"]
+    await backend.set_many({**dict.fromkeys(nested, b"v"), "fcache:other:c": b"c", "fcache:nsx:d": b"d"})
+    assert await backend.clear(namespace="fcache:ns") == 4
+    assert await backend.get_many([*nested, "fcache:nsx:d"]) == [None, None, None, None, b"d"]
+
+    # a single-segment namespace, as cleared by `FastAPICache.clear()`
+    assert await backend.clear(namespace="fcache") == 2
+    assert await backend.get_many(["fcache:other:c", "fcache:nsx:d"]) == [None, None]
+
+
+async def _chunk_keys(backend: DynamoBackend) -> list[str]:
+    response = await backend.client.scan(
+        TableName=TABLE,
+        ProjectionExpression="#k",
+        ExpressionAttributeNames={"#k": "key"},
+    )
+    return [item["key"]["S"] for item in response["Items"] if "::chunk:" in item["key"]["S"]]
+
+
+async def test_chunked_values(backend: DynamoBackend) -> None:
+    value = bytes(range(256)) * 10
+    await backend.set("fcache:ns:large", value)
+    assert await backend.get_with_ttl("fcache:ns:large") == (-1, value)
+    assert len(await _chunk_keys(backend)) == 3
+
+    # the chunks of the replaced value are deleted
+    await backend.set("fcache:ns:large", value[::-1])
+    assert await backend.get("fcache:ns:large") == value[::-1]
+    assert len(await _chunk_keys(backend)) == 3
+    await backend.set("fcache:ns:large", b"small")
+    assert await _chunk_keys(backend) == []
+
+    await backend.set_many({"fcache:ns:large": value, "fcache:ns:small": b"small"})
+    assert await backend.get("fcache:ns:large") == value
+    assert await backend.clear(key="fcache:ns:large") == 1
+    assert await _chunk_keys(backend) == []
+
+    await backend.set_with_tags("fcache:ns:large", value, ["large"])
+    await backend.invalidate_tags(["large"])
+    assert await _chunk_keys(backend) == []
+
+
+async def test_invalidate_tags(backend: DynamoBackend) -> None:
+    await backend.set_with_tags("fcache:ns:1", b"1", ["item:1", "items"], 60)
+    await backend.set_with_tags("fcache:ns:2", b"2", ["items"])
+    assert await backend.get("fcache:ns:1") == b"1"
+
+    # tag items expire with the tagged value
+    ttl, _ = backend._parse_item(await backend._get_item("item:1::tag:fcache:ns:1"))
+    assert 59 <= ttl <= 60
+
+    assert await backend.invalidate_tags(["item:1"]) == 1
+    assert await backend.get("fcache:ns:1") is None
+    assert await backend.get("fcache:ns:2") == b"2"
+
+    # the tag item of the value already invalidated with `item:1` counts too
+    assert await backend.invalidate_tags(["items", "unknown"]) == 2
+    assert await backend.get("fcache:ns:2") is None
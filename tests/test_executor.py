@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+from collections.abc import Generator
+from typing import Any, ClassVar
+
+import anyio
+import pytest
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import JsonCoder
+from fastapi_cache.decorator import cache
+from fastapi_cache.executor import CacheExecutor
+from fastapi_cache.instrumentation import Instrumentation
+
+
+class QueueRecorder(Instrumentation):
+    def __init__(self) -> None:
+        self.depths: list[tuple[str, int]] = []
+
+    def observe_queue_depth(self, pool: str, depth: int) -> None:
+        self.depths.append((pool, depth))
+
+
+running = 0
+max_running = 0
+lock = threading.Lock()
+
+
+@cache(namespace="executor", expire=10)
+def slow(item_id: int) -> int:
+    global running, max_running
+    with lock:
+        running += 1
+        max_running = max(max_running, running)
+    time.sleep(0.05)
+    with lock:
+        running -= 1
+    return item_id
+
+
+@cache(namespace="executor", expire=10, cpu_bound=True)
+def worker_pid(item_id: int) -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def executor() -> Generator[CacheExecutor, None, None]:
+    executor = CacheExecutor(threads=1, processes=1, instrumentation=QueueRecorder())
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), executor=executor)
+    yield executor
+    executor.close()
+
+
+async def test_dedicated_threads(executor: CacheExecutor) -> None:
+    await FastAPICache.clear(namespace="executor")
+    async with anyio.create_task_group() as tg:
+        for item_id in range(3):
+            tg.start_soon(slow, item_id)
+    assert max_running == 1
+
+    depths = executor.instrumentation.depths  # type: ignore[union-attr]
+    assert [pool for pool, _ in depths] == ["thread"] * 3
+    assert [depth for _, depth in depths] == [0, 1, 2]
+
+
+async def test_process_offload(executor: CacheExecutor) -> None:
+    await FastAPICache.clear(namespace="executor")
+    pid = await worker_pid(1)
+    assert pid != os.getpid()
+    assert await worker_pid(1) == pid
+    assert executor.queued == 0
+
+
+class ThreadRecordingCoder(JsonCoder):
+    threads: ClassVar[list[str]] = []
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        cls.threads.append(threading.current_thread().name)
+        return super().encode(value)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        cls.threads.append(threading.current_thread().name)
+        return super().decode(value)
+
+
+@cache(namespace="executor", expire=10, coder=ThreadRecordingCoder)
+async def payload(size: int) -> dict[str, str]:
+    return {"data": "x" * size}
+
+
+async def test_coder_offload() -> None:
+    executor = CacheExecutor(encode_threshold=1024, decode_threshold=1024)
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), executor=executor)
+    await FastAPICache.clear(namespace="executor")
+    main = threading.current_thread().name
+
+    # small values stay on the event loop
+    await payload(10)
+    assert await payload(10) == {"data": "x" * 10}
+    assert ThreadRecordingCoder.threads == [main, main]
+
+    # the first large value is encoded inline, its size makes the next ones offloaded
+    ThreadRecordingCoder.threads.clear()
+    await payload(2000)
+    assert await payload(2000) == {"data": "x" * 2000}
+    await payload(3000)
+    encode_large, decode_large, encode_next = ThreadRecordingCoder.threads
+    assert encode_large == main
+    assert decode_large != main
+    assert encode_next != main
+
+
+async def test_process_coder_pool() -> None:
+    executor = CacheExecutor(processes=1, encode_threshold=1024, decode_threshold=1024, coder_pool="process")
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), executor=executor)
+    await FastAPICache.clear(namespace="executor")
+    ThreadRecordingCoder.threads.clear()
+    main = threading.current_thread().name
+    try:
+        await payload(2000)
+        # decoded in the worker process, where the coder records its calls in its own copy
+        assert await payload(2000) == {"data": "x" * 2000}
+        await payload(3000)
+    finally:
+        executor.close()
+
+    # both values are encoded in this process, the last one in a thread
+    assert len(ThreadRecordingCoder.threads) == 2
+    assert ThreadRecordingCoder.threads[-1] != main
@@ -0,0 +1,58 @@
+from fastapi_cache import FastAPICache, HotKeys
+from fastapi_cache.decorator import cache
+from fastapi_cache.hotkeys import CountMinSketch, TopK
+
+
+def test_count_min_sketch() -> None:
+    sketch = CountMinSketch(width=64, depth=4)
+    for i in range(1000):
+        sketch.add(f"key:{i % 100}")
+
+    assert sketch.total == 1000
+    assert all(sketch.estimate(f"key:{i}") >= 10 for i in range(100))
+
+
+def test_top_k() -> None:
+    top = TopK(k=3, width=256)
+    for i in range(1, 11):
+        for _ in range(i * 10):
+            top.add(f"key:{i}")
+    for i in range(100):
+        top.add(f"cold:{i}")
+
+    assert [item for item, _ in top.items()] == ["key:10", "key:9", "key:8"]
+
+
+def test_top_k_evicts_lowest() -> None:
+    top = TopK(k=4, width=4096)
+    tracked: dict[str, int] = {}
+    for i in range(2000):
+        item = f"key:{i * 7919 % 37 % (i % 11 + 1)}"
+        top.add(item)
+        estimate = top.sketch.estimate(item)
+        if item in tracked or len(tracked) < top.k:
+            tracked[item] = estimate
+        elif estimate > min(tracked.values()):
+            del tracked[min(tracked, key=tracked.__getitem__)]
+            tracked[item] = estimate
+        assert dict(top.items()) == tracked
+        assert len(top._heap) <= 2 * top.k  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_hot_keys_decorator() -> None:
+    @cache(namespace="hot", expire=5, key_builder=lambda *_, args, **__: f"fcache:hot:{args[0]}")
+    async def hot(item_id: int) -> int:
+        return item_id
+
+    hot_keys = HotKeys(k=2)
+    FastAPICache._hot_keys = hot_keys  # pyright: ignore[reportPrivateUsage]
+    try:
+        for item_id in (1, 1, 1, 2, 2, 3):
+            await hot(item_id)
+    finally:
+        FastAPICache._hot_keys = None  # pyright: ignore[reportPrivateUsage]
+
+    snapshot = hot_keys.snapshot()
+    assert snapshot.total == 6
+    assert snapshot.keys == [("fcache:hot:1", 3), ("fcache:hot:2", 2)]
+    assert snapshot.namespaces == [("hot", 6)]
@@ -0,0 +1,53 @@
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import Cached, cache
+
+
+def test_instance() -> None:
+    reports = FastAPICache.instance("reports")
+
+    assert FastAPICache.instance() is FastAPICache
+    assert FastAPICache.instance("reports") is reports
+    assert reports.name == "reports"
+
+
+async def test_named_cache() -> None:
+    backend = InMemoryBackend()
+    reports = FastAPICache.instance("named")
+    reports.init(backend, prefix="named", coder=PickleCoder, expire=30)
+    try:
+
+        @cache(cache="named", key_builder=lambda *_, **__: "named:report")
+        async def report() -> set[int]:
+            return {1, 2}
+
+        assert await report() == {1, 2}
+        ttl, cached = await backend.get_with_ttl("named:report")
+        assert cached is not None
+        assert 29 <= ttl <= 30
+        # values are stored without a write time unless stamp_values is set, older releases read them
+        assert PickleCoder.decode(cached) == {1, 2}
+        assert reports.get_prefix() == "named"
+        assert FastAPICache.get_prefix() != "named"
+    finally:
+        reports.reset()
+
+
+async def test_config_resolved_per_init() -> None:
+    @cache(key_builder=lambda *_, **__: "fcache:config")
+    async def value() -> int:
+        return 1
+
+    assert isinstance(value, Cached)
+    await value()
+    config = value.config
+    await value()
+    assert value.config is config
+
+    backend = InMemoryBackend()
+    FastAPICache.reset()
+    FastAPICache.init(backend, prefix="other")
+    assert value.config is not config
+    assert value.config.backend is backend
+    assert value.config.prefix == "other"
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from fastapi_cache import FastAPICache, Instrumentation
+from fastapi_cache.decorator import cache
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.events: Counter[str] = Counter()
+
+    def on_hit(self, namespace: str) -> None:
+        self.events[f"hit:{namespace}"] += 1
+
+    def on_miss(self, namespace: str) -> None:
+        self.events[f"miss:{namespace}"] += 1
+
+    def observe_backend(self, namespace: str, operation: str, seconds: float) -> None:
+        self.events[f"backend:{operation}"] += 1
+
+    def observe_coder(self, namespace: str, operation: str, seconds: float) -> None:
+        self.events[f"coder:{operation}"] += 1
+
+    def observe_size(self, namespace: str, operation: str, size: int) -> None:
+        assert size > 0
+
+
+async def test_instrumentation_events() -> None:
+    @cache(namespace="instrumented", expire=5)
+    async def instrumented() -> int:
+        return 42
+
+    instrumentation = RecordingInstrumentation()
+    FastAPICache._instrumentation = instrumentation  # pyright: ignore[reportPrivateUsage]
+
+    assert await instrumented() == 42
+    assert await instrumented() == 42
+
+    assert instrumentation.events == {
+        "miss:instrumented": 1,
+        "hit:instrumented": 1,
+        "backend:get": 2,
+        "backend:set": 1,
+        "coder:encode": 1,
+        "coder:decode": 1,
+    }
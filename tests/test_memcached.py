@@ -0,0 +1,122 @@
+from typing import Any
+
+import pytest
+
+pytest.importorskip("aiomcache")
+
+from aiomcache.exceptions import ClientException
+
+from fastapi_cache.backends.memcached import MemcachedBackend
+
+
+class FakeMemcached:
+    """In-memory stand-in for `aiomcache.Client`, raising like it on NOT_FOUND."""
+
+    def __init__(self) -> None:
+        self.store: dict[bytes, bytes] = {}
+
+    async def get(self, key: bytes) -> bytes | None:
+        return self.store.get(key)
+
+    async def multi_get(self, *keys: bytes) -> tuple[bytes | None, ...]:
+        return tuple(self.store.get(key) for key in keys)
+
+    async def set(self, key: bytes, value: bytes, exptime: int = 0) -> bool:
+        self.store[key] = value
+        return True
+
+    async def add(self, key: bytes, value: bytes, exptime: int = 0) -> bool:
+        if key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def delete(self, key: bytes) -> bool:
+        return self.store.pop(key, None) is not None
+
+    async def incr(self, key: bytes, increment: int = 1) -> int:
+        if key not in self.store:
+            raise ClientException("Memcached b'incr' command failed", b"NOT_FOUND")
+        value = int(self.store[key]) + increment
+        self.store[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture
+def backend() -> MemcachedBackend:
+    mcache: Any = FakeMemcached()
+    return MemcachedBackend(mcache)
+
+
+async def test_clear_namespace(backend: MemcachedBackend) -> None:
+    await backend.set("fcache:ns:a", b"a", 60)
+    await backend.set("fcache:other:b", b"b", 60)
+    assert await backend.clear(namespace="fcache:ns") == 1
+    assert await backend.get("fcache:ns:a") is None
+    assert await backend.get("fcache:other:b") == b"b"
+
+    await backend.set("fcache:ns:a", b"a2", 60)
+    assert await backend.get("fcache:ns:a") == b"a2"
+
+
+async def test_derived_keys_use_namespace_generations(backend: MemcachedBackend) -> None:
+    derived = ["fcache:ns:bbb::POST:d", "fcache:ns:bbb::stream:write:0", "fcache:ns:bbb::stream:other:0"]
+    for key in derived:
+        await backend.set(key, b"v", 60)
+    gen_keys = {key for key in backend.mcache.store if key.endswith(b"::gen")}  # type: ignore[attr-defined]
+    assert gen_keys == {b"fcache::gen", b"fcache:ns::gen"}
+
+    assert await backend.clear(namespace="fcache:ns") == 1
+    assert [await backend.get(key) for key in derived] == [None] * 3
+
+
+async def test_clear_namespace_without_generation(backend: MemcachedBackend) -> None:
+    # nothing was ever stored in the namespace, or its generation was evicted
+    assert await backend.clear(namespace="fcache:never") == 1
+    assert b"fcache:never::gen" in backend.mcache.store  # type: ignore[attr-defined]
+
+    await backend.set("fcache:ns:a", b"a", 60)
+    del backend.mcache.store[b"fcache:ns::gen"]  # type: ignore[attr-defined]
+    assert await backend.clear(namespace="fcache:ns") == 1
+    assert await backend.get("fcache:ns:a") is None
+
+
+async def test_clear_key(backend: MemcachedBackend) -> None:
+    await backend.set("fcache:ns:a", b"a")
+    assert await backend.get_with_ttl("fcache:ns:a") == (-1, b"a")
+    assert await backend.clear(key="fcache:ns:a") == 1
+    assert await backend.clear(key="fcache:ns:a") == 0
+
+
+async def test_invalidate_tags(backend: MemcachedBackend) -> None:
+    await backend.set_with_tags("fcache:ns:1", b"1", ["item:1", "items"], 60)
+    await backend.set_with_tags("fcache:ns:2", b"2", ["items"], 60)
+    assert await backend.get("fcache:ns:1") == b"1"
+
+    assert await backend.invalidate_tags(["item:1"]) == 1
+    assert await backend.get("fcache:ns:1") is None
+    assert await backend.get("fcache:ns:2") == b"2"
+
+    # a tag that was never stored, or was evicted, has nothing to bump
+    del backend.mcache.store[b"items::tag"]  # type: ignore[attr-defined]
+    assert await backend.invalidate_tags(["items", "unknown"]) == 0
+    assert await backend.get("fcache:ns:2") is None
+
+
+async def test_chunked_values() -> None:
+    mcache: Any = FakeMemcached()
+    backend = MemcachedBackend(mcache, max_item_size=1000)
+    value = bytes(range(256)) * 10
+    await backend.set("fcache:ns:large", value)
+    assert await backend.get_with_ttl("fcache:ns:large") == (-1, value)
+    entries = len(mcache.store)
+
+    # a missing chunk is a miss
+    chunk_key = next(key for key in mcache.store if b"#" in key)
+    chunk = mcache.store.pop(chunk_key)
+    assert await backend.get("fcache:ns:large") is None
+    mcache.store[chunk_key] = chunk
+
+    assert await backend.clear(key="fcache:ns:large") == 1
+    assert len(mcache.store) == entries - 4
+    assert not any(b"#" in key for key in mcache.store)
@@ -0,0 +1,24 @@
+from fastapi_cache.context import request_memo
+from fastapi_cache.decorator import cache
+
+calls = 0
+
+
+@cache(namespace="memo", expire=5)
+async def memoized(item_id: int) -> dict[str, int]:
+    global calls
+    calls += 1
+    return {"item_id": item_id}
+
+
+async def test_request_memo() -> None:
+    with request_memo() as memo:
+        first = await memoized(1)
+        assert await memoized(1) is first
+        assert await memoized(2) == {"item_id": 2}
+        assert len(memo) == 2
+
+    # outside of a request, the value is decoded from the backend again
+    assert await memoized(1) == first
+    assert await memoized(1) is not first
+    assert calls == 2
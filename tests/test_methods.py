@@ -0,0 +1,89 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+
+app = FastAPI()
+calls = 0
+
+
+class Query(BaseModel):
+    term: str
+    filters: dict[str, str] = {}
+
+
+@app.post("/search")
+@cache(namespace="methods", expire=10, methods=["POST"])
+async def search(query: Query) -> dict[str, int]:
+    global calls
+    calls += 1
+    return {"calls": calls}
+
+
+@app.api_route("/item", methods=["GET", "HEAD"])
+@cache(namespace="methods", expire=10, methods=["GET", "HEAD"])
+async def item() -> dict[str, int]:
+    global calls
+    calls += 1
+    return {"calls": calls}
+
+
+@app.api_route("/export", methods=["GET", "HEAD"])
+@cache(namespace="methods", expire=10, methods=["GET", "HEAD"])
+async def export() -> StreamingResponse:
+    async def rows() -> AsyncGenerator[bytes, None]:
+        global calls
+        calls += 1
+        yield b"a,b\n"
+
+    return StreamingResponse(rows(), media_type="text/csv")
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    global calls
+    calls = 0
+    await FastAPICache.clear(namespace="methods")
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://localhost") as client:
+        yield client
+
+
+async def test_post_body_key(client: AsyncClient) -> None:
+    response = await client.post("/search", json={"term": "cache", "filters": {"a": "1", "b": "2"}})
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+
+    # same body, different key order and whitespace
+    response = await client.post(
+        "/search",
+        content='{"filters": {"b": "2", "a": "1"},  "term": "cache"}',
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    assert response.json() == {"calls": 1}
+
+    response = await client.post("/search", json={"term": "other"})
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert calls == 2
+
+
+async def test_head_shares_get_entry(client: AsyncClient) -> None:
+    await client.get("/item")
+    response = await client.head("/item")
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    assert calls == 1
+
+
+async def test_head_stream(client: AsyncClient) -> None:
+    response = await client.get("/export")
+    assert response.content == b"a,b\n"
+
+    response = await client.head("/export")
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    assert response.content == b""
+    assert calls == 1
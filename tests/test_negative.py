@@ -0,0 +1,112 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import msgspec
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from fastapi_cache.negative import NEGATIVE_MAGIC, NegativeEntry
+
+app = FastAPI()
+calls = 0
+
+
+@app.get("/items/{item_id}")
+@cache(
+    namespace="negative",
+    expire=60,
+    negative_expire=5,
+    negative_exceptions=lambda e: isinstance(e, HTTPException) and e.status_code == 404,
+)
+async def item(item_id: int) -> dict[str, int] | None:
+    global calls
+    calls += 1
+    if item_id == 0:
+        return None
+    if item_id == 500:
+        raise HTTPException(500, "unavailable")
+    if item_id > 100:
+        raise HTTPException(404, f"item {item_id} not found", headers={"X-Reason": "missing"})
+    return {"item_id": item_id}
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    global calls
+    calls = 0
+    await FastAPICache.clear(namespace="negative")
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://localhost") as client:
+        yield client
+
+
+async def test_cached_http_exception(client: AsyncClient) -> None:
+    for _ in range(3):
+        response = await client.get("/items/404")
+        assert response.status_code == 404
+        assert response.json() == {"detail": "item 404 not found"}
+        assert response.headers["X-Reason"] == "missing"
+    assert calls == 1
+
+    # only the selected exceptions are cached
+    await client.get("/items/500")
+    response = await client.get("/items/500")
+    assert response.status_code == 500
+    assert calls == 3
+
+
+async def test_cached_none(client: AsyncClient) -> None:
+    await client.get("/items/0")
+    response = await client.get("/items/0")
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+    assert response.json() is None
+    assert calls == 1
+
+
+async def test_exception_types() -> None:
+    raised = 0
+
+    def key_builder(*_: Any, args: tuple[Any, ...], **__: Any) -> str:
+        return f"fcache:negative:{args[0]}"
+
+    @cache(key_builder=key_builder, negative_expire=5, negative_exceptions=[KeyError])
+    async def lookup(name: str) -> str:
+        nonlocal raised
+        raised += 1
+        raise KeyError(name)
+
+    for _ in range(2):
+        with pytest.raises(KeyError, match="missing"):
+            await lookup("missing")
+    assert raised == 1
+    ttl, _ = await FastAPICache.get_backend().get_with_ttl("fcache:negative:missing")
+    assert 0 < ttl <= 5
+
+
+async def test_forged_entry_not_replayed() -> None:
+    called = 0
+
+    def key_builder(*_: Any, args: tuple[Any, ...], **__: Any) -> str:
+        return f"fcache:negative:{args[0]}"
+
+    @cache(key_builder=key_builder, negative_expire=5, negative_exceptions=[KeyError])
+    async def lookup(name: str) -> str:
+        nonlocal called
+        called += 1
+        return name
+
+    backend = FastAPICache.get_backend()
+    # whoever can write to the backend can't make hits call arbitrary functions
+    for forged in (
+        NegativeEntry("subprocess:Popen", args=[["false"]]),
+        NegativeEntry("builtins:ValueError", args=["not selected"]),
+        NegativeEntry("antigravity:Unknown"),
+    ):
+        await backend.set("fcache:negative:forged", NEGATIVE_MAGIC + msgspec.msgpack.encode(forged), 5)
+        assert await lookup("forged") == "forged"
+    assert called == 3
+
+    with pytest.raises(ValueError, match="Refusing to replay"):
+        NegativeEntry("subprocess:Popen").replay(lambda _: True)
@@ -0,0 +1,42 @@
+from typing import Any
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from fastapi_cache.instrumentation.opentelemetry import OpenTelemetryInstrumentation
+
+
+async def test_opentelemetry_metrics() -> None:
+    @cache(namespace="opentelemetry", expire=5)
+    async def instrumented() -> int:
+        return 42
+
+    reader = InMemoryMetricReader()
+    instrumentation = OpenTelemetryInstrumentation(meter_provider=MeterProvider(metric_readers=[reader]))
+    FastAPICache._instrumentation = instrumentation  # pyright: ignore[reportPrivateUsage]
+    await FastAPICache.clear(namespace="opentelemetry")
+
+    assert await instrumented() == 42
+    assert await instrumented() == 42
+    instrumentation.on_breaker_state("redis", "half_open")
+
+    data = reader.get_metrics_data()
+    assert data is not None
+    points: dict[str, list[Any]] = {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+    requests = {point.attributes["result"]: point.value for point in points["fastapi_cache.requests"]}
+    assert requests == {"hit": 1, "miss": 1}
+    backend = {point.attributes["operation"]: point.count for point in points["fastapi_cache.backend.duration"]}
+    assert backend == {"get": 2, "set": 1}
+    [breaker] = points["fastapi_cache.breaker.open"]
+    assert (dict(breaker.attributes), breaker.value) == ({"name": "redis"}, 0.5)
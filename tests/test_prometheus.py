@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import CollectorRegistry
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from fastapi_cache.instrumentation.prometheus import PrometheusInstrumentation
+
+
+async def test_prometheus_metrics() -> None:
+    @cache(namespace="prometheus", expire=5)
+    async def instrumented() -> int:
+        return 42
+
+    registry = CollectorRegistry()
+    instrumentation = PrometheusInstrumentation(registry=registry, prefix="test")
+    FastAPICache._instrumentation = instrumentation  # pyright: ignore[reportPrivateUsage]
+    await FastAPICache.clear(namespace="prometheus")
+
+    assert await instrumented() == 42
+    assert await instrumented() == 42
+    instrumentation.on_breaker_state("redis", "open")
+    instrumentation.observe_ttl("prometheus", "adaptive", None)
+
+    def sample(metric: str, **labels: str) -> float | None:
+        return registry.get_sample_value(metric, labels)
+
+    assert sample("test_requests_total", namespace="prometheus", result="hit") == 1
+    assert sample("test_requests_total", namespace="prometheus", result="miss") == 1
+    assert sample("test_backend_duration_seconds_count", namespace="prometheus", operation="get") == 2
+    assert sample("test_backend_duration_seconds_count", namespace="prometheus", operation="set") == 1
+    assert sample("test_coder_duration_seconds_count", namespace="prometheus", operation="encode") == 1
+    assert sample("test_payload_size_bytes_count", namespace="prometheus", operation="get") == 1
+    assert sample("test_breaker_state", name="redis", test_breaker_state="open") == 1
+    assert sample("test_ttl_seconds_count", namespace="prometheus", reason="adaptive") is None
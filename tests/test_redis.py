@@ -0,0 +1,209 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+pytest.importorskip("fakeredis")
+
+import fakeredis
+from redis.crc import key_slot
+
+from fastapi_cache.backends.redis import RedisBackend
+
+
+@pytest.fixture
+def backend() -> RedisBackend:
+    return RedisBackend(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()))
+
+
+@pytest.fixture(params=[False, True], ids=["script", "python"])
+def leases(request: pytest.FixtureRequest) -> RedisBackend:
+    return RedisBackend(
+        fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()),
+        use_leases=True,
+        use_python_impl=request.param,
+    )
+
+
+async def test_lease_holder_and_waiters(leases: RedisBackend) -> None:
+    events: list[str] = []
+
+    async def call(name: str) -> None:
+        async with leases.lock("fcache:ns:key", 5) as holder:
+            events.append(f"{name} {'holds' if holder else 'waited'}")
+            if holder:
+                await asyncio.sleep(0.1)
+                events.append(f"{name} releases")
+
+    await asyncio.gather(call("first"), call("second"), call("third"))
+    # only the first caller holds the lease, the others are woken up once it is released
+    assert events[:2] == ["first holds", "first releases"]
+    assert sorted(events[2:]) == ["second waited", "third waited"]
+    assert not await leases.redis_write.exists("fcache:ns:key::lease")
+
+    async with leases.lock("fcache:ns:key", 5) as holder:
+        assert holder
+
+
+async def test_lease_waiters_share_blpop(leases: RedisBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    blpop = leases.redis_write.blpop
+    calls: list[Any] = []
+
+    async def counting_blpop(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args)
+        return await blpop(*args, **kwargs)
+
+    monkeypatch.setattr(leases.redis_write, "blpop", counting_blpop)
+
+    async def wait() -> bool:
+        async with leases.lock("fcache:ns:key", 5) as holder:
+            return bool(holder)
+
+    async with leases.lock("fcache:ns:key", 5) as holder:
+        assert holder
+        waiters = [asyncio.create_task(wait()) for _ in range(10)]
+        await asyncio.sleep(0.1)
+        # a waiter giving up doesn't wake up the others
+        waiters[0].cancel()
+        await asyncio.sleep(0.05)
+        assert not any(waiter.done() for waiter in waiters[1:])
+    assert await asyncio.gather(*waiters[1:]) == [False] * 9
+    assert len(calls) == 1
+    # the notification is left for the waiters of other processes
+    assert await leases.redis_write.llen(calls[0][0][0]) == 1
+
+
+async def test_lease_expiry(leases: RedisBackend) -> None:
+    # a holder that died without releasing its lease
+    await leases.redis_write.set("fcache:ns:key::lease", "dead", px=1000)
+
+    start = time.monotonic()
+    async with leases.lock("fcache:ns:key", 1) as holder:
+        assert not holder
+    assert time.monotonic() - start >= 0.9
+
+    await asyncio.sleep(0.2)
+    async with leases.lock("fcache:ns:key", 1) as holder:
+        assert holder
+
+
+async def test_lease_release_by_holder_only(leases: RedisBackend) -> None:
+    async with leases.lock("fcache:ns:key", 5) as holder:
+        assert holder
+        # the lease expired and was taken by another caller meanwhile
+        await leases.redis_write.set("fcache:ns:key::lease", "other")
+    assert await leases.redis_write.get("fcache:ns:key::lease") == b"other"
+
+
+async def test_invalidate_tags(backend: RedisBackend) -> None:
+    await backend.set_with_tags("fcache:ns:1", b"1", ["item:1", "items"], 60)
+    await backend.set_with_tags("fcache:ns:2", b"2", ["items"], 600)
+    await backend.set_with_tags("fcache:ns:3", b"3", ["forever"])
+    assert await backend.get("fcache:ns:1") == b"1"
+
+    # tag sets live as long as their longest-living key
+    redis = backend.redis_write
+    assert 0 < await redis.ttl("item:1::tagged") <= 60
+    assert 60 < await redis.ttl("items::tagged") <= 600
+    assert await redis.ttl("forever::tagged") == -1
+
+    assert await backend.invalidate_tags(["item:1"]) == 1
+    assert await backend.get("fcache:ns:1") is None
+    assert await backend.get("fcache:ns:2") == b"2"
+    assert not await redis.exists("item:1::tagged")
+
+    assert await backend.invalidate_tags(["items", "forever", "unknown"]) == 2
+    assert await backend.get("fcache:ns:2") is None
+    assert await backend.get("fcache:ns:3") is None
+
+
+class FakeNode:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+        self.scanned: list[bytes] = []
+
+
+class FakeClusterPipeline:
+    def __init__(self, cluster: "FakeCluster") -> None:
+        self.cluster = cluster
+        self.commands: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "FakeClusterPipeline":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        pass
+
+    def execute_command(self, *args: Any) -> "FakeClusterPipeline":
+        self.commands.append(args)
+        return self
+
+    async def execute(self) -> list[int]:
+        results = []
+        for command, *keys in self.commands:
+            # a multi-key command of a cluster pipeline fails unless its keys share a slot
+            assert command == "UNLINK"
+            assert len({key_slot(key) for key in keys}) == 1
+            self.cluster.unlinks.append(keys)
+            results.append(await self.cluster.node(keys[0]).redis.unlink(*keys))
+        return results
+
+
+class FakeCluster:
+    """Primaries of a cluster, each a client of its own, owning a range of hash slots."""
+
+    def __init__(self, primaries: int) -> None:
+        self.nodes = [FakeNode(f"node-{i}:6379") for i in range(primaries)]
+        self.unlinks: list[list[bytes]] = []
+        self.scanning = 0
+        self.max_scanning = 0
+
+    def node(self, key: bytes) -> FakeNode:
+        return self.nodes[key_slot(key) * len(self.nodes) // 16384]
+
+    def get_primaries(self) -> list[FakeNode]:
+        return self.nodes
+
+    def pipeline(self) -> FakeClusterPipeline:
+        return FakeClusterPipeline(self)
+
+    async def execute_command(self, command: str, *args: Any, target_nodes: FakeNode) -> Any:
+        assert command == "SCAN"
+        cursor, _, match, _, count = args
+        self.scanning += 1
+        self.max_scanning = max(self.max_scanning, self.scanning)
+        await asyncio.sleep(0.01)
+        # unlike fakeredis, SCAN returns every key present for the whole iteration, even when
+        # keys are deleted meanwhile
+        if cursor == 0:
+            target_nodes.scanned = sorted(await target_nodes.redis.keys(match))
+        keys = target_nodes.scanned[cursor : cursor + count]
+        cursor = cursor + count if cursor + count < len(target_nodes.scanned) else 0
+        self.scanning -= 1
+        return {target_nodes.name: cursor}, keys
+
+
+async def test_clear_cluster_namespace() -> None:
+    cluster = FakeCluster(primaries=3)
+    keys = [f"fcache:ns:{i}".encode() for i in range(60)] + [f"fcache:ns:{{user}}:{i}".encode() for i in range(10)]
+    for key in [*keys, b"fcache:other:1"]:
+        await cluster.node(key).redis.set(key, b"value")
+    assert all([await node.redis.dbsize() for node in cluster.nodes])
+
+    backend = RedisBackend(cluster, cluster_scan_count=5, cluster_concurrency=2)  # type: ignore[arg-type]
+    backend.is_cluster = True
+    progress: list[int] = []
+    assert await backend.clear_namespace("fcache:ns", progress.append) == 70
+
+    # every primary was scanned, two at a time
+    assert cluster.max_scanning == 2
+    assert sorted(key for unlinked in cluster.unlinks for key in unlinked) == sorted(keys)
+    # keys of a scan page sharing a hash tag are unlinked together
+    tagged = [len(unlinked) for unlinked in cluster.unlinks if b"{user}" in unlinked[0]]
+    assert sum(tagged) == 10
+    assert len(tagged) < 10
+    assert progress == sorted(progress)
+    assert progress[-1] == 70
+    assert await cluster.node(b"fcache:other:1").redis.get(b"fcache:other:1") == b"value"
@@ -0,0 +1,99 @@
+import asyncio
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+
+from fastapi_cache.backends.shared import SEQ, SharedMemoryBackend
+
+
+def _write(path: Path) -> None:
+    backend = SharedMemoryBackend(path, slots=64, slot_size=256)
+    asyncio.run(backend.set("fcache:shared:other", b"from another process", 60))
+    backend.close()
+
+
+async def test_shared_memory_backend(tmp_path: Path) -> None:
+    path = tmp_path / "cache"
+    backend = SharedMemoryBackend(path, slots=64, slot_size=256)
+
+    await backend.set("fcache:ns:a", b"a", 60)
+    await backend.set("fcache:ns:b", b"b")
+    await backend.set("fcache:other:c", b"c", 60)
+    await backend.set("fcache:big", b"x" * 256)
+
+    ttl, value = await backend.get_with_ttl("fcache:ns:a")
+    assert value == b"a"
+    assert 59 <= ttl <= 60
+    assert await backend.get_with_ttl("fcache:ns:b") == (-1, b"b")
+    assert await backend.get("fcache:big") is None
+
+    assert await backend.clear(namespace="fcache:ns") == 2
+    assert await backend.get("fcache:ns:a") is None
+    assert await backend.clear(key="fcache:other:c") == 1
+    assert await backend.get("fcache:other:c") is None
+
+    process = multiprocessing.get_context("spawn").Process(target=_write, args=(path,))
+    process.start()
+    process.join()
+    assert await backend.get("fcache:shared:other") == b"from another process"
+    backend.close()
+
+    with pytest.raises(ValueError, match="slot_size"):
+        SharedMemoryBackend(path, slots=64, slot_size=512)
+
+
+async def test_shared_memory_eviction(tmp_path: Path) -> None:
+    backend = SharedMemoryBackend(tmp_path / "cache", slots=4, slot_size=64, probes=4)
+    for i in range(4):
+        await backend.set(f"key:{i}", b"value", 10 + i)
+    await backend.set("key:4", b"value", 60)
+
+    assert await backend.get("key:0") is None
+    assert all([await backend.get(f"key:{i}") == b"value" for i in range(1, 5)])
+    backend.close()
+
+
+async def test_shared_memory_torn_reads(tmp_path: Path) -> None:
+    backend = SharedMemoryBackend(tmp_path / "cache", slots=4, slot_size=256, probes=1)
+    await backend.set("key", bytes([100]) * 100, 60)
+    offset = next(backend._offsets(backend._hash(b"key")))
+
+    # a writer holding the slot with an odd sequence number
+    seq = SEQ.unpack_from(backend._mmap, offset)[0]
+    SEQ.pack_into(backend._mmap, offset, seq + 1)
+    assert await backend.get("key") is None
+    SEQ.pack_into(backend._mmap, offset, seq + 2)
+    assert await backend.get("key") == bytes([100]) * 100
+
+    # readers racing with a writer only ever see complete values
+    stop = threading.Event()
+
+    def write() -> None:
+        loop = asyncio.new_event_loop()
+        size = 1
+        while not stop.is_set():
+            loop.run_until_complete(backend.set("key", bytes([size]) * size, 60))
+            size = size % 200 + 1
+        loop.close()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        for _ in range(20_000):
+            value = await backend.get("key")
+            if value is not None:
+                assert value == bytes([len(value)]) * len(value)
+    finally:
+        stop.set()
+        writer.join()
+    backend.close()
+
+
+async def test_shared_memory_oversized_replaces(tmp_path: Path) -> None:
+    backend = SharedMemoryBackend(tmp_path / "cache", slots=4, slot_size=64)
+    await backend.set("key", b"small", 60)
+    await backend.set("key", b"x" * 64, 60)
+    assert await backend.get("key") is None
+    backend.close()
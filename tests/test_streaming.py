@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterator
+
+from starlette.responses import StreamingResponse
+
+from fastapi_cache import streaming
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+
+async def _body() -> AsyncIterator[str]:
+    for i in range(10):
+        yield f"line {i}\n"
+
+
+async def _read(response: StreamingResponse) -> bytes:
+    return b"".join([part.encode() if isinstance(part, str) else bytes(part) async for part in response.body_iterator])
+
+
+async def test_capture_and_replay() -> None:
+    backend = InMemoryBackend()
+    response = StreamingResponse(_body(), status_code=201, media_type="text/plain")
+
+    async def store_manifest(manifest: bytes, ttl: int | None) -> None:
+        await backend.set("fcache:stream", manifest, ttl)
+
+    streaming.capture(response, backend, "fcache:stream", 60, store_manifest, chunk_size=16)
+    assert await backend.get("fcache:stream") is None
+    body = await _read(response)
+
+    manifest = streaming.decode_manifest(await backend.get("fcache:stream") or b"")
+    assert manifest is not None
+    assert manifest.chunks == 4
+    assert manifest.size == len(body)
+
+    replayed = await streaming.replay(backend, "fcache:stream", manifest)
+    assert replayed is not None
+    assert replayed.status_code == 201
+    assert replayed.headers["content-type"] == "text/plain; charset=utf-8"
+    assert await _read(replayed) == body
+
+    await backend.clear(key=streaming.chunk_key("fcache:stream", manifest.write_id, 0))
+    assert await streaming.replay(backend, "fcache:stream", manifest) is None
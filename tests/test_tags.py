@@ -0,0 +1,111 @@
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.disk import DiskBackend
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.shared import SharedMemoryBackend
+from fastapi_cache.decorator import cache
+from fastapi_cache.types import Backend
+
+
+async def test_invalidate_tags() -> None:
+    calls = 0
+
+    def key_builder(*_: Any, args: tuple[Any, ...], **__: Any) -> str:
+        return f"fcache:tags:{args[0]}"
+
+    @cache(key_builder=key_builder, tags=lambda result, *, args, kwargs: [f"item:{args[0]}", "items"])
+    async def item(item_id: int) -> int:
+        nonlocal calls
+        calls += 1
+        return item_id
+
+    await item(1)
+    await item(2)
+    await item(1)
+    assert calls == 2
+
+    await FastAPICache.invalidate_tags("item:1")
+    await item(1)
+    await item(2)
+    assert calls == 3
+
+    await FastAPICache.invalidate_tags("items")
+    await item(1)
+    await item(2)
+    assert calls == 5
+
+
+async def test_static_tags() -> None:
+    def key_builder(*_: Any, **__: Any) -> str:
+        return "fcache:static_tags"
+
+    @cache(key_builder=key_builder, tags=["static"])
+    async def static() -> int:
+        return 1
+
+    await static()
+    backend = FastAPICache.get_backend()
+    assert await backend.get("fcache:static_tags") is not None
+    await FastAPICache.invalidate_tags("static")
+    assert await backend.get("fcache:static_tags") is None
+
+
+async def test_inmemory_tag_index_pruned(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = InMemoryBackend()
+    await backend.set_with_tags("fcache:tags:1", b"1", ["items"], 60)
+    await backend.set_with_tags("fcache:tags:2", b"2", ["items"], 10)
+    await backend.set_with_tags("fcache:tags:3", b"3", ["items"], 60)
+
+    # re-set without the tag, cleared and expired keys leave the index
+    await backend.set("fcache:tags:1", b"1", 60)
+    await backend.clear(key="fcache:tags:3")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    assert await backend.get("fcache:tags:2") is None
+    assert "items" not in backend._tags  # pyright: ignore[reportPrivateUsage]
+
+    assert await backend.invalidate_tags(["items"]) == 0
+    assert await backend.get("fcache:tags:1") == b"1"
+
+
+@pytest.fixture(params=["disk", "shared"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Generator[Backend, None, None]:
+    # backends relying on the default tag index
+    backend = DiskBackend(tmp_path / "cache.db") if request.param == "disk" else SharedMemoryBackend(tmp_path / "shm")
+    yield backend
+    backend.close()
+
+
+async def test_default_tag_index(backend: Backend) -> None:
+    await backend.set_with_tags("fcache:tags:1", b"1", ["item:1", "items"], 60)
+    await backend.set_with_tags("fcache:tags:2", b"2", ["items"])
+    assert await backend.get("fcache:tags:1") == b"1"
+    ttl, _ = await backend.get_with_ttl("items::tags")
+    assert ttl == -1
+
+    assert await backend.invalidate_tags(["item:1"]) == 1
+    assert await backend.get("fcache:tags:1") is None
+    assert await backend.get("fcache:tags:2") == b"2"
+    assert await backend.get("item:1::tags") is None
+
+    assert await backend.invalidate_tags(["items", "unknown"]) == 1
+    assert await backend.get("fcache:tags:2") is None
+
+
+async def test_default_tag_index_expiry(backend: Backend, monkeypatch: pytest.MonkeyPatch) -> None:
+    await backend.set_with_tags("fcache:tags:1", b"1", ["items"], 10)
+    await backend.set_with_tags("fcache:tags:2", b"2", ["items"], 60)
+    ttl, _ = await backend.get_with_ttl("items::tags")
+    assert 59 <= ttl <= 60
+
+    # expired keys are dropped from the index on the next write
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    await backend.set_with_tags("fcache:tags:3", b"3", ["items"], 10)
+    assert set(await backend._tag_index("items")) == {"fcache:tags:2", "fcache:tags:3"}
@@ -0,0 +1,47 @@
+from typing import Any
+
+import pytest
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from fastapi_cache.ttl import AdaptiveTTL
+
+
+def test_adaptive_ttl() -> None:
+    policy = AdaptiveTTL(initial=10, min_ttl=5, max_ttl=30)
+
+    assert policy.next_ttl("key", b"a") == (10, "initial")
+    assert policy.next_ttl("key", b"a") == (20, "unchanged")
+    assert policy.next_ttl("key", b"a") == (30, "unchanged")
+    assert policy.next_ttl("key", b"b") == (15, "changed")
+    assert policy.next_ttl("key", b"c") == (8, "changed")
+    assert policy.next_ttl("key", b"d") == (5, "changed")
+    assert policy.next_ttl("other", b"d") == (10, "initial")
+
+
+def test_adaptive_ttl_bounded_state() -> None:
+    policy = AdaptiveTTL(initial=10, max_keys=2)
+    for key in ("a", "b", "c"):
+        policy.next_ttl(key, b"value")
+
+    assert policy.next_ttl("a", b"value") == (10, "initial")
+    assert policy.next_ttl("c", b"value") == (20, "unchanged")
+
+
+def test_adaptive_ttl_bounds() -> None:
+    with pytest.raises(ValueError, match="min_ttl"):
+        AdaptiveTTL(initial=5, min_ttl=10)
+
+
+async def test_adaptive_ttl_decorator() -> None:
+    def key_builder(*_: Any, **__: Any) -> str:
+        return "fcache:adaptive"
+
+    @cache(expire=AdaptiveTTL(initial=100, max_ttl=1000), key_builder=key_builder)
+    async def adaptive() -> int:
+        return 1
+
+    await adaptive()
+    ttl, _ = await FastAPICache.get_backend().get_with_ttl("fcache:adaptive")
+    assert 99 <= ttl <= 100
+    await FastAPICache.get_backend().clear(key="fcache:adaptive")
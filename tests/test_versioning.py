@@ -0,0 +1,70 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import Cached, cache
+from fastapi_cache.helpers.fingerprint import schema_fingerprint
+
+
+class ItemV1(BaseModel):
+    """An item."""
+
+    id: int
+
+
+class ItemV2(BaseModel):
+    id: int
+    name: str
+
+
+def _documented_item(doc: str) -> type[BaseModel]:
+    return type("Item", (BaseModel,), {"__doc__": doc, "__annotations__": {"id": int}})
+
+
+def test_schema_fingerprint() -> None:
+    assert schema_fingerprint(None) is None
+    assert schema_fingerprint(ItemV1) != schema_fingerprint(ItemV2)
+    assert schema_fingerprint(ItemV1) != schema_fingerprint(ItemV1, "2")
+    assert schema_fingerprint(dict[str, int]) == schema_fingerprint(dict[str, int])
+    # docstrings don't change the encoded values
+    assert schema_fingerprint(_documented_item("An item.")) == schema_fingerprint(_documented_item("Any item."))
+
+
+async def _key(cached: Cached[Any, Any]) -> str:
+    return await cached.build_key(cached.get_ctx(), None, None, (1,), {})
+
+
+async def test_versioned_keys() -> None:
+    def item_v1(item_id: int) -> ItemV1:
+        return ItemV1(id=item_id)
+
+    def item_v2(item_id: int) -> ItemV2:
+        return ItemV2(id=item_id, name="")
+
+    def untyped(item_id: int):  # type: ignore[no-untyped-def]
+        return item_id
+
+    v1 = cache(namespace="items", versioned=True)(item_v1)
+    v2 = cache(namespace="items", versioned=True)(item_v2)
+    v1_versioned = cache(namespace="items", version="2")(item_v1)
+    plain = cache(namespace="items", versioned=True)(untyped)
+
+    keys = {await _key(v1), await _key(v2), await _key(v1_versioned)}  # type: ignore[arg-type]
+    assert len(keys) == 3
+    # the fingerprint is in the last segment, the namespace is unchanged
+    assert all(key.startswith(f"{FastAPICache.get_prefix()}:items:") and key.count(":") == 2 for key in keys)
+    assert "~" not in await _key(plain)  # type: ignore[arg-type]
+
+    # versioning is opt-in
+    assert "~" not in await _key(cache(namespace="items")(item_v1))  # type: ignore[arg-type]
+
+
+async def test_clear_versioned_namespace() -> None:
+    @cache(namespace="versioned", version="1")
+    async def item(item_id: int) -> ItemV1:
+        return ItemV1(id=item_id)
+
+    await FastAPICache.clear(namespace="versioned")
+    await item(1)
+    assert await FastAPICache.clear(namespace="versioned") == 1
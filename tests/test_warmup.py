@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Annotated, Any
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from fastapi_cache import FastAPICache, Warmer
+from fastapi_cache.decorator import cache
+
+calls: list[int] = []
+
+
+@cache(namespace="warmup", expire=60)
+async def warmed(item_id: int) -> int:
+    calls.append(item_id)
+    return item_id
+
+
+async def test_warm() -> None:
+    await FastAPICache.clear(namespace="warmup")
+    calls.clear()
+    warmer = Warmer(concurrency=2)
+    warmer.add(warmed, lambda: [((), {"item_id": i}) for i in range(3)])
+
+    assert await warmer.warm() == 3
+    assert await warmer.warm() == 0
+    assert await warmed(item_id=1) == 1
+    assert calls == [0, 1, 2]
+
+
+async def test_refresh_ahead() -> None:
+    await FastAPICache.clear(namespace="warmup")
+    calls.clear()
+    warmer = Warmer(refresh_ahead=120)
+    warmer.add(warmed, [((), {"item_id": 1})])
+
+    assert await warmer.warm() == 1
+    assert await warmer.warm() == 1
+    assert calls == [1, 1]
+
+
+async def test_record_dump_load(tmp_path: Path) -> None:
+    await FastAPICache.clear(namespace="warmup")
+    calls.clear()
+    warmer = Warmer(record=2)
+    FastAPICache._warmer = warmer  # pyright: ignore[reportPrivateUsage]
+    try:
+        for i in range(3):
+            await warmed(item_id=i)
+    finally:
+        FastAPICache._warmer = None  # pyright: ignore[reportPrivateUsage]
+
+    path = tmp_path / "warmup.json"
+    assert warmer.dump(path) == 2
+
+    restarted = Warmer()
+    assert restarted.load(path) == 2
+    await FastAPICache.clear(namespace="warmup")
+    calls.clear()
+    assert await restarted.warm() == 2
+    assert calls == [1, 2]
+
+
+async def test_warm_errors_are_logged() -> None:
+    @cache(namespace="warmup")
+    async def failing(**_: Any) -> int:
+        raise ValueError
+
+    warmer = Warmer()
+    warmer.add(failing)
+    assert await warmer.warm() == 0
+
+
+def test_add_requires_cached_function() -> None:
+    async def plain(item_id: int) -> int:
+        return item_id
+
+    with pytest.raises(TypeError, match="isn't decorated"):
+        Warmer().add(plain)
+
+
+async def test_record_skips_injected_values() -> None:
+    app = FastAPI()
+
+    def session() -> object:
+        return object()
+
+    @app.get("/items/{item_id}")
+    @cache(namespace="warmup", expire=60)
+    async def item(item_id: int, db: Annotated[object, Depends(session)]) -> int:
+        return item_id
+
+    @app.get("/users/{user_id}")
+    @cache(namespace="warmup", expire=60)
+    async def user(user_id: int, request: Request) -> int:
+        return user_id
+
+    await FastAPICache.clear(namespace="warmup")
+    warmer = Warmer(record=10)
+    FastAPICache._warmer = warmer  # pyright: ignore[reportPrivateUsage]
+    try:
+        async with AsyncClient(transport=ASGITransport(app), base_url="http://localhost") as client:
+            await client.get("/items/1")
+            await client.get("/users/1")
+            await warmed(item_id=1)
+    finally:
+        FastAPICache._warmer = None  # pyright: ignore[reportPrivateUsage]
+
+    # only the call without injected values is kept
+    assert [func for func, _, _ in warmer._calls()] == [warmed]